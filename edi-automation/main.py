@@ -8,6 +8,7 @@ import yaml
 import argparse
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 from dotenv import load_dotenv
 
 # 프로젝트 루트를 sys.path에 추가
@@ -22,6 +23,7 @@ from src.automation.claim_download import ClaimDownloader
 from src.automation.claim_upload import ClaimUploader
 from src.automation.report import ReportGenerator
 from src.automation.backup import DataBackup
+from src.automation.session_pool import SessionPool, SessionUnavailableError
 from src.scheduler.backup_scheduler import BackupScheduler
 from loguru import logger
 
@@ -38,6 +40,27 @@ def load_config(config_path: str = "config/config.yaml") -> dict:
         return {}
 
 
+def wait_budgets_from_config(config: dict) -> dict:
+    """
+    설정의 단계별 대기 예산을 모읍니다.
+    selenium.wait_budgets가 우선이고, 기존 login.login_timeout / selenium.page_load_timeout도 반영합니다.
+
+    Args:
+        config: 설정 딕셔너리
+
+    Returns:
+        dict: 단계 이름 → 대기 시간 (초)
+    """
+    selenium_config = config.get("selenium", {})
+    budgets = {}
+    if config.get("login", {}).get("login_timeout"):
+        budgets["login"] = config["login"]["login_timeout"]
+    if selenium_config.get("page_load_timeout"):
+        budgets["page_load"] = selenium_config["page_load_timeout"]
+    budgets.update(selenium_config.get("wait_budgets") or {})
+    return budgets
+
+
 def test_login(config: dict):
     """로그인 테스트"""
     logger.info("=" * 60)
@@ -54,7 +77,8 @@ def test_login(config: dict):
     # Selenium 초기화
     selenium_helper = SeleniumHelper(
         headless=config.get("selenium", {}).get("headless", False),
-        download_dir=config.get("download", {}).get("directory", "data/downloads")
+        download_dir=config.get("download", {}).get("directory", "data/downloads"),
+        wait_budgets=wait_budgets_from_config(config)
     )
     selenium_helper.initialize_driver()
 
@@ -74,176 +98,191 @@ def test_login(config: dict):
         selenium_helper.close()
 
 
-def download_claims(config: dict, args):
+def create_session_pool(
+    config: dict,
+    headless: bool = False,
+    wait_manual: bool = True,
+    size: Optional[int] = None
+) -> SessionPool:
+    """
+    설정 기반 세션 풀을 생성합니다.
+
+    Args:
+        config: 설정 딕셔너리
+        headless: selenium.headless 설정이 없을 때의 기본값
+        wait_manual: 로그인 시 수동 개입을 기다릴지 여부
+        size: 최소 세션 수 (session_pool.size보다 크면 이 값 사용)
+
+    Returns:
+        SessionPool: 세션 풀 (세션은 처음 대여할 때 생성)
+    """
+    pool_config = config.get("session_pool", {})
+    return SessionPool(
+        size=max(pool_config.get("size", 1), size or 1),
+        cert_password=os.getenv("CERT_PASSWORD") or config.get("login", {}).get("cert_password"),
+        headless=config.get("selenium", {}).get("headless", headless),
+        download_dir=config.get("download", {}).get("directory", "data/downloads"),
+        wait_manual=wait_manual,
+        max_session_age=pool_config.get("max_session_age") or None,
+        revalidate_after=pool_config.get("revalidate_after", 300),
+        wait_budgets=wait_budgets_from_config(config)
+    )
+
+
+def download_claims(config: dict, args, pool: Optional[SessionPool] = None):
     """청구 데이터 다운로드"""
     logger.info("=" * 60)
     logger.info("청구 데이터 다운로드 시작")
     logger.info("=" * 60)
 
-    cert_password = os.getenv("CERT_PASSWORD") or config.get("login", {}).get("cert_password")
-
-    selenium_helper = SeleniumHelper(
-        headless=config.get("selenium", {}).get("headless", False),
-        download_dir=config.get("download", {}).get("directory", "data/downloads")
-    )
-    selenium_helper.initialize_driver()
+    owns_pool = pool is None
+    pool = pool or create_session_pool(config)
 
     try:
-        # 로그인
-        edi_login = EDILogin(selenium_helper)
-        if not edi_login.login(cert_password, wait_manual=True):
-            logger.error("로그인 실패")
-            return
+        with pool.session() as session:
+            # 청구 데이터 다운로드
+            downloader = ClaimDownloader(
+                session.selenium,
+                config.get("download", {}).get("directory", "data/downloads")
+            )
 
-        # 청구 데이터 다운로드
-        downloader = ClaimDownloader(
-            selenium_helper,
-            config.get("download", {}).get("directory", "data/downloads")
-        )
+            if args.month:
+                # 월별 다운로드
+                year, month = map(int, args.month.split("-"))
+                success = downloader.download_monthly_claims(year, month)
+            else:
+                # 기간별 다운로드
+                success = downloader.download_claim_data(args.start_date, args.end_date)
 
-        if args.month:
-            # 월별 다운로드
-            year, month = map(int, args.month.split("-"))
-            downloader.download_monthly_claims(year, month)
-        else:
-            # 기간별 다운로드
-            downloader.download_claim_data(args.start_date, args.end_date)
+            if not success:
+                session.mark_suspect()
 
-        # 로그아웃
-        edi_login.logout()
+    except SessionUnavailableError as e:
+        logger.error(f"로그인 실패: {e}")
 
     finally:
-        selenium_helper.close()
+        if owns_pool:
+            pool.close()
 
 
-def upload_claims(config: dict, args):
+def upload_claims(config: dict, args, pool: Optional[SessionPool] = None):
     """청구 데이터 업로드"""
     logger.info("=" * 60)
     logger.info("청구 데이터 업로드 시작")
     logger.info("=" * 60)
 
-    cert_password = os.getenv("CERT_PASSWORD") or config.get("login", {}).get("cert_password")
+    upload_config = config.get("upload", {})
+    validate = upload_config.get("validate_before_upload", True)
+    max_retries = upload_config.get("max_retries", 1)
+    workers = args.workers or upload_config.get("max_workers", 1)
 
-    selenium_helper = SeleniumHelper(
-        headless=config.get("selenium", {}).get("headless", False)
-    )
-    selenium_helper.initialize_driver()
+    owns_pool = pool is None
+    pool = pool or create_session_pool(config, size=workers if args.directory else None)
 
     try:
-        # 로그인
-        edi_login = EDILogin(selenium_helper)
-        if not edi_login.login(cert_password, wait_manual=True):
-            logger.error("로그인 실패")
-            return
-
-        # 청구 데이터 업로드
-        uploader = ClaimUploader(selenium_helper)
-
-        if args.file:
-            # 단일 파일 업로드
-            uploader.upload_claim_file(
-                args.file,
-                validate=config.get("upload", {}).get("validate_before_upload", True)
-            )
-        elif args.directory:
-            # 디렉토리 내 모든 파일 업로드
-            upload_dir = Path(args.directory)
-            files = list(upload_dir.glob("*.*"))
-            uploader.upload_multiple_files(
+        if args.directory and workers > 1:
+            # 디렉토리 내 모든 파일을 여러 세션으로 동시 업로드
+            files = sorted(Path(args.directory).glob("*.*"))
+            ClaimUploader.upload_files_concurrently(
+                pool,
                 [str(f) for f in files],
-                validate=config.get("upload", {}).get("validate_before_upload", True)
+                validate=validate,
+                max_workers=workers,
+                max_retries=max_retries
             )
+            return
 
-        # 로그아웃
-        edi_login.logout()
+        with pool.session() as session:
+            # 청구 데이터 업로드
+            uploader = ClaimUploader(session.selenium)
+
+            if args.file:
+                # 단일 파일 업로드
+                uploader.upload_claim_file(args.file, validate=validate)
+            elif args.directory:
+                # 디렉토리 내 모든 파일 업로드
+                upload_dir = Path(args.directory)
+                files = sorted(upload_dir.glob("*.*"))
+                uploader.upload_multiple_files(
+                    [str(f) for f in files],
+                    validate=validate,
+                    max_retries=max_retries
+                )
+
+    except SessionUnavailableError as e:
+        logger.error(f"로그인 실패: {e}")
 
     finally:
-        selenium_helper.close()
+        if owns_pool:
+            pool.close()
 
 
-def generate_reports(config: dict, args):
+def generate_reports(config: dict, args, pool: Optional[SessionPool] = None):
     """보고서 생성"""
     logger.info("=" * 60)
     logger.info("보고서 생성 시작")
     logger.info("=" * 60)
 
-    cert_password = os.getenv("CERT_PASSWORD") or config.get("login", {}).get("cert_password")
-
-    selenium_helper = SeleniumHelper(
-        headless=config.get("selenium", {}).get("headless", False),
-        download_dir=config.get("download", {}).get("directory", "data/downloads")
-    )
-    selenium_helper.initialize_driver()
+    owns_pool = pool is None
+    pool = pool or create_session_pool(config)
 
     try:
-        # 로그인
-        edi_login = EDILogin(selenium_helper)
-        if not edi_login.login(cert_password, wait_manual=True):
-            logger.error("로그인 실패")
-            return
-
-        # 보고서 생성
-        report_gen = ReportGenerator(
-            selenium_helper,
-            config.get("download", {}).get("directory", "data/downloads")
-        )
-
-        if args.month:
-            # 월별 보고서
-            year, month = map(int, args.month.split("-"))
-            report_types = args.types or config.get("backup", {}).get("report_types", [])
-            report_gen.generate_monthly_reports(year, month, report_types)
-        else:
-            # 단일 보고서
-            report_gen.create_and_download_report(
-                args.type,
-                args.start_date,
-                args.end_date
+        with pool.session() as session:
+            # 보고서 생성
+            report_gen = ReportGenerator(
+                session.selenium,
+                config.get("download", {}).get("directory", "data/downloads")
             )
 
-        # 로그아웃
-        edi_login.logout()
+            if args.month:
+                # 월별 보고서
+                year, month = map(int, args.month.split("-"))
+                report_types = args.types or config.get("backup", {}).get("report_types", [])
+                report_gen.generate_monthly_reports(year, month, report_types)
+            else:
+                # 단일 보고서
+                report_gen.create_and_download_report(
+                    args.type,
+                    args.start_date,
+                    args.end_date
+                )
+
+    except SessionUnavailableError as e:
+        logger.error(f"로그인 실패: {e}")
 
     finally:
-        selenium_helper.close()
+        if owns_pool:
+            pool.close()
 
 
-def run_backup(config: dict, args):
+def run_backup(config: dict, args, pool: Optional[SessionPool] = None):
     """백업 실행"""
     logger.info("=" * 60)
     logger.info("백업 시작")
     logger.info("=" * 60)
 
-    cert_password = os.getenv("CERT_PASSWORD") or config.get("login", {}).get("cert_password")
-
-    selenium_helper = SeleniumHelper(
-        headless=config.get("selenium", {}).get("headless", True),
-        download_dir=config.get("download", {}).get("directory", "data/downloads")
-    )
-    selenium_helper.initialize_driver()
+    owns_pool = pool is None
+    pool = pool or create_session_pool(config, headless=True, wait_manual=False)
 
     try:
-        # 로그인
-        edi_login = EDILogin(selenium_helper)
-        if not edi_login.login(cert_password, wait_manual=False):
-            logger.error("로그인 실패")
-            return
-
-        # 백업 실행
-        backup = DataBackup(selenium_helper)
-        report_types = config.get("backup", {}).get("report_types", [])
+        with pool.session() as session:
+            # 백업 실행
+            backup = DataBackup(session.selenium)
+            report_types = config.get("backup", {}).get("report_types", [])
 
-        backup.full_backup(
-            start_date=args.start_date,
-            end_date=args.end_date,
-            report_types=report_types
-        )
+            if not backup.full_backup(
+                start_date=args.start_date,
+                end_date=args.end_date,
+                report_types=report_types
+            ):
+                session.mark_suspect()
 
-        # 로그아웃
-        edi_login.logout()
+    except SessionUnavailableError as e:
+        logger.error(f"로그인 실패: {e}")
 
     finally:
-        selenium_helper.close()
+        if owns_pool:
+            pool.close()
 
 
 def run_scheduler(config: dict):
@@ -256,7 +295,8 @@ def run_scheduler(config: dict):
 
     scheduler = BackupScheduler(
         cert_password=cert_password,
-        headless=config.get("selenium", {}).get("headless", True)
+        headless=config.get("selenium", {}).get("headless", True),
+        session_pool=create_session_pool(config, headless=True, wait_manual=False)
     )
 
     # 설정에 따라 스케줄 등록
@@ -327,6 +367,7 @@ def main():
     upload_parser = subparsers.add_parser("upload", help="청구 데이터 업로드")
     upload_parser.add_argument("--file", help="업로드할 파일")
     upload_parser.add_argument("--directory", help="업로드할 파일들이 있는 디렉토리")
+    upload_parser.add_argument("--workers", type=int, help="동시 업로드 세션 수 (기본값: upload.max_workers)")
 
     # 보고서 생성
     report_parser = subparsers.add_parser("report", help="보고서 생성")
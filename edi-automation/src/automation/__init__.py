@@ -5,11 +5,15 @@ from .claim_download import ClaimDownloader
 from .claim_upload import ClaimUploader
 from .report import ReportGenerator
 from .backup import DataBackup
+from .session_pool import EDISession, SessionPool, SessionUnavailableError
 
 __all__ = [
     'EDILogin',
     'ClaimDownloader',
     'ClaimUploader',
     'ReportGenerator',
-    'DataBackup'
+    'DataBackup',
+    'EDISession',
+    'SessionPool',
+    'SessionUnavailableError'
 ]
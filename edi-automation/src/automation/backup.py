@@ -31,8 +31,8 @@ class DataBackup:
         self.backup_base_dir = Path(backup_base_dir)
         self.backup_base_dir.mkdir(parents=True, exist_ok=True)
 
-        # 다운로드 디렉토리
-        self.download_dir = Path("data/downloads")
+        # 다운로드 디렉토리 (브라우저 설정이 있으면 그쪽)
+        self.download_dir = Path(selenium_helper.download_dir or "data/downloads")
         self.download_dir.mkdir(parents=True, exist_ok=True)
 
         # 다운로더 및 리포트 생성기 초기화
@@ -81,16 +81,8 @@ class DataBackup:
 
             # 청구 데이터 다운로드
             if self.claim_downloader.download_claim_data(start_date, end_date):
-                # 다운로드된 파일들을 백업 폴더로 이동
-                downloaded_files = self.claim_downloader.get_downloaded_files()
-
-                for file_path in downloaded_files[:10]:  # 최근 10개 파일
-                    try:
-                        dest = backup_folder / file_path.name
-                        shutil.copy2(file_path, dest)
-                        logger.info(f"파일 백업: {file_path.name}")
-                    except Exception as e:
-                        logger.error(f"파일 백업 실패: {file_path.name}, 오류: {e}")
+                # 이번 다운로드로 받은 파일만 백업 폴더로 복사
+                self._copy_to_backup(self.claim_downloader.last_downloaded, backup_folder, "파일")
 
                 logger.info(f"청구 데이터 백업 완료: {backup_folder}")
                 return True
@@ -133,17 +125,8 @@ class DataBackup:
                     report_type, start_date, end_date
                 ):
                     success_count += 1
-
-            # 다운로드된 파일들을 백업 폴더로 이동
-            downloaded_files = self.claim_downloader.get_downloaded_files()
-
-            for file_path in downloaded_files[:len(report_types)]:
-                try:
-                    dest = backup_folder / file_path.name
-                    shutil.copy2(file_path, dest)
-                    logger.info(f"보고서 백업: {file_path.name}")
-                except Exception as e:
-                    logger.error(f"보고서 백업 실패: {file_path.name}, 오류: {e}")
+                    # 이 보고서로 받은 파일만 백업 폴더로 복사
+                    self._copy_to_backup(self.report_generator.last_downloaded, backup_folder, "보고서")
 
             logger.info(f"보고서 백업 완료: {success_count}/{len(report_types)} 성공")
             return success_count > 0
@@ -152,6 +135,23 @@ class DataBackup:
             logger.error(f"보고서 백업 중 오류 발생: {e}")
             return False
 
+    def _copy_to_backup(self, files: List[Path], backup_folder: Path, kind: str):
+        """
+        다운로드된 파일을 백업 폴더로 복사합니다.
+
+        Args:
+            files: 복사할 파일 목록
+            backup_folder: 백업 폴더
+            kind: 로그용 파일 종류
+        """
+        for file_path in files:
+            try:
+                dest = backup_folder / file_path.name
+                shutil.copy2(file_path, dest)
+                logger.info(f"{kind} 백업: {file_path.name}")
+            except Exception as e:
+                logger.error(f"{kind} 백업 실패: {file_path.name}, 오류: {e}")
+
     def full_backup(
         self,
         start_date: Optional[str] = None,
@@ -2,16 +2,14 @@
 청구 데이터 조회 및 다운로드 모듈
 """
 
-import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Optional, List
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from loguru import logger
 
 from ..utils.selenium_helper import SeleniumHelper
+from ..utils.download_tracker import DownloadTracker
 
 
 class ClaimDownloader:
@@ -21,12 +19,18 @@ class ClaimDownloader:
         """
         Args:
             selenium_helper: Selenium 헬퍼 인스턴스
-            download_dir: 다운로드 디렉토리
+            download_dir: 다운로드 디렉토리 (Selenium 헬퍼에 다운로드 디렉토리가 있으면 그쪽 사용)
         """
         self.selenium = selenium_helper
         self.driver = selenium_helper.driver
-        self.download_dir = Path(download_dir)
+        # 브라우저가 실제로 저장하는 디렉토리 (세션 풀은 세션별 하위 폴더를 지정함)
+        self.download_dir = Path(selenium_helper.download_dir or download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
+        self.downloads = DownloadTracker.for_directory(str(self.download_dir))
+
+        # 이 다운로더가 받은 파일 (마지막 다운로드 / 전체)
+        self.last_downloaded: List[Path] = []
+        self.downloaded_files: List[Path] = []
 
     def navigate_to_claim_inquiry(self) -> bool:
         """
@@ -45,17 +49,10 @@ class ClaimDownloader:
                 (By.LINK_TEXT, "청구관리"),
             ]
 
-            for by, selector in menu_selectors:
-                try:
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    element.click()
-                    logger.info("청구 조회 메뉴 클릭 성공")
-                    time.sleep(2)
-                    return True
-                except:
-                    continue
+            if self.selenium.click_first(menu_selectors, step="menu") is not None:
+                logger.info("청구 조회 메뉴 클릭 성공")
+                self.selenium.wait_for_page_ready()
+                return True
 
             logger.warning("청구 조회 메뉴를 찾을 수 없습니다.")
             return False
@@ -85,9 +82,8 @@ class ClaimDownloader:
                 (By.XPATH, "//input[contains(@placeholder, '시작일')]"),
             ]
 
-            for by, selector in start_date_selectors:
-                if self.selenium.safe_send_keys(by, selector, start_date.replace("-", ""), timeout=5):
-                    break
+            if not self.selenium.send_keys_first(start_date_selectors, start_date.replace("-", "")):
+                logger.warning("시작일 입력 필드를 찾을 수 없습니다.")
 
             # 종료일 입력
             end_date_selectors = [
@@ -96,9 +92,8 @@ class ClaimDownloader:
                 (By.XPATH, "//input[contains(@placeholder, '종료일')]"),
             ]
 
-            for by, selector in end_date_selectors:
-                if self.selenium.safe_send_keys(by, selector, end_date.replace("-", ""), timeout=5):
-                    break
+            if not self.selenium.send_keys_first(end_date_selectors, end_date.replace("-", "")):
+                logger.warning("종료일 입력 필드를 찾을 수 없습니다.")
 
             logger.info("조회 기간 설정 완료")
             return True
@@ -123,11 +118,11 @@ class ClaimDownloader:
                 (By.CLASS_NAME, "btn-search"),
             ]
 
-            for by, selector in search_selectors:
-                if self.selenium.safe_click(by, selector, timeout=5):
-                    logger.info("조회 버튼 클릭 성공")
-                    time.sleep(3)  # 검색 결과 로딩 대기
-                    return True
+            if self.selenium.click_first(search_selectors, step="menu") is not None:
+                logger.info("조회 버튼 클릭 성공")
+                # 검색 결과는 download_results에서 다운로드 버튼이 나타날 때까지 대기
+                self.selenium.wait_for_page_ready()
+                return True
 
             logger.warning("조회 버튼을 찾을 수 없습니다.")
             return False
@@ -149,7 +144,7 @@ class ClaimDownloader:
         try:
             logger.info(f"{file_format} 형식으로 다운로드 시작...")
 
-            # 다운로드 버튼 찾기
+            # 다운로드 버튼 찾기 (후보를 한 번에 확인 - 조회 결과 표시 대기 포함)
             download_selectors = [
                 (By.XPATH, f"//button[contains(text(), '{file_format}')]"),
                 (By.XPATH, f"//button[contains(text(), '엑셀')]"),
@@ -158,17 +153,16 @@ class ClaimDownloader:
                 (By.CLASS_NAME, "btn-download"),
             ]
 
-            for by, selector in download_selectors:
-                try:
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    element.click()
+            self.last_downloaded = []
+            with self.downloads.begin(f"청구 데이터 {file_format}") as job:
+                if self.selenium.click_first(download_selectors, step="result") is not None:
                     logger.info("다운로드 버튼 클릭 성공")
-                    time.sleep(5)  # 다운로드 완료 대기
+                    self.last_downloaded = job.wait(self.selenium.budget("download"))
+                    self.downloaded_files.extend(self.last_downloaded)
+                    if not self.last_downloaded:
+                        logger.warning("다운로드된 파일을 확인하지 못했습니다.")
+                        return False
                     return True
-                except:
-                    continue
 
             logger.warning("다운로드 버튼을 찾을 수 없습니다.")
             return False
@@ -259,18 +253,10 @@ class ClaimDownloader:
 
     def get_downloaded_files(self) -> List[Path]:
         """
-        다운로드된 파일 목록을 반환합니다.
+        이 다운로더가 다운로드한 파일 목록을 반환합니다 (최근 순).
+        디렉토리에 원래 있던 파일이나 다른 작업이 받은 파일은 포함하지 않습니다.
 
         Returns:
             List[Path]: 다운로드된 파일 경로 목록
         """
-        try:
-            files = sorted(
-                self.download_dir.glob("*"),
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )
-            return files
-        except Exception as e:
-            logger.error(f"다운로드 파일 목록 조회 실패: {e}")
-            return []
+        return [f for f in reversed(self.downloaded_files) if f.exists()]
@@ -2,15 +2,23 @@
 청구 데이터 업로드 모듈
 """
 
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from queue import Empty, Queue
+from typing import Dict, Optional, List, Tuple
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from loguru import logger
 
 from ..utils.selenium_helper import SeleniumHelper
+from ..utils.waits import PRESENT, VISIBLE
+from .session_pool import SessionPool, SessionUnavailableError
+
+
+# 재시도하면 안 되는 실패
+# - missing_file, validation: 재시도해도 결과가 같음
+# - submitted: 제출 버튼을 누른 뒤 실패 (이미 접수되었을 수 있어 재시도 시 중복 제출 위험)
+PERMANENT_FAILURES = {"missing_file", "validation", "submitted"}
 
 
 class ClaimUploader:
@@ -23,6 +31,8 @@ class ClaimUploader:
         """
         self.selenium = selenium_helper
         self.driver = selenium_helper.driver
+        self.last_failure: Optional[str] = None  # 마지막 업로드 실패 단계
+        self.submit_clicked = False  # 제출 버튼을 눌렀는지 (눌렀을 수 있으면 True)
 
     def navigate_to_claim_upload(self) -> bool:
         """
@@ -40,17 +50,10 @@ class ClaimUploader:
                 (By.LINK_TEXT, "접수등록"),
             ]
 
-            for by, selector in menu_selectors:
-                try:
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    element.click()
-                    logger.info("청구 업로드 메뉴 클릭 성공")
-                    time.sleep(2)
-                    return True
-                except:
-                    continue
+            if self.selenium.click_first(menu_selectors, step="menu") is not None:
+                logger.info("청구 업로드 메뉴 클릭 성공")
+                self.selenium.wait_for_page_ready()
+                return True
 
             logger.warning("청구 업로드 메뉴를 찾을 수 없습니다.")
             return False
@@ -84,19 +87,15 @@ class ClaimUploader:
                 (By.NAME, "uploadFile"),
             ]
 
-            for by, selector in file_input_selectors:
-                try:
-                    file_input = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((by, selector))
-                    )
-                    # 파일 경로를 절대 경로로 변환
-                    abs_path = str(file_path.absolute())
-                    file_input.send_keys(abs_path)
-                    logger.info("파일 선택 완료")
-                    time.sleep(2)
-                    return True
-                except:
-                    continue
+            # 파일 입력 필드는 숨겨져 있는 경우가 많아 DOM 존재만 확인
+            found = self.selenium.find_first(file_input_selectors, PRESENT, step="input")
+            if found:
+                # 파일 경로를 절대 경로로 변환
+                abs_path = str(file_path.absolute())
+                found[1].send_keys(abs_path)
+                logger.info("파일 선택 완료")
+                self.selenium.wait_for_page_ready()
+                return True
 
             logger.warning("파일 입력 필드를 찾을 수 없습니다.")
             return False
@@ -121,50 +120,35 @@ class ClaimUploader:
                 (By.CLASS_NAME, "btn-validate"),
             ]
 
-            for by, selector in validate_selectors:
-                try:
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    element.click()
-                    logger.info("검증 버튼 클릭")
-                    time.sleep(5)  # 검증 완료 대기
-
-                    # 검증 결과 확인
-                    success_indicators = [
-                        (By.XPATH, "//*[contains(text(), '검증 성공')]"),
-                        (By.XPATH, "//*[contains(text(), '오류 없음')]"),
-                        (By.CLASS_NAME, "validation-success"),
-                    ]
-
-                    for success_by, success_selector in success_indicators:
-                        try:
-                            self.driver.find_element(success_by, success_selector)
-                            logger.info("파일 검증 성공")
-                            return True
-                        except:
-                            pass
-
-                    # 오류 확인
-                    error_indicators = [
-                        (By.XPATH, "//*[contains(text(), '검증 실패')]"),
-                        (By.XPATH, "//*[contains(text(), '오류')]"),
-                        (By.CLASS_NAME, "validation-error"),
-                    ]
-
-                    for error_by, error_selector in error_indicators:
-                        try:
-                            error_elem = self.driver.find_element(error_by, error_selector)
-                            logger.error(f"검증 오류: {error_elem.text}")
-                            return False
-                        except:
-                            pass
-
+            if self.selenium.click_first(validate_selectors, step="menu") is not None:
+                logger.info("검증 버튼 클릭")
+
+                success_indicators = [
+                    (By.XPATH, "//*[contains(text(), '검증 성공')]"),
+                    (By.XPATH, "//*[contains(text(), '오류 없음')]"),
+                    (By.CLASS_NAME, "validation-success"),
+                ]
+                error_indicators = [
+                    (By.XPATH, "//*[contains(text(), '검증 실패')]"),
+                    (By.XPATH, "//*[contains(text(), '오류')]"),
+                    (By.CLASS_NAME, "validation-error"),
+                ]
+
+                # 성공/오류 표시를 한 폴링 루프에서 함께 확인 (성공 표시 우선)
+                found = self.selenium.find_first(
+                    success_indicators + error_indicators, VISIBLE, step="result"
+                )
+                if found is None:
                     logger.warning("검증 결과를 확인할 수 없습니다.")
                     return True  # 일단 계속 진행
 
-                except:
-                    continue
+                index, element = found
+                if index < len(success_indicators):
+                    logger.info("파일 검증 성공")
+                    return True
+
+                logger.error(f"검증 오류: {element.text}")
+                return False
 
             logger.info("검증 버튼이 없어 검증 단계를 건너뜁니다.")
             return True
@@ -190,30 +174,24 @@ class ClaimUploader:
                 (By.CLASS_NAME, "btn-submit"),
             ]
 
-            for by, selector in submit_selectors:
-                try:
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    element.click()
-                    logger.info("제출 버튼 클릭")
-                    time.sleep(3)
-
-                    # 확인 대화상자 처리
+            # 클릭 도중 예외가 나도 제출되었을 수 있으므로 클릭 전에 표시
+            self.submit_clicked = True
+            if self.selenium.click_first(submit_selectors, step="menu") is not None:
+                logger.info("제출 버튼 클릭")
+
+                # 확인 대화상자 처리 (뜨는 즉시 수락)
+                alert = self.selenium.wait_for_alert()
+                if alert:
                     try:
-                        alert = self.driver.switch_to.alert
-                        alert_text = alert.text
-                        logger.info(f"알림 메시지: {alert_text}")
+                        logger.info(f"알림 메시지: {alert.text}")
                         alert.accept()
                     except:
                         pass
 
-                    logger.info("업로드 제출 완료")
-                    return True
-
-                except:
-                    continue
+                logger.info("업로드 제출 완료")
+                return True
 
+            self.submit_clicked = False
             logger.warning("제출 버튼을 찾을 수 없습니다.")
             return False
 
@@ -224,6 +202,8 @@ class ClaimUploader:
     def upload_claim_file(self, file_path: str, validate: bool = True) -> bool:
         """
         청구 파일을 업로드합니다.
+        실패하면 실패 단계를 last_failure에 남깁니다 (재시도 여부 판단용).
+        제출 버튼을 누른 뒤의 실패는 "submitted"로 남겨 재시도하지 않도록 합니다.
 
         Args:
             file_path: 업로드할 파일 경로
@@ -232,25 +212,36 @@ class ClaimUploader:
         Returns:
             bool: 성공 여부
         """
+        self.last_failure = None
+        self.submit_clicked = False
         try:
             logger.info(f"청구 파일 업로드 시작: {file_path}")
 
+            if not Path(file_path).exists():
+                logger.error(f"파일을 찾을 수 없습니다: {file_path}")
+                self.last_failure = "missing_file"
+                return False
+
             # 1. 청구 업로드 메뉴로 이동
             if not self.navigate_to_claim_upload():
+                self.last_failure = "navigate"
                 return False
 
             # 2. 파일 선택
             if not self.select_file(file_path):
+                self.last_failure = "select"
                 return False
 
             # 3. 파일 검증 (옵션)
             if validate:
                 if not self.validate_file():
                     logger.error("파일 검증 실패로 업로드를 중단합니다.")
+                    self.last_failure = "validation"
                     return False
 
             # 4. 업로드 제출
             if not self.submit_upload():
+                self.last_failure = "submitted" if self.submit_clicked else "submit"
                 return False
 
             logger.info("청구 파일 업로드 완료!")
@@ -258,16 +249,24 @@ class ClaimUploader:
 
         except Exception as e:
             logger.error(f"청구 파일 업로드 중 오류 발생: {e}")
-            self.selenium.take_screenshot("logs/claim_upload_error.png")
+            self.last_failure = "submitted" if self.submit_clicked else "exception"
+            self.selenium.take_screenshot(f"logs/claim_upload_error_{Path(file_path).stem}.png")
             return False
 
-    def upload_multiple_files(self, file_paths: List[str], validate: bool = True) -> dict:
+    def upload_multiple_files(
+        self,
+        file_paths: List[str],
+        validate: bool = True,
+        max_retries: int = 1
+    ) -> dict:
         """
         여러 청구 파일을 순차적으로 업로드합니다.
+        메뉴 이동/파일 선택 실패 등 제출 전의 일시적인 실패만 max_retries번까지 다시 시도합니다.
 
         Args:
             file_paths: 업로드할 파일 경로 목록
             validate: 검증 수행 여부
+            max_retries: 파일당 재시도 횟수
 
         Returns:
             dict: 각 파일의 업로드 결과
@@ -275,16 +274,155 @@ class ClaimUploader:
         results = {}
 
         for file_path in file_paths:
-            try:
-                logger.info(f"파일 업로드 중 ({len(results)+1}/{len(file_paths)}): {file_path}")
-                success = self.upload_claim_file(file_path, validate)
-                results[file_path] = "성공" if success else "실패"
-            except Exception as e:
-                logger.error(f"파일 업로드 실패: {file_path}, 오류: {e}")
-                results[file_path] = f"오류: {str(e)}"
+            logger.info(f"파일 업로드 중 ({len(results)+1}/{len(file_paths)}): {file_path}")
+            for attempt in range(max_retries + 1):
+                try:
+                    success = self.upload_claim_file(file_path, validate)
+                    results[file_path] = "성공" if success else "실패"
+                except Exception as e:
+                    logger.error(f"파일 업로드 실패: {file_path}, 오류: {e}")
+                    results[file_path] = f"오류: {str(e)}"
+                    self.last_failure = "submitted" if self.submit_clicked else "exception"
+
+                if results[file_path] == "성공" or not self._is_transient_failure():
+                    break
+                if attempt < max_retries:
+                    logger.warning(f"일시적 실패 ({self.last_failure}) → 재시도 {attempt+1}/{max_retries}: {file_path}")
 
         # 결과 요약
         success_count = sum(1 for v in results.values() if v == "성공")
         logger.info(f"업로드 완료: 성공 {success_count}/{len(file_paths)}")
 
         return results
+
+    def _is_transient_failure(self) -> bool:
+        """마지막 실패가 다시 시도할 만한 실패인지 (파일 없음/검증 실패/제출 후 실패는 재시도 안 함)"""
+        return self.last_failure not in PERMANENT_FAILURES
+
+    @staticmethod
+    def upload_files_concurrently(
+        pool: SessionPool,
+        file_paths: List[str],
+        validate: bool = True,
+        max_workers: Optional[int] = None,
+        max_retries: int = 1,
+        session_timeout: Optional[float] = None
+    ) -> dict:
+        """
+        여러 청구 파일을 로그인된 세션 여러 개로 나눠 동시에 업로드합니다.
+
+        작업 스레드마다 풀에서 세션을 빌려 공유 대기열의 파일을 하나씩 가져가 업로드합니다
+        (먼저 끝난 세션이 다음 파일을 가져가므로 파일 크기가 달라도 고르게 분배됨).
+        제출 버튼을 누르기 전의 일시적인 실패만 세션을 반납하고 다시 빌려서
+        (로그인 상태 확인 / 죽은 드라이버 교체) max_retries번까지 다시 시도합니다.
+        세션을 빌릴 수 없는 (로그인 실패) 작업 스레드는 종료하고, 모든 스레드가 종료된 뒤에도
+        남은 파일은 실패로 처리합니다.
+
+        Args:
+            pool: 로그인 세션 풀 (동시 작업 수는 풀 크기 이하)
+            file_paths: 업로드할 파일 경로 목록
+            validate: 검증 수행 여부
+            max_workers: 동시 작업 수 (기본값: 풀 크기)
+            max_retries: 파일당 재시도 횟수
+            session_timeout: 세션 대여 대기 최대 시간 (초)
+
+        Returns:
+            dict: 각 파일의 업로드 결과 (입력 순서)
+        """
+        if not file_paths:
+            return {}
+
+        workers = max(1, min(max_workers or pool.size, pool.size, len(file_paths)))
+        logger.info(f"동시 업로드 시작: 파일 {len(file_paths)}개, 세션 {workers}개")
+
+        pending: "Queue[Tuple[str, int]]" = Queue()
+        for file_path in file_paths:
+            pending.put((file_path, 0))
+
+        results: Dict[str, str] = {}
+        lock = threading.Lock()
+
+        def record(file_path: str, result: str):
+            with lock:
+                results[file_path] = result
+                done = len(results)
+            logger.info(f"[{done}/{len(file_paths)}] {Path(file_path).name}: {result}")
+
+        alive = [workers]                               # 실행 중인 작업 스레드 수
+        last_error: List[Optional[Exception]] = [None]  # 마지막 세션 대여 실패
+
+        def leave():
+            """
+            작업 스레드 종료. 마지막 스레드면 대기열에 남은 파일을 실패로 기록
+            (세션을 빌리지 못해 다른 스레드들이 모두 끝난 뒤 되돌려 놓은 파일).
+            """
+            with lock:
+                alive[0] -= 1
+                if alive[0] > 0:
+                    return
+                error = last_error[0] or "세션 없음"
+            while True:
+                try:
+                    remaining, _ = pending.get_nowait()
+                except Empty:
+                    return
+                record(remaining, f"오류: {error}")
+
+        def worker():
+            try:
+                run()
+            finally:
+                leave()
+
+        def run():
+            while True:
+                with lock:
+                    try:
+                        file_path, attempt = pending.get_nowait()
+                    except Empty:
+                        return
+
+                uploader: Optional[ClaimUploader] = None
+                success = False
+                try:
+                    with pool.session(timeout=session_timeout) as session:
+                        uploader = ClaimUploader(session.selenium)
+                        success = uploader.upload_claim_file(file_path, validate)
+                        if not success:
+                            # 다음 대여 때 페이지를 다시 불러와 로그인 상태 확인
+                            session.mark_suspect()
+                        transient = not success and uploader._is_transient_failure()
+                        result = "성공" if success else "실패"
+                        logger.debug(f"세션 {session.session_id}: {file_path} → {result}")
+                except SessionUnavailableError as e:
+                    # 이 스레드만 종료 (다른 스레드는 자기 세션으로 계속 처리)
+                    # 파일은 대기열에 되돌리고, 남은 스레드가 없으면 leave에서 실패 처리
+                    logger.error(f"세션을 사용할 수 없어 작업 스레드를 종료합니다: {e}")
+                    with lock:
+                        last_error[0] = e
+                        pending.put((file_path, attempt))
+                    return
+                except Exception as e:
+                    # 세션은 폐기됨 (pool.session) → 다시 빌리면 새 드라이버
+                    if success:
+                        # 업로드 후 세션 반납 중 오류 → 결과는 성공
+                        transient, result = False, "성공"
+                    else:
+                        # 제출 전에 실패한 경우만 재시도 (중복 제출 방지)
+                        transient = uploader is None or uploader._is_transient_failure()
+                        result = f"오류: {e}"
+
+                if transient and attempt < max_retries:
+                    logger.warning(f"일시적 실패 → 재시도 {attempt+1}/{max_retries}: {file_path}")
+                    pending.put((file_path, attempt + 1))
+                    continue
+                record(file_path, result)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="upload") as executor:
+            for future in [executor.submit(worker) for _ in range(workers)]:
+                future.result()
+
+        ordered = {file_path: results.get(file_path, "실패") for file_path in file_paths}
+        success_count = sum(1 for v in ordered.values() if v == "성공")
+        logger.info(f"동시 업로드 완료: 성공 {success_count}/{len(file_paths)}")
+        return ordered
@@ -2,14 +2,12 @@
 EDI 로그인 자동화 모듈
 """
 
-import time
 from typing import Optional
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from loguru import logger
 
 from ..utils.selenium_helper import SeleniumHelper
+from ..utils.waits import VISIBLE
 from ..auth.certificate_handler import CertificateHandler
 
 
@@ -33,7 +31,7 @@ class EDILogin:
         try:
             logger.info(f"EDI 사이트 접속: {self.EDI_URL}")
             self.driver.get(self.EDI_URL)
-            time.sleep(2)  # 페이지 로드 대기
+            self.selenium.wait_for_page_ready()
             return True
         except Exception as e:
             logger.error(f"EDI 사이트 접속 실패: {e}")
@@ -58,17 +56,9 @@ class EDILogin:
                 (By.CLASS_NAME, "cert-login"),
             ]
 
-            for by, selector in possible_selectors:
-                try:
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    element.click()
-                    logger.info("공동인증서 로그인 버튼 클릭 성공")
-                    time.sleep(2)
-                    return True
-                except:
-                    continue
+            if self.selenium.click_first(possible_selectors, step="menu") is not None:
+                logger.info("공동인증서 로그인 버튼 클릭 성공")
+                return True
 
             logger.warning("공동인증서 로그인 버튼을 찾을 수 없습니다.")
             return False
@@ -94,13 +84,16 @@ class EDILogin:
         try:
             logger.info("인증서 선택 창 처리 중...")
 
-            # AnySign 창이 팝업으로 뜨는 경우 처리
-            # 새 창으로 전환
-            time.sleep(3)  # 팝업 로드 대기
-
             # 현재 창 핸들 저장
             main_window = self.driver.current_window_handle
 
+            # AnySign 창이 팝업 창 또는 iframe으로 뜰 때까지 대기 (플러그인 자체 창이면 예산만큼)
+            self.selenium.wait_until(
+                lambda: len(self.driver.window_handles) > 1
+                or self.driver.find_elements(By.TAG_NAME, "iframe"),
+                step="popup"
+            )
+
             # 모든 창 핸들 가져오기
             all_windows = self.driver.window_handles
 
@@ -130,34 +123,18 @@ class EDILogin:
                     (By.XPATH, "//input[@type='password']"),
                 ]
 
-                for by, selector in password_selectors:
-                    try:
-                        password_input = WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_element_located((by, selector))
-                        )
-                        password_input.clear()
-                        password_input.send_keys(cert_password)
-                        logger.info("인증서 비밀번호 입력 완료")
-
-                        # 확인 버튼 클릭
-                        confirm_button_selectors = [
-                            (By.XPATH, "//button[contains(text(), '확인')]"),
-                            (By.XPATH, "//button[contains(text(), '로그인')]"),
-                            (By.ID, "confirmBtn"),
-                        ]
-
-                        for btn_by, btn_selector in confirm_button_selectors:
-                            try:
-                                confirm_btn = self.driver.find_element(btn_by, btn_selector)
-                                confirm_btn.click()
-                                logger.info("확인 버튼 클릭 완료")
-                                break
-                            except:
-                                continue
+                if self.selenium.send_keys_first(password_selectors, cert_password, step="input"):
+                    logger.info("인증서 비밀번호 입력 완료")
 
-                        break
-                    except:
-                        continue
+                    # 확인 버튼 클릭
+                    confirm_button_selectors = [
+                        (By.XPATH, "//button[contains(text(), '확인')]"),
+                        (By.XPATH, "//button[contains(text(), '로그인')]"),
+                        (By.ID, "confirmBtn"),
+                    ]
+
+                    if self.selenium.click_first(confirm_button_selectors, step="input") is not None:
+                        logger.info("확인 버튼 클릭 완료")
 
             # 메인 창으로 돌아가기
             self.driver.switch_to.window(main_window)
@@ -169,12 +146,12 @@ class EDILogin:
             logger.error(f"인증서 선택 처리 실패: {e}")
             return False
 
-    def wait_for_login_success(self, timeout: int = 30) -> bool:
+    def wait_for_login_success(self, timeout: Optional[float] = None) -> bool:
         """
         로그인 성공을 기다립니다.
 
         Args:
-            timeout: 최대 대기 시간 (초)
+            timeout: 최대 대기 시간 (초, 기본값: login 예산)
 
         Returns:
             bool: 로그인 성공 여부
@@ -190,20 +167,13 @@ class EDILogin:
                 (By.CLASS_NAME, "user-info"),
             ]
 
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                for by, selector in success_indicators:
-                    try:
-                        element = self.driver.find_element(by, selector)
-                        if element.is_displayed():
-                            logger.info("로그인 성공 확인!")
-                            return True
-                    except:
-                        pass
-
-                time.sleep(1)
+            if self.selenium.find_first(success_indicators, VISIBLE, step="login", timeout=timeout):
+                logger.info("로그인 성공 확인!")
+                return True
 
-            logger.warning(f"로그인 성공을 {timeout}초 내에 확인하지 못했습니다.")
+            if timeout is None:
+                timeout = self.selenium.budget("login")
+            logger.warning(f"로그인 성공을 {timeout:g}초 내에 확인하지 못했습니다.")
             return False
 
         except Exception as e:
@@ -240,9 +210,9 @@ class EDILogin:
                 logger.info("=" * 60)
 
             # 5. 로그인 성공 대기
-            if self.wait_for_login_success(timeout=60):
+            if self.wait_for_login_success():
                 logger.info("EDI 로그인 완료!")
-                time.sleep(2)  # 안정화 대기
+                self.selenium.wait_for_page_ready()
                 return True
             else:
                 logger.error("로그인 실패 또는 시간 초과")
@@ -253,10 +223,13 @@ class EDILogin:
             self.selenium.take_screenshot("logs/login_error.png")
             return False
 
-    def is_logged_in(self) -> bool:
+    def is_logged_in(self, timeout: float = 0) -> bool:
         """
         현재 로그인 상태를 확인합니다.
 
+        Args:
+            timeout: 로그아웃 링크가 나타나기를 기다릴 시간 (초, 기본값: 현재 화면만 확인)
+
         Returns:
             bool: 로그인 여부
         """
@@ -266,15 +239,7 @@ class EDILogin:
                 (By.ID, "logoutBtn"),
             ]
 
-            for by, selector in logout_indicators:
-                try:
-                    element = self.driver.find_element(by, selector)
-                    if element.is_displayed():
-                        return True
-                except:
-                    pass
-
-            return False
+            return self.selenium.find_first(logout_indicators, VISIBLE, timeout=timeout) is not None
 
         except:
             return False
@@ -297,15 +262,10 @@ class EDILogin:
                 (By.ID, "logoutBtn"),
             ]
 
-            for by, selector in logout_selectors:
-                try:
-                    element = self.driver.find_element(by, selector)
-                    element.click()
-                    logger.info("로그아웃 성공")
-                    time.sleep(2)
-                    return True
-                except:
-                    continue
+            if self.selenium.click_first(logout_selectors, step="menu") is not None:
+                logger.info("로그아웃 성공")
+                self.selenium.wait_for_page_ready()
+                return True
 
             logger.warning("로그아웃 버튼을 찾을 수 없습니다.")
             return False
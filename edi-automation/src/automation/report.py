@@ -2,16 +2,14 @@
 보고서 및 통계 조회 모듈
 """
 
-import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, List
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from loguru import logger
 
 from ..utils.selenium_helper import SeleniumHelper
+from ..utils.download_tracker import DownloadTracker
 
 
 class ReportGenerator:
@@ -21,12 +19,17 @@ class ReportGenerator:
         """
         Args:
             selenium_helper: Selenium 헬퍼 인스턴스
-            download_dir: 다운로드 디렉토리
+            download_dir: 다운로드 디렉토리 (Selenium 헬퍼에 다운로드 디렉토리가 있으면 그쪽 사용)
         """
         self.selenium = selenium_helper
         self.driver = selenium_helper.driver
-        self.download_dir = Path(download_dir)
+        # 브라우저가 실제로 저장하는 디렉토리 (세션 풀은 세션별 하위 폴더를 지정함)
+        self.download_dir = Path(selenium_helper.download_dir or download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
+        self.downloads = DownloadTracker.for_directory(str(self.download_dir))
+
+        # 마지막 보고서 다운로드로 받은 파일
+        self.last_downloaded: List[Path] = []
 
     def navigate_to_statistics(self) -> bool:
         """
@@ -44,17 +47,10 @@ class ReportGenerator:
                 (By.LINK_TEXT, "통계관리"),
             ]
 
-            for by, selector in menu_selectors:
-                try:
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    element.click()
-                    logger.info("통계/보고서 메뉴 클릭 성공")
-                    time.sleep(2)
-                    return True
-                except:
-                    continue
+            if self.selenium.click_first(menu_selectors, step="menu") is not None:
+                logger.info("통계/보고서 메뉴 클릭 성공")
+                self.selenium.wait_for_page_ready()
+                return True
 
             logger.warning("통계/보고서 메뉴를 찾을 수 없습니다.")
             return False
@@ -83,17 +79,9 @@ class ReportGenerator:
                 (By.XPATH, f"//input[@value='{report_type}']"),
             ]
 
-            for by, selector in type_selectors:
-                try:
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    element.click()
-                    logger.info("보고서 유형 선택 완료")
-                    time.sleep(1)
-                    return True
-                except:
-                    continue
+            if self.selenium.click_first(type_selectors, step="menu") is not None:
+                logger.info("보고서 유형 선택 완료")
+                return True
 
             logger.warning(f"보고서 유형을 찾을 수 없습니다: {report_type}")
             return False
@@ -123,9 +111,8 @@ class ReportGenerator:
                 (By.XPATH, "//input[contains(@placeholder, '시작')]"),
             ]
 
-            for by, selector in start_selectors:
-                if self.selenium.safe_send_keys(by, selector, start_date.replace("-", ""), timeout=5):
-                    break
+            if not self.selenium.send_keys_first(start_selectors, start_date.replace("-", "")):
+                logger.warning("시작일 입력 필드를 찾을 수 없습니다.")
 
             # 종료일 입력
             end_selectors = [
@@ -134,9 +121,8 @@ class ReportGenerator:
                 (By.XPATH, "//input[contains(@placeholder, '종료')]"),
             ]
 
-            for by, selector in end_selectors:
-                if self.selenium.safe_send_keys(by, selector, end_date.replace("-", ""), timeout=5):
-                    break
+            if not self.selenium.send_keys_first(end_selectors, end_date.replace("-", "")):
+                logger.warning("종료일 입력 필드를 찾을 수 없습니다.")
 
             logger.info("보고서 기간 설정 완료")
             return True
@@ -162,17 +148,11 @@ class ReportGenerator:
                 (By.CLASS_NAME, "btn-generate"),
             ]
 
-            for by, selector in generate_selectors:
-                try:
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    element.click()
-                    logger.info("보고서 생성 버튼 클릭")
-                    time.sleep(5)  # 보고서 생성 대기
-                    return True
-                except:
-                    continue
+            if self.selenium.click_first(generate_selectors, step="menu") is not None:
+                logger.info("보고서 생성 버튼 클릭")
+                # 생성 완료는 download_report에서 다운로드 버튼이 나타날 때까지 대기
+                self.selenium.wait_for_page_ready()
+                return True
 
             logger.warning("보고서 생성 버튼을 찾을 수 없습니다.")
             return False
@@ -201,17 +181,15 @@ class ReportGenerator:
                 (By.ID, "downloadReportBtn"),
             ]
 
-            for by, selector in download_selectors:
-                try:
-                    element = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    element.click()
+            self.last_downloaded = []
+            with self.downloads.begin(f"보고서 {file_format}") as job:
+                if self.selenium.click_first(download_selectors, step="result") is not None:
                     logger.info("보고서 다운로드 버튼 클릭")
-                    time.sleep(5)  # 다운로드 완료 대기
+                    self.last_downloaded = job.wait(self.selenium.budget("download"))
+                    if not self.last_downloaded:
+                        logger.warning("다운로드된 보고서 파일을 확인하지 못했습니다.")
+                        return False
                     return True
-                except:
-                    continue
 
             logger.warning("보고서 다운로드 버튼을 찾을 수 없습니다.")
             return False
@@ -0,0 +1,385 @@
+"""
+EDI 브라우저 세션 풀 모듈
+로그인된 Chrome 드라이버를 미리 띄워두고 다운로드/업로드/보고서 작업에 빌려줍니다.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional
+from loguru import logger
+
+from ..utils.selenium_helper import SeleniumHelper
+from .login import EDILogin
+
+
+class SessionUnavailableError(RuntimeError):
+    """세션을 만들거나 로그인하지 못한 경우"""
+
+
+class EDISession:
+    """로그인된 브라우저 세션 1개 (드라이버 + 로그인 핸들러)"""
+
+    def __init__(self, session_id: int, selenium_helper: SeleniumHelper, edi_login: EDILogin):
+        """
+        Args:
+            session_id: 풀 내 세션 번호
+            selenium_helper: 초기화된 Selenium 헬퍼
+            edi_login: 해당 드라이버의 로그인 핸들러
+        """
+        self.session_id = session_id
+        self.selenium = selenium_helper
+        self.login = edi_login
+        self.created_at = time.time()
+        self.last_used = self.created_at
+        self.login_count = 0
+        self.job_count = 0
+        # True면 다음 대여 때 페이지를 다시 불러와 로그인 상태 확인 (작업 실패 등)
+        self.needs_revalidation = False
+
+    @property
+    def driver(self):
+        return self.selenium.driver
+
+    def mark_suspect(self):
+        """작업이 실패했을 때 호출 - 다음 대여 전에 페이지를 새로 불러와 로그인 상태를 확인합니다."""
+        self.needs_revalidation = True
+
+    def close(self, logout: bool = True):
+        """
+        세션을 종료합니다.
+
+        Args:
+            logout: 드라이버 종료 전 로그아웃 여부
+        """
+        try:
+            if logout:
+                self.login.logout()
+        except Exception as e:
+            logger.warning(f"세션 {self.session_id} 로그아웃 실패: {e}")
+        finally:
+            try:
+                self.selenium.close()
+            except Exception as e:
+                logger.warning(f"세션 {self.session_id} 드라이버 종료 실패: {e}")
+
+
+class SessionPool:
+    """로그인된 EDI 세션 풀 클래스"""
+
+    def __init__(
+        self,
+        size: int = 1,
+        cert_password: Optional[str] = None,
+        headless: bool = True,
+        download_dir: Optional[str] = None,
+        wait_manual: bool = False,
+        max_session_age: Optional[float] = None,
+        wait_budgets: Optional[Dict[str, float]] = None,
+        revalidate_after: float = 300
+    ):
+        """
+        Args:
+            size: 최대 세션 수 (동시에 빌려줄 수 있는 드라이버 수)
+            cert_password: 인증서 비밀번호
+            headless: 헤드리스 모드 사용 여부
+            download_dir: 다운로드 디렉토리 경로 (세션이 여러 개면 세션별 하위 폴더 session-N 사용)
+            wait_manual: 로그인 시 수동 개입을 기다릴지 여부
+            max_session_age: 세션 최대 수명 (초). 넘으면 반납 시 드라이버를 새로 띄움 (None이면 무제한)
+            wait_budgets: 단계별 대기 예산 (초, SeleniumHelper에 전달)
+            revalidate_after: 이 시간(초) 이상 쉬었던 세션은 대여 전에 EDI 페이지를 다시 불러와
+                로그인 상태 확인 (화면에 남은 로그아웃 링크만으로는 서버 세션 만료를 알 수 없음)
+        """
+        if size < 1:
+            raise ValueError(f"세션 풀 크기는 1 이상이어야 합니다: {size}")
+
+        self.size = size
+        self.cert_password = cert_password
+        self.headless = headless
+        self.download_dir = download_dir
+        self.wait_manual = wait_manual
+        self.max_session_age = max_session_age
+        self.wait_budgets = wait_budgets
+        self.revalidate_after = revalidate_after
+
+        self._idle: Deque[EDISession] = deque()
+        self._sessions: List[EDISession] = []
+        self._creating = 0      # 생성(드라이버 시작 + 로그인) 중인 세션 수
+        self._lock = threading.Lock()
+        # 유휴 세션이 생기거나 자리가 비면 (반납/폐기/생성 실패) 대기 중인 acquire를 깨움
+        self._available = threading.Condition(self._lock)
+        self._next_id = 1
+        self._closed = False
+
+    # ── 세션 생성/검사 ──
+
+    def _create_session(self) -> EDISession:
+        """드라이버를 띄우고 로그인한 새 세션을 만듭니다."""
+        with self._lock:
+            session_id = self._next_id
+            self._next_id += 1
+
+        logger.info(f"세션 {session_id} 생성 중 (드라이버 시작 + 로그인)...")
+        selenium_helper = SeleniumHelper(
+            headless=self.headless,
+            download_dir=self._session_download_dir(session_id),
+            wait_budgets=self.wait_budgets
+        )
+        session = EDISession(session_id, selenium_helper, EDILogin(selenium_helper))
+        try:
+            selenium_helper.initialize_driver()
+            logged_in = self._login(session)
+        except Exception as e:
+            # 드라이버가 만들어진 뒤 실패해도 Chrome 프로세스가 남지 않도록 종료
+            session.close(logout=False)
+            raise SessionUnavailableError(f"세션 {session_id} 시작 실패: {e}") from e
+        if not logged_in:
+            session.close(logout=False)
+            raise SessionUnavailableError(f"세션 {session_id} 로그인 실패")
+        return session
+
+    def _session_download_dir(self, session_id: int) -> Optional[str]:
+        """
+        세션의 다운로드 디렉토리.
+        세션이 여러 개면 세션별 하위 폴더를 써서 동시에 받은 파일이 섞이지 않게 합니다.
+        """
+        if not self.download_dir or self.size == 1:
+            return self.download_dir
+        return str(Path(self.download_dir) / f"session-{session_id}")
+
+    def _login(self, session: EDISession) -> bool:
+        """세션에서 로그인을 수행합니다."""
+        if not session.login.login(self.cert_password, wait_manual=self.wait_manual):
+            return False
+        session.login_count += 1
+        session.needs_revalidation = False
+        return True
+
+    def _ensure_logged_in(self, session: EDISession) -> bool:
+        """
+        세션의 로그인 상태를 확인하고, 만료되었으면 같은 드라이버로 다시 로그인합니다.
+
+        오래 쉬었거나 작업이 실패했던 세션은 브라우저에 남은 화면이 서버 상태와 다를 수 있으므로
+        EDI 페이지를 다시 불러온 뒤 확인합니다.
+
+        Returns:
+            bool: 사용 가능 여부 (False면 드라이버를 새로 띄워야 함)
+        """
+        idle = time.time() - session.last_used
+        if session.needs_revalidation or idle >= self.revalidate_after:
+            logger.debug(f"세션 {session.session_id} 페이지 새로 불러와 로그인 확인 (유휴 {idle:.0f}초)")
+            if not session.login.navigate_to_edi():
+                return False
+            logged_in = session.login.is_logged_in(timeout=session.selenium.budget("menu"))
+        else:
+            logged_in = session.login.is_logged_in()
+
+        if logged_in:
+            session.needs_revalidation = False
+            return True
+
+        logger.info(f"세션 {session.session_id} 로그인 만료 → 재로그인")
+        return self._login(session)
+
+    def _discard(self, session: EDISession, logout: bool = False):
+        """세션을 풀에서 제거하고 종료합니다 (빈 자리를 기다리는 acquire를 깨움)."""
+        with self._available:
+            if session in self._sessions:
+                self._sessions.remove(session)
+            self._available.notify()
+        session.close(logout=logout)
+
+    def _expired(self, session: EDISession) -> bool:
+        return (
+            self.max_session_age is not None
+            and time.time() - session.created_at > self.max_session_age
+        )
+
+    # ── 대여/반납 ──
+
+    def acquire(self, timeout: Optional[float] = None) -> EDISession:
+        """
+        로그인된 세션을 빌립니다.
+
+        유휴 세션이 있으면 로그인 상태만 확인해서 반환하고,
+        없으면 최대 세션 수까지 새로 만들며, 그 이상이면 반납을 기다립니다.
+
+        Args:
+            timeout: 반납 대기 최대 시간 (초, None이면 무제한)
+
+        Returns:
+            EDISession: 로그인된 세션
+
+        Raises:
+            SessionUnavailableError: 세션 생성/로그인 실패 또는 대기 시간 초과
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            session = self._take_or_reserve(deadline, timeout)
+
+            if session is None:
+                # 자리를 예약했으므로 새로 생성
+                try:
+                    session = self._create_session()
+                except BaseException:
+                    with self._available:
+                        self._creating -= 1
+                        self._available.notify()
+                    raise
+                with self._available:
+                    self._creating -= 1
+                    self._sessions.append(session)
+
+            if self._expired(session):
+                # 쉬는 동안 수명을 넘긴 세션은 빌려주지 않고 새로 띄움
+                logger.info(f"세션 {session.session_id} 폐기 (수명 초과)")
+                self._discard(session, logout=True)
+                continue
+
+            if self._ensure_logged_in(session):
+                session.last_used = time.time()
+                session.job_count += 1
+                logger.debug(f"세션 {session.session_id} 대여 (작업 {session.job_count}회째)")
+                return session
+
+            # 재로그인 실패 → 드라이버가 죽었거나 페이지가 깨진 상태로 보고 새로 띄움
+            logger.warning(f"세션 {session.session_id} 재로그인 실패 → 드라이버 교체")
+            self._discard(session)
+
+    def _take_or_reserve(self, deadline: Optional[float], timeout: Optional[float]) -> Optional[EDISession]:
+        """
+        유휴 세션을 꺼내거나, 빈 자리가 있으면 생성용으로 예약합니다 (없으면 반납/폐기를 기다림).
+
+        Returns:
+            Optional[EDISession]: 유휴 세션 (None이면 자리를 예약했으므로 새로 생성)
+        """
+        with self._available:
+            while True:
+                if self._closed:
+                    raise SessionUnavailableError("세션 풀이 종료되었습니다.")
+                if self._idle:
+                    return self._idle.popleft()
+                # 생성 중인 세션도 자리를 차지하도록 먼저 예약
+                if len(self._sessions) + self._creating < self.size:
+                    self._creating += 1
+                    return None
+
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    raise SessionUnavailableError(f"{timeout}초 안에 사용 가능한 세션이 없습니다.")
+                self._available.wait(remaining)
+
+    def release(self, session: EDISession, broken: bool = False):
+        """
+        세션을 반납합니다.
+
+        Args:
+            session: 반납할 세션
+            broken: 작업 중 드라이버 오류가 있었는지 여부 (True면 폐기)
+        """
+        if broken or self._closed or self._expired(session):
+            reason = "오류" if broken else "풀 종료" if self._closed else "수명 초과"
+            logger.info(f"세션 {session.session_id} 폐기 ({reason})")
+            self._discard(session, logout=not broken)
+            return
+
+        session.last_used = time.time()
+        with self._available:
+            self._idle.append(session)
+            self._available.notify()
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[EDISession]:
+        """
+        세션을 빌려 쓰고 자동으로 반납하는 컨텍스트 매니저.
+        블록 안에서 예외가 나면 세션을 폐기합니다.
+
+        Args:
+            timeout: 반납 대기 최대 시간 (초)
+        """
+        session = self.acquire(timeout)
+        broken = False
+        try:
+            yield session
+        except Exception:
+            broken = True
+            raise
+        finally:
+            self.release(session, broken=broken)
+
+    # ── 풀 관리 ──
+
+    def warm_up(self, count: Optional[int] = None) -> int:
+        """
+        세션을 미리 만들어 로그인해 둡니다.
+
+        Args:
+            count: 준비할 세션 수 (기본값: 풀 크기)
+
+        Returns:
+            int: 준비된 유휴 세션 수
+        """
+        count = min(count or self.size, self.size)
+        ready = []
+        try:
+            for _ in range(count - len(self._idle)):
+                ready.append(self.acquire())
+        except SessionUnavailableError as e:
+            logger.error(f"세션 준비 실패: {e}")
+        finally:
+            for session in ready:
+                self.release(session)
+
+        logger.info(f"세션 풀 준비 완료: {len(self._idle)}/{self.size}")
+        return len(self._idle)
+
+    def stats(self) -> dict:
+        """
+        세션 풀 상태를 반환합니다.
+
+        Returns:
+            dict: 전체/유휴 세션 수와 세션별 로그인/작업 횟수
+        """
+        with self._lock:
+            sessions = list(self._sessions)
+            idle = len(self._idle)
+        return {
+            "size": self.size,
+            "open": len(sessions),
+            "idle": idle,
+            "sessions": [
+                {
+                    "id": s.session_id,
+                    "age_seconds": round(time.time() - s.created_at, 1),
+                    "logins": s.login_count,
+                    "jobs": s.job_count,
+                }
+                for s in sessions
+            ],
+        }
+
+    def close(self):
+        """
+        유휴 세션을 모두 로그아웃하고 드라이버를 종료합니다.
+        대여 중인 세션은 반납될 때 종료됩니다.
+        """
+        with self._available:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            # 반납을 기다리던 acquire는 깨어나서 종료 오류를 받음
+            self._available.notify_all()
+        for session in idle:
+            self._discard(session, logout=True)
+        if idle:
+            logger.info(f"세션 풀 종료: {len(idle)}개 세션")
+
+    def __enter__(self):
+        """컨텍스트 매니저 진입"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """컨텍스트 매니저 종료"""
+        self.close()
@@ -8,9 +8,8 @@ from datetime import datetime, timedelta
 from typing import Callable, Optional, List
 from loguru import logger
 
-from ..utils.selenium_helper import SeleniumHelper
-from ..automation.login import EDILogin
 from ..automation.backup import DataBackup
+from ..automation.session_pool import SessionPool, SessionUnavailableError
 
 
 class BackupScheduler:
@@ -19,17 +18,28 @@ class BackupScheduler:
     def __init__(
         self,
         cert_password: Optional[str] = None,
-        headless: bool = True
+        headless: bool = True,
+        session_pool: Optional[SessionPool] = None
     ):
         """
         Args:
             cert_password: 인증서 비밀번호
             headless: 헤드리스 모드 사용 여부
+            session_pool: 백업 작업 간에 재사용할 세션 풀 (None이면 자동 생성)
         """
         self.cert_password = cert_password
         self.headless = headless
         self.is_running = False
 
+        # 로그인된 브라우저를 백업 간에 유지 (만료 시에만 재로그인)
+        self.session_pool = session_pool or SessionPool(
+            size=1,
+            cert_password=cert_password,
+            headless=headless,
+            download_dir="data/downloads",
+            wait_manual=False
+        )
+
     def perform_backup(
         self,
         backup_type: str = "full",
@@ -48,54 +58,42 @@ class BackupScheduler:
             logger.info(f"백업 유형: {backup_type}")
             logger.info("=" * 60)
 
-            # Selenium 초기화
-            selenium_helper = SeleniumHelper(
-                headless=self.headless,
-                download_dir="data/downloads"
-            )
-            selenium_helper.initialize_driver()
-
-            try:
-                # 로그인
-                edi_login = EDILogin(selenium_helper)
-                if not edi_login.login(self.cert_password, wait_manual=False):
-                    logger.error("로그인 실패로 백업을 중단합니다.")
-                    return
-
+            with self.session_pool.session() as session:
                 # 백업 수행
-                data_backup = DataBackup(selenium_helper)
+                data_backup = DataBackup(session.selenium)
 
                 # 기간 설정 (이번 달)
                 start_date = datetime.now().replace(day=1).strftime("%Y-%m-%d")
                 end_date = datetime.now().strftime("%Y-%m-%d")
 
+                success = True
                 if backup_type == "full":
-                    data_backup.full_backup(
+                    success = data_backup.full_backup(
                         start_date=start_date,
                         end_date=end_date,
                         report_types=report_types
                     )
                 elif backup_type == "claim":
-                    data_backup.backup_claim_data(start_date, end_date)
+                    success = data_backup.backup_claim_data(start_date, end_date)
                 elif backup_type == "report":
                     if report_types:
-                        data_backup.backup_reports(
+                        success = data_backup.backup_reports(
                             report_types, start_date, end_date
                         )
 
-                # 로그아웃
-                edi_login.logout()
+                if not success:
+                    # 로그인 만료 등으로 실패했을 수 있음 → 다음 백업 전에 다시 확인
+                    session.mark_suspect()
 
                 # 오래된 백업 정리 (30일 이전)
                 data_backup.cleanup_old_backups(keep_days=30)
 
-                logger.info("=" * 60)
-                logger.info("정기 백업 완료")
-                logger.info("=" * 60)
-
-            finally:
-                selenium_helper.close()
+            logger.info("=" * 60)
+            logger.info("정기 백업 완료")
+            logger.info("=" * 60)
 
+        except SessionUnavailableError as e:
+            logger.error(f"로그인 실패로 백업을 중단합니다: {e}")
         except Exception as e:
             logger.error(f"백업 작업 중 오류 발생: {e}")
 
@@ -185,6 +183,7 @@ class BackupScheduler:
             logger.info("사용자에 의해 스케줄러 중지")
         finally:
             self.is_running = False
+            self.session_pool.close()
             logger.info("백업 스케줄러 종료")
 
     def stop(self):
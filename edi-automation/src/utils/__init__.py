@@ -1,6 +1,8 @@
 """Utility modules"""
 
 from .logger import setup_logger
+from .driver_cache import DriverCache
+from .download_tracker import DownloadTracker
 from .selenium_helper import SeleniumHelper
 
-__all__ = ['setup_logger', 'SeleniumHelper']
+__all__ = ['setup_logger', 'DriverCache', 'DownloadTracker', 'SeleniumHelper']
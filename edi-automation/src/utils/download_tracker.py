@@ -0,0 +1,377 @@
+"""
+다운로드 완료 추적 모듈
+다운로드 디렉토리를 감시해서 (.crdownload → 최종 파일 이름 변경) 완료된 파일을
+다운로드를 시작한 작업(job)에 연결합니다.
+
+- Linux: inotify로 이름 변경/쓰기 완료 이벤트만 받음 (디렉토리 전체를 다시 읽지 않음)
+- 그 외: 폴링. 디렉토리 수정 시각이 바뀐 경우에만 목록을 다시 읽음
+- 같은 디렉토리는 프로세스 안에서 추적기 하나를 공유 (for_directory)
+- 작업이 여러 개 진행 중이면 먼저 시작한 작업부터 완료 파일을 받음
+  (작업을 정확히 구분하려면 브라우저마다 다운로드 디렉토리를 따로 사용 - SessionPool이 세션별 하위 폴더 지정)
+- 삭제된 파일은 잊으므로 같은 이름의 파일을 다시 받아도 완료로 인식
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from loguru import logger
+
+
+# 진행 중인 다운로드 임시 파일
+TEMP_SUFFIXES = (".crdownload", ".part", ".tmp", ".download")
+TEMP_PREFIXES = (".com.google.Chrome.",)
+
+DEFAULT_POLL = 0.2
+
+
+def is_temp_download(name: str) -> bool:
+    """진행 중인 다운로드 임시 파일인지 확인합니다."""
+    return name.endswith(TEMP_SUFFIXES) or name.startswith(TEMP_PREFIXES)
+
+
+class _Inotify:
+    """디렉토리 1개에 대한 inotify 감시 (ctypes, 비차단)"""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_ISDIR = 0x40000000
+
+    _EVENT = struct.Struct("iIII")  # wd, mask, cookie, len
+
+    def __init__(self, directory: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+
+        # 완료 시점(임시 파일 → 최종 이름 변경, 최종 이름으로 직접 쓰기 종료)과 삭제/이동만 감시
+        wd = libc.inotify_add_watch(
+            self.fd, os.fsencode(str(directory)),
+            self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_DELETE | self.IN_MOVED_FROM
+        )
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch 실패: {directory}")
+
+    def wait(self, timeout: float):
+        """이벤트가 올 때까지 최대 timeout초 대기합니다 (읽지는 않음)."""
+        select.select([self.fd], [], [], timeout)
+
+    def read(self) -> Tuple[List[Tuple[str, str]], bool]:
+        """
+        쌓인 이벤트를 모두 읽습니다.
+
+        Returns:
+            Tuple[List[Tuple[str, str]], bool]:
+                ([(파일 이름, 종류)], 이벤트 큐 넘침 여부)
+                종류: "gone" (삭제/이동), "moved" (이름 변경으로 생김), "written" (쓰기 종료)
+        """
+        events: List[Tuple[str, str]] = []
+        overflow = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = self._EVENT.unpack_from(data, offset)
+                offset += self._EVENT.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & self.IN_Q_OVERFLOW:
+                    overflow = True
+                elif name and not mask & self.IN_ISDIR:
+                    if mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                        kind = "gone"
+                    elif mask & self.IN_MOVED_TO:
+                        kind = "moved"
+                    else:
+                        kind = "written"
+                    events.append((os.fsdecode(name), kind))
+        return events, overflow
+
+    def close(self):
+        os.close(self.fd)
+
+
+class DownloadJob:
+    """다운로드 작업 1개 (버튼 클릭 1회) - 완료된 파일을 모음"""
+
+    def __init__(self, tracker: "DownloadTracker", label: str, expected: int):
+        """
+        Args:
+            tracker: 다운로드 추적기
+            label: 로그용 작업 이름
+            expected: 기다릴 파일 수
+        """
+        self.label = label
+        self.expected = expected
+        self.files: List[Path] = []
+        self.started_at = time.time()
+        self._tracker = tracker
+
+    @property
+    def done(self) -> bool:
+        return len(self.files) >= self.expected
+
+    def wait(self, timeout: float) -> List[Path]:
+        """
+        기다릴 파일이 모두 완료될 때까지 대기합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            List[Path]: 이 작업에서 완료된 파일 (시간 초과 시 그때까지 완료된 파일)
+        """
+        return self._tracker._wait(self, timeout)
+
+    def cancel(self):
+        """작업을 종료합니다 (이후 완료되는 파일은 이 작업에 연결되지 않음)."""
+        self._tracker._finish(self)
+
+    def __enter__(self) -> "DownloadJob":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # 클릭 실패/예외로 wait까지 가지 못해도 작업이 추적기에 남지 않도록 종료
+        self.cancel()
+        return False
+
+
+class DownloadTracker:
+    """다운로드 디렉토리 감시 및 완료 파일 추적 클래스"""
+
+    # 디렉토리 경로 → 추적기 (같은 디렉토리를 다운로더/보고서/백업이 함께 쓰므로 공유)
+    _trackers: Dict[str, "DownloadTracker"] = {}
+    _registry_lock = threading.Lock()
+
+    @classmethod
+    def for_directory(cls, directory: str) -> "DownloadTracker":
+        """
+        디렉토리의 공유 추적기를 반환합니다 (없으면 생성).
+
+        Args:
+            directory: 다운로드 디렉토리
+
+        Returns:
+            DownloadTracker: 추적기
+        """
+        key = str(Path(directory).resolve())
+        with cls._registry_lock:
+            tracker = cls._trackers.get(key)
+            if tracker is None:
+                tracker = cls(key)
+                cls._trackers[key] = tracker
+            return tracker
+
+    def __init__(self, directory: str, use_inotify: Optional[bool] = None, poll: float = DEFAULT_POLL):
+        """
+        Args:
+            directory: 다운로드 디렉토리
+            use_inotify: inotify 사용 여부 (None이면 Linux에서 자동 사용)
+            poll: 폴링 간격 (초, inotify를 쓰지 못할 때)
+        """
+        self.directory = Path(directory).resolve()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.poll = poll
+
+        self._lock = threading.RLock()
+        self._jobs: List[DownloadJob] = []
+        # 이미 완료로 처리한 파일 → (inode, 수정 시각) (시작 시점 파일 포함)
+        self._known: Dict[str, Tuple[int, int]] = {}
+        self._pending: Set[str] = set()    # 크기 0인 최종 이름 (Chrome이 미리 만드는 자리 파일)
+        self._dir_mtime = None
+
+        self._inotify: Optional[_Inotify] = None
+        if use_inotify is None:
+            use_inotify = sys.platform.startswith("linux")
+        if use_inotify:
+            try:
+                self._inotify = _Inotify(self.directory)
+            except (OSError, AttributeError) as e:
+                logger.warning(f"inotify 사용 불가 → 폴링으로 감시: {e}")
+
+        # 감시 시작 전에 있던 파일은 완료 처리 대상에서 제외 (시작 시 1회만 목록 읽기)
+        self._rescan(record=False)
+        logger.debug(f"다운로드 감시 시작 ({self.backend}): {self.directory}")
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._inotify else "polling"
+
+    # ── 작업 ──
+
+    def begin(self, label: str = "", expected: int = 1) -> DownloadJob:
+        """
+        다운로드 작업을 시작합니다. 다운로드 버튼을 누르기 직전에 호출하세요.
+        with 문으로 사용하면 예외가 나도 작업이 종료됩니다.
+
+        Args:
+            label: 로그용 작업 이름
+            expected: 기다릴 파일 수
+
+        Returns:
+            DownloadJob: 작업 (wait로 완료 파일을 받음)
+        """
+        with self._lock:
+            # 이전에 완료된 파일이 이 작업에 연결되지 않도록 쌓인 이벤트를 먼저 처리
+            self._pump()
+            job = DownloadJob(self, label, expected)
+            self._jobs.append(job)
+            return job
+
+    def _finish(self, job: DownloadJob):
+        with self._lock:
+            if job in self._jobs:
+                self._jobs.remove(job)
+
+    def _wait(self, job: DownloadJob, timeout: float) -> List[Path]:
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                with self._lock:
+                    self._pump()
+                    if job.done:
+                        break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(
+                        f"다운로드 완료 대기 시간 초과 ({job.label or '작업'}): "
+                        f"{len(job.files)}/{job.expected}개 완료"
+                    )
+                    break
+
+                # 잠금 밖에서 대기 (다른 스레드의 작업도 이벤트를 처리할 수 있도록)
+                if self._inotify:
+                    self._inotify.wait(min(remaining, 1.0))
+                else:
+                    time.sleep(min(self.poll, remaining))
+        finally:
+            self._finish(job)
+        return list(job.files)
+
+    # ── 이벤트 처리 ──
+
+    def _pump(self):
+        """쌓인 변경을 처리합니다 (대기 없음)."""
+        if not self._inotify:
+            self._rescan()
+            return
+
+        events, overflow = self._inotify.read()
+        if overflow:
+            logger.warning("inotify 이벤트 큐 넘침 → 디렉토리 다시 읽기")
+            self._rescan(force=True)
+            return
+        for name, kind in events:
+            if kind == "gone":
+                self._forget(name)
+            elif kind == "written" and name in self._known:
+                # 기존 파일을 제자리에서 수정한 경우 → 새 다운로드가 아님
+                continue
+            else:
+                self._check(name)
+
+    def _rescan(self, force: bool = False, record: bool = True):
+        """
+        디렉토리 목록을 다시 읽습니다. 디렉토리 수정 시각이 그대로면 자리 파일만 확인합니다.
+        목록에서 사라진 파일은 잊습니다 (같은 이름으로 다시 받으면 새 다운로드로 인식).
+
+        Args:
+            force: 수정 시각과 관계없이 다시 읽기
+            record: False면 현재 파일을 완료 처리 없이 기존 파일로 기록
+        """
+        try:
+            dir_mtime = os.stat(self.directory).st_mtime_ns
+        except FileNotFoundError:
+            return
+
+        if not force and dir_mtime == self._dir_mtime:
+            for name in list(self._pending):
+                self._check(name)
+            return
+
+        self._dir_mtime = dir_mtime
+        present: Set[str] = set()
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if is_temp_download(entry.name) or not entry.is_file():
+                    continue
+                present.add(entry.name)
+                if record:
+                    self._check(entry.name)
+                else:
+                    self._known[entry.name] = (entry.inode(), entry.stat().st_mtime_ns)
+
+        for name in set(self._known) - present:
+            self._forget(name)
+        self._pending &= present
+
+    def _forget(self, name: str):
+        """삭제/이동된 파일을 잊습니다."""
+        self._known.pop(name, None)
+        self._pending.discard(name)
+
+    def _check(self, name: str):
+        """최종 이름 파일이 완료되었는지 확인하고 완료면 작업에 연결합니다."""
+        if is_temp_download(name):
+            return
+
+        path = self.directory / name
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._forget(name)
+            return
+        if not path.is_file():
+            return
+        # 이미 처리한 파일. 삭제를 못 보고 같은 이름으로 다시 받은 경우는
+        # inode가 재사용되더라도 수정 시각이 달라 새 파일로 인식
+        identity = (st.st_ino, st.st_mtime_ns)
+        if self._known.get(name) == identity:
+            return
+        if st.st_size == 0:
+            # 다운로드 시작 시 미리 만든 자리 파일 → 임시 파일 이름 변경으로 채워질 때까지 대기
+            self._pending.add(name)
+            return
+
+        self._pending.discard(name)
+        self._known[name] = identity
+        self._completed(path)
+
+    def _completed(self, path: Path):
+        """완료된 파일을 먼저 시작한 작업부터 연결합니다."""
+        waiting = [job for job in self._jobs if not job.done]
+        job = waiting[0] if waiting else (self._jobs[0] if self._jobs else None)
+        if job is None:
+            logger.debug(f"작업과 무관한 다운로드 완료: {path.name}")
+            return
+
+        job.files.append(path)
+        elapsed = time.time() - job.started_at
+        logger.info(f"다운로드 완료 ({elapsed:.1f}s): {path.name}")
+
+    def close(self):
+        """감시를 종료합니다."""
+        with self._lock:
+            if self._inotify:
+                self._inotify.close()
+                self._inotify = None
+        with self._registry_lock:
+            if self._trackers.get(str(self.directory)) is self:
+                del self._trackers[str(self.directory)]
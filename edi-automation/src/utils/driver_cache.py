@@ -0,0 +1,193 @@
+"""
+ChromeDriver 경로 캐시 모듈
+ChromeDriverManager().install()로 찾은 드라이버 경로를 Chrome 설치 지문과 함께 저장해두고,
+Chrome이 바뀌지 않았으면 다음 실행부터 드라이버 탐색/버전 확인을 건너뜁니다.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from loguru import logger
+
+
+# 캐시 파일 형식이 바뀌면 올려서 기존 캐시 무효화
+DRIVER_CACHE_VERSION = 1
+
+# Chrome 실행 파일을 찾지 못해 지문을 만들 수 없을 때의 캐시 유효 시간 (초)
+DEFAULT_TTL = 24 * 3600
+
+
+def _default_cache_file() -> Path:
+    """캐시 파일 경로 (환경변수 EDI_DRIVER_CACHE 우선)"""
+    env_path = os.environ.get("EDI_DRIVER_CACHE")
+    if env_path:
+        return Path(env_path)
+    return Path.home() / ".cache" / "edi-automation" / "chromedriver.json"
+
+
+def find_chrome_binary() -> Optional[str]:
+    """
+    설치된 Chrome 실행 파일 경로를 찾습니다.
+
+    Returns:
+        Optional[str]: 실행 파일 경로 (찾지 못하면 None)
+    """
+    env_path = os.environ.get("CHROME_BINARY")
+    if env_path and os.path.isfile(env_path):
+        return env_path
+
+    if sys.platform.startswith("win"):
+        candidates = [
+            os.path.join(os.environ.get(var, ""), "Google", "Chrome", "Application", "chrome.exe")
+            for var in ("PROGRAMFILES", "PROGRAMFILES(X86)", "LOCALAPPDATA")
+            if os.environ.get(var)
+        ]
+    elif sys.platform == "darwin":
+        candidates = ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"]
+    else:
+        candidates = [
+            shutil.which(name) or ""
+            for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser")
+        ]
+
+    for path in candidates:
+        if path and os.path.isfile(path):
+            return path
+    return None
+
+
+def chrome_fingerprint(binary: Optional[str] = None) -> Optional[str]:
+    """
+    Chrome 설치 지문 (실행 파일 경로 + 크기 + 수정 시각).
+    Chrome이 업데이트되면 실행 파일이 교체되어 지문이 바뀝니다.
+
+    Args:
+        binary: Chrome 실행 파일 경로 (None이면 자동 탐색)
+
+    Returns:
+        Optional[str]: 지문 (Chrome을 찾지 못하면 None)
+    """
+    binary = binary or find_chrome_binary()
+    if not binary:
+        return None
+    try:
+        st = os.stat(binary)
+    except OSError:
+        return None
+    return f"{binary}|{st.st_size}|{st.st_mtime_ns}"
+
+
+class DriverCache:
+    """ChromeDriver 경로 캐시 클래스"""
+
+    # 프로세스 내 캐시 (파일 경로 → 항목). 같은 프로세스에서 드라이버를 여러 번 띄울 때 파일 읽기 생략
+    _memory: Dict[str, dict] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, cache_file: Optional[str] = None, ttl: float = DEFAULT_TTL):
+        """
+        Args:
+            cache_file: 캐시 파일 경로 (기본값: ~/.cache/edi-automation/chromedriver.json)
+            ttl: Chrome 지문이 없을 때의 캐시 유효 시간 (초)
+        """
+        self.cache_file = Path(cache_file) if cache_file else _default_cache_file()
+        self.ttl = ttl
+
+    def _load(self) -> Optional[dict]:
+        key = str(self.cache_file)
+        if key in self._memory:
+            return self._memory[key]
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"드라이버 캐시 파일 손상 → 무시: {e}")
+            return None
+        self._memory[key] = entry
+        return entry
+
+    def lookup(self, fingerprint: Optional[str]) -> Optional[str]:
+        """
+        캐시된 드라이버 경로를 조회합니다.
+
+        Args:
+            fingerprint: 현재 Chrome 지문
+
+        Returns:
+            Optional[str]: 유효한 드라이버 경로 (없거나 Chrome이 바뀌었으면 None)
+        """
+        entry = self._load()
+        if not entry or entry.get("version") != DRIVER_CACHE_VERSION:
+            return None
+        if entry.get("fingerprint") != fingerprint:
+            return None
+        if fingerprint is None and time.time() - entry.get("resolved_at", 0) > self.ttl:
+            return None
+
+        driver_path = entry.get("driver_path")
+        if not driver_path or not os.path.isfile(driver_path):
+            return None
+        return driver_path
+
+    def store(self, driver_path: str, fingerprint: Optional[str]):
+        """
+        드라이버 경로를 저장합니다 (임시 파일에 쓴 뒤 교체).
+
+        Args:
+            driver_path: 드라이버 실행 파일 경로
+            fingerprint: 현재 Chrome 지문
+        """
+        entry = {
+            "version": DRIVER_CACHE_VERSION,
+            "driver_path": driver_path,
+            "fingerprint": fingerprint,
+            "resolved_at": time.time(),
+        }
+        self._memory[str(self.cache_file)] = entry
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp, self.cache_file)
+        except Exception as e:
+            logger.warning(f"드라이버 캐시 저장 실패 (무시): {e}")
+
+    def invalidate(self):
+        """캐시를 삭제합니다."""
+        self._memory.pop(str(self.cache_file), None)
+        try:
+            self.cache_file.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"드라이버 캐시 삭제 실패: {e}")
+
+    def resolve(self, installer: Callable[[], str]) -> Tuple[str, bool]:
+        """
+        드라이버 경로를 반환합니다. 캐시가 유효하면 installer를 호출하지 않습니다.
+
+        Args:
+            installer: 캐시 미스 시 드라이버 경로를 구하는 함수 (예: ChromeDriverManager().install)
+
+        Returns:
+            Tuple[str, bool]: (드라이버 경로, 캐시 적중 여부)
+        """
+        fingerprint = chrome_fingerprint()
+        with self._lock:
+            driver_path = self.lookup(fingerprint)
+            if driver_path:
+                return driver_path, True
+
+            driver_path = installer()
+            self.store(driver_path, fingerprint)
+            return driver_path, False
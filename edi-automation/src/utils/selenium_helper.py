@@ -3,40 +3,70 @@ Selenium 헬퍼 모듈
 웹 자동화를 위한 유틸리티 함수들을 제공합니다.
 """
 
+import os
 import time
-from typing import Optional, List
+from typing import Callable, Dict, Optional, Sequence, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, SessionNotCreatedException
 from webdriver_manager.chrome import ChromeDriverManager
 from loguru import logger
 
+from .driver_cache import DriverCache
+from . import waits
+from .waits import CLICKABLE, PRESENT, VISIBLE, Locator
+
 
 class SeleniumHelper:
     """Selenium 웹 자동화 헬퍼 클래스"""
 
-    def __init__(self, headless: bool = False, download_dir: Optional[str] = None):
+    def __init__(
+        self,
+        headless: bool = False,
+        download_dir: Optional[str] = None,
+        driver_cache: Optional[DriverCache] = None,
+        wait_budgets: Optional[Dict[str, float]] = None
+    ):
         """
         Args:
             headless: 헤드리스 모드 사용 여부
             download_dir: 다운로드 디렉토리 경로
+            driver_cache: ChromeDriver 경로 캐시 (기본값: 사용자 캐시 디렉토리)
+            wait_budgets: 단계별 대기 예산 (초). 지정하지 않은 단계는 waits.DEFAULT_BUDGETS 사용
         """
         self.headless = headless
         self.download_dir = download_dir
+        self.driver_cache = driver_cache or DriverCache()
+        self.wait_budgets = waits.merge_budgets(wait_budgets)
         self.driver: Optional[webdriver.Chrome] = None
 
+        # 마지막 initialize_driver의 단계별 소요 시간 (초)
+        self.startup_timings: Dict[str, float] = {}
+        self.driver_cache_hit = False
+
     def initialize_driver(self) -> webdriver.Chrome:
         """
         Chrome 드라이버를 초기화합니다.
 
+        드라이버 경로는 캐시를 먼저 확인하고, Chrome이 바뀌었거나 캐시가 없을 때만
+        ChromeDriverManager로 다시 찾습니다. 단계별 소요 시간은 startup_timings에 기록됩니다.
+
         Returns:
             webdriver.Chrome: 초기화된 드라이버
         """
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+        self.startup_timings = timings
+
+        def lap(stage: str, since: float) -> float:
+            now = time.perf_counter()
+            timings[stage] = timings.get(stage, 0.0) + now - since
+            return now
+
         try:
+            t = started
             chrome_options = Options()
 
             if self.headless:
@@ -55,95 +85,298 @@ class SeleniumHelper:
             # 다운로드 디렉토리 설정
             if self.download_dir:
                 prefs = {
-                    "download.default_directory": self.download_dir,
+                    # Chrome은 상대 경로를 무시하므로 절대 경로로 전달
+                    "download.default_directory": os.path.abspath(self.download_dir),
                     "download.prompt_for_download": False,
                     "download.directory_upgrade": True,
                     "safebrowsing.enabled": True
                 }
                 chrome_options.add_experimental_option("prefs", prefs)
 
-            # 드라이버 생성
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            t = lap("options", t)
 
-            # 암묵적 대기 설정
-            self.driver.implicitly_wait(10)
+            # 드라이버 경로 (캐시 적중 시 ChromeDriverManager 생략)
+            driver_path, self.driver_cache_hit = self.driver_cache.resolve(
+                lambda: ChromeDriverManager().install()
+            )
+            t = lap("driver_resolve", t)
+
+            # 드라이버 생성
+            try:
+                self.driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+            except SessionNotCreatedException:
+                if not self.driver_cache_hit:
+                    raise
+                # 캐시된 드라이버가 현재 Chrome과 맞지 않음 → 캐시 삭제 후 한 번 더 시도
+                logger.warning("캐시된 ChromeDriver로 시작 실패 → 드라이버를 다시 찾습니다.")
+                self.driver_cache.invalidate()
+                t = time.perf_counter()
+                driver_path, self.driver_cache_hit = self.driver_cache.resolve(
+                    lambda: ChromeDriverManager().install()
+                )
+                t = lap("driver_resolve", t)
+                self.driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+            t = lap("browser_launch", t)
+
+            # 암묵적 대기 없음 - 모든 대기는 조건 기반 명시적 대기 (find_first 등)
+            # 암묵적 대기가 있으면 없는 요소를 확인할 때마다 그 시간만큼 멈춤
+            self.driver.implicitly_wait(0)
 
             # 윈도우 최대화
             if not self.headless:
                 self.driver.maximize_window()
+            lap("window_setup", t)
+            timings["total"] = time.perf_counter() - started
 
-            logger.info("Chrome 드라이버 초기화 성공")
+            logger.info(f"Chrome 드라이버 초기화 성공 ({self.format_startup_timings()})")
             return self.driver
 
         except Exception as e:
             logger.error(f"드라이버 초기화 실패: {e}")
             raise
 
-    def wait_for_element(self, by: By, value: str, timeout: int = 10):
+    def format_startup_timings(self) -> str:
+        """
+        마지막 드라이버 초기화의 단계별 소요 시간을 문자열로 반환합니다.
+
+        Returns:
+            str: 예) "총 1.52s | 드라이버 경로 0.00s (캐시) | 브라우저 시작 1.38s | 창 설정 0.14s"
+        """
+        t = self.startup_timings
+        if "total" not in t:
+            return "측정 없음"
+        cache = "캐시" if self.driver_cache_hit else "탐색"
+        return (
+            f"총 {t['total']:.2f}s"
+            f" | 옵션 {t.get('options', 0):.2f}s"
+            f" | 드라이버 경로 {t.get('driver_resolve', 0):.2f}s ({cache})"
+            f" | 브라우저 시작 {t.get('browser_launch', 0):.2f}s"
+            f" | 창 설정 {t.get('window_setup', 0):.2f}s"
+        )
+
+    # ── 조건 기반 대기 ──
+
+    def budget(self, step: str) -> float:
+        """
+        단계별 대기 예산을 반환합니다.
+
+        Args:
+            step: 단계 이름 (menu, input, result, download 등)
+
+        Returns:
+            float: 대기 시간 (초). 알 수 없는 단계는 menu 예산
+        """
+        return self.wait_budgets.get(step, self.wait_budgets["menu"])
+
+    def wait_until(
+        self,
+        predicate: Callable[[], object],
+        step: str = "menu",
+        timeout: Optional[float] = None
+    ):
+        """
+        조건 함수가 참 값을 반환할 때까지 대기합니다.
+
+        Args:
+            predicate: 조건 함수
+            step: 대기 예산 단계 이름
+            timeout: 최대 대기 시간 (초, 지정 시 예산 대신 사용)
+
+        Returns:
+            조건 함수의 첫 참 값 (시간 초과 시 None)
+        """
+        return waits.wait_until(predicate, self.budget(step) if timeout is None else timeout)
+
+    def find_first(
+        self,
+        locators: Sequence[Locator],
+        condition: str = CLICKABLE,
+        step: str = "menu",
+        timeout: Optional[float] = None
+    ) -> Optional[Tuple[int, object]]:
+        """
+        여러 후보 선택자 중 먼저 조건을 만족하는 요소를 찾습니다.
+        모든 후보를 한 폴링 루프에서 확인하므로 후보가 많아도 대기는 예산 1회분입니다.
+
+        Args:
+            locators: (By, 선택자) 후보 목록 (우선순위 순)
+            condition: 요소 조건 (present, visible, clickable)
+            step: 대기 예산 단계 이름
+            timeout: 최대 대기 시간 (초, 지정 시 예산 대신 사용)
+
+        Returns:
+            Optional[Tuple[int, WebElement]]: (선택자 인덱스, 요소) - 시간 초과 시 None
+        """
+        started = time.monotonic()
+        found = waits.find_first(
+            self.driver, locators, condition,
+            self.budget(step) if timeout is None else timeout
+        )
+        elapsed = time.monotonic() - started
+        if found:
+            by, value = locators[found[0]]
+            logger.debug(f"요소 발견 ({elapsed:.2f}s): {by}={value}")
+        else:
+            logger.debug(f"요소 없음 ({elapsed:.2f}s): {waits.locator_text(list(locators))}")
+        return found
+
+    def click_first(
+        self,
+        locators: Sequence[Locator],
+        step: str = "menu",
+        timeout: Optional[float] = None
+    ) -> Optional[int]:
+        """
+        후보 선택자 중 먼저 클릭 가능해진 요소를 클릭합니다.
+        오버레이에 가려 클릭이 막히면 예산 안에서 다시 시도합니다.
+
+        Args:
+            locators: (By, 선택자) 후보 목록 (우선순위 순)
+            step: 대기 예산 단계 이름
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            Optional[int]: 클릭한 선택자 인덱스 (실패 시 None)
+        """
+        def probe():
+            found = waits.probe_first(self.driver, locators, CLICKABLE)
+            if not found:
+                return None
+            found[1].click()
+            return found
+
+        found = self.wait_until(probe, step, timeout)
+        if found is None:
+            logger.debug(f"클릭할 요소 없음: {waits.locator_text(list(locators))}")
+            return None
+        by, value = locators[found[0]]
+        logger.debug(f"클릭 성공: {by}={value}")
+        return found[0]
+
+    def send_keys_first(
+        self,
+        locators: Sequence[Locator],
+        keys: str,
+        step: str = "input",
+        timeout: Optional[float] = None,
+        clear: bool = True
+    ) -> bool:
+        """
+        후보 선택자 중 먼저 나타난 입력 필드에 텍스트를 입력합니다.
+
+        Args:
+            locators: (By, 선택자) 후보 목록 (우선순위 순)
+            keys: 입력할 텍스트
+            step: 대기 예산 단계 이름
+            timeout: 최대 대기 시간 (초)
+            clear: 입력 전 기존 값 삭제 여부
+
+        Returns:
+            bool: 입력 성공 여부
+        """
+        def probe():
+            found = waits.probe_first(self.driver, locators, VISIBLE)
+            if not found:
+                return None
+            if clear:
+                found[1].clear()
+            found[1].send_keys(keys)
+            return found
+
+        found = self.wait_until(probe, step, timeout)
+        if found is None:
+            logger.debug(f"입력 필드 없음: {waits.locator_text(list(locators))}")
+            return False
+        by, value = locators[found[0]]
+        logger.debug(f"텍스트 입력 성공: {by}={value}")
+        return True
+
+    def wait_for_page_ready(self, step: str = "page_load", timeout: Optional[float] = None) -> bool:
+        """
+        document.readyState가 complete가 될 때까지 대기합니다.
+
+        Args:
+            step: 대기 예산 단계 이름
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            bool: 로드 완료 여부
+        """
+        ready = self.wait_until(
+            lambda: self.driver.execute_script("return document.readyState") == "complete",
+            step, timeout
+        )
+        if not ready:
+            logger.warning("페이지 로드 완료를 확인하지 못했습니다.")
+        return bool(ready)
+
+    def wait_for_alert(self, step: str = "alert", timeout: Optional[float] = None):
+        """
+        확인 대화상자가 뜰 때까지 대기합니다.
+
+        Args:
+            step: 대기 예산 단계 이름
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            Optional[Alert]: 대화상자 (없으면 None)
+        """
+        return self.wait_until(lambda: self.driver.switch_to.alert, step, timeout)
+
+    def wait_for_element(self, by: By, value: str, timeout: Optional[float] = None):
         """
         요소가 나타날 때까지 대기합니다.
 
         Args:
             by: 검색 방법 (By.ID, By.XPATH 등)
             value: 검색 값
-            timeout: 최대 대기 시간 (초)
+            timeout: 최대 대기 시간 (초, 기본값: element 예산)
 
         Returns:
             WebElement: 찾은 요소
         """
-        try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
-            )
-            return element
-        except TimeoutException:
+        found = self.find_first([(by, value)], PRESENT, step="element", timeout=timeout)
+        if found is None:
             logger.error(f"요소를 찾을 수 없습니다: {by}={value}")
-            raise
+            raise TimeoutException(f"요소를 찾을 수 없습니다: {by}={value}")
+        return found[1]
 
-    def wait_for_clickable(self, by: By, value: str, timeout: int = 10):
+    def wait_for_clickable(self, by: By, value: str, timeout: Optional[float] = None):
         """
         요소가 클릭 가능할 때까지 대기합니다.
 
         Args:
             by: 검색 방법
             value: 검색 값
-            timeout: 최대 대기 시간 (초)
+            timeout: 최대 대기 시간 (초, 기본값: element 예산)
 
         Returns:
             WebElement: 찾은 요소
         """
-        try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable((by, value))
-            )
-            return element
-        except TimeoutException:
+        found = self.find_first([(by, value)], CLICKABLE, step="element", timeout=timeout)
+        if found is None:
             logger.error(f"클릭 가능한 요소를 찾을 수 없습니다: {by}={value}")
-            raise
+            raise TimeoutException(f"클릭 가능한 요소를 찾을 수 없습니다: {by}={value}")
+        return found[1]
 
-    def safe_click(self, by: By, value: str, timeout: int = 10) -> bool:
+    def safe_click(self, by: By, value: str, timeout: Optional[float] = None) -> bool:
         """
         안전하게 요소를 클릭합니다.
 
         Args:
             by: 검색 방법
             value: 검색 값
-            timeout: 최대 대기 시간
+            timeout: 최대 대기 시간 (기본값: element 예산)
 
         Returns:
             bool: 클릭 성공 여부
         """
-        try:
-            element = self.wait_for_clickable(by, value, timeout)
-            element.click()
-            logger.debug(f"클릭 성공: {by}={value}")
-            return True
-        except Exception as e:
-            logger.error(f"클릭 실패: {by}={value}, 오류: {e}")
+        if self.click_first([(by, value)], step="element", timeout=timeout) is None:
+            logger.error(f"클릭 실패: {by}={value}")
             return False
+        return True
 
-    def safe_send_keys(self, by: By, value: str, keys: str, timeout: int = 10) -> bool:
+    def safe_send_keys(self, by: By, value: str, keys: str, timeout: Optional[float] = None) -> bool:
         """
         안전하게 텍스트를 입력합니다.
 
@@ -151,37 +384,34 @@ class SeleniumHelper:
             by: 검색 방법
             value: 검색 값
             keys: 입력할 텍스트
-            timeout: 최대 대기 시간
+            timeout: 최대 대기 시간 (기본값: element 예산)
 
         Returns:
             bool: 입력 성공 여부
         """
-        try:
-            element = self.wait_for_element(by, value, timeout)
-            element.clear()
-            element.send_keys(keys)
-            logger.debug(f"텍스트 입력 성공: {by}={value}")
-            return True
-        except Exception as e:
-            logger.error(f"텍스트 입력 실패: {by}={value}, 오류: {e}")
+        if not self.send_keys_first([(by, value)], keys, step="element", timeout=timeout):
+            logger.error(f"텍스트 입력 실패: {by}={value}")
             return False
+        return True
 
-    def switch_to_iframe(self, iframe_locator: str, by: By = By.ID, timeout: int = 10) -> bool:
+    def switch_to_iframe(self, iframe_locator: str, by: By = By.ID, timeout: Optional[float] = None) -> bool:
         """
         iframe으로 전환합니다.
 
         Args:
             iframe_locator: iframe 식별자
             by: 검색 방법
-            timeout: 최대 대기 시간
+            timeout: 최대 대기 시간 (기본값: element 예산)
 
         Returns:
             bool: 전환 성공 여부
         """
+        found = self.find_first([(by, iframe_locator)], PRESENT, step="element", timeout=timeout)
+        if found is None:
+            logger.error(f"iframe 전환 실패: {iframe_locator}")
+            return False
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.frame_to_be_available_and_switch_to_it((by, iframe_locator))
-            )
+            self.driver.switch_to.frame(found[1])
             logger.debug(f"iframe 전환 성공: {iframe_locator}")
             return True
         except Exception as e:
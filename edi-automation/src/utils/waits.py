@@ -0,0 +1,148 @@
+"""
+조건 기반 대기 모듈
+암묵적 대기(implicitly_wait) 없이 조건이 만족되는 즉시 진행하는 명시적 대기 유틸리티입니다.
+
+- 여러 후보 선택자를 하나의 폴링 루프에서 함께 확인 (먼저 조건을 만족한 선택자 사용)
+- 단계(step)별 대기 예산(초)은 설정 파일의 selenium.wait_budgets로 조정
+- 암묵적 대기가 0이어야 find_elements가 즉시 반환되어 후보마다 시간이 쌓이지 않음
+"""
+
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    InvalidElementStateException,
+    NoAlertPresentException,
+    NoSuchElementException,
+    NoSuchFrameException,
+    StaleElementReferenceException,
+)
+
+T = TypeVar("T")
+
+# (By, 선택자)
+Locator = Tuple[str, str]
+
+# 요소 조건
+PRESENT = "present"         # DOM에 존재
+VISIBLE = "visible"         # 화면에 표시됨
+CLICKABLE = "clickable"     # 표시됨 + 활성화됨
+
+DEFAULT_POLL = 0.2
+
+# 단계별 대기 예산 (초)
+DEFAULT_BUDGETS: Dict[str, float] = {
+    "page_load": 30,    # 페이지 로드 완료 (document.readyState)
+    "element": 10,      # 단일 요소 대기 (wait_for_element, safe_click 등 기본값)
+    "menu": 5,          # 메뉴/버튼 탐색
+    "input": 5,         # 입력 필드 탐색
+    "popup": 3,         # 인증서 팝업 창/iframe 등장
+    "login": 60,        # 로그인 완료 확인
+    "result": 15,       # 조회/검증/보고서 생성 결과 표시
+    "alert": 3,         # 확인 대화상자
+    "download": 60,     # 다운로드 완료
+}
+
+# 폴링 중 일시적으로 발생할 수 있는 예외 (다음 폴링에서 다시 시도)
+_TRANSIENT = (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    InvalidElementStateException,
+    NoAlertPresentException,
+    NoSuchElementException,
+    NoSuchFrameException,
+    StaleElementReferenceException,
+)
+
+
+def wait_until(
+    predicate: Callable[[], Optional[T]],
+    timeout: float,
+    poll: float = DEFAULT_POLL
+) -> Optional[T]:
+    """
+    predicate가 참 값을 반환할 때까지 폴링합니다. timeout이 0이어도 한 번은 확인합니다.
+
+    Args:
+        predicate: 조건 함수 (참 값 반환 시 대기 종료)
+        timeout: 최대 대기 시간 (초)
+        poll: 폴링 간격 (초)
+
+    Returns:
+        predicate의 첫 참 값 (시간 초과 시 None)
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            value = predicate()
+        except _TRANSIENT:
+            value = None
+        if value:
+            return value
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(poll, remaining))
+
+
+def element_matches(element, condition: str) -> bool:
+    """요소가 조건(present/visible/clickable)을 만족하는지 확인합니다."""
+    if condition == PRESENT:
+        return True
+    if not element.is_displayed():
+        return False
+    return condition == VISIBLE or element.is_enabled()
+
+
+def probe_first(driver, locators: Sequence[Locator], condition: str = CLICKABLE):
+    """
+    후보 선택자를 순서대로 한 번씩 확인합니다 (대기 없음).
+
+    Returns:
+        Optional[Tuple[int, WebElement]]: (선택자 인덱스, 요소) - 없으면 None
+    """
+    for index, (by, value) in enumerate(locators):
+        for element in driver.find_elements(by, value):
+            if element_matches(element, condition):
+                return index, element
+    return None
+
+
+def find_first(
+    driver,
+    locators: Sequence[Locator],
+    condition: str = CLICKABLE,
+    timeout: float = DEFAULT_BUDGETS["menu"],
+    poll: float = DEFAULT_POLL
+):
+    """
+    여러 후보 선택자 중 먼저 조건을 만족하는 요소를 찾습니다.
+    폴링마다 모든 후보를 확인하므로 전체 대기 시간은 후보 수와 무관하게 timeout 이하입니다.
+    같은 폴링에서 여러 후보가 만족하면 목록 앞쪽 선택자가 우선합니다.
+
+    Args:
+        driver: WebDriver
+        locators: (By, 선택자) 후보 목록 (우선순위 순)
+        condition: 요소 조건 (present, visible, clickable)
+        timeout: 최대 대기 시간 (초)
+        poll: 폴링 간격 (초)
+
+    Returns:
+        Optional[Tuple[int, WebElement]]: (선택자 인덱스, 요소) - 시간 초과 시 None
+    """
+    return wait_until(lambda: probe_first(driver, locators, condition), timeout, poll)
+
+
+def merge_budgets(overrides: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """기본 대기 예산에 설정값을 덮어쓴 사본을 반환합니다."""
+    budgets = dict(DEFAULT_BUDGETS)
+    for step, seconds in (overrides or {}).items():
+        budgets[step] = float(seconds)
+    return budgets
+
+
+def locator_text(locators: List[Locator]) -> str:
+    """로그용 선택자 목록 문자열"""
+    return ", ".join(f"{by}={value}" for by, value in locators)
@@ -0,0 +1,317 @@
+"""
+파이프라인 벤치마크
+합성 급여대장을 만들어 읽기 → 매핑 → 검증 → 신고서 → 퇴직금 단계별 시간/메모리 측정
+(외부 데이터/네트워크 없이 실행)
+
+    python -m payroll_automation bench --rows 10000 --dirty 0.05 --sheets 3
+"""
+from __future__ import annotations
+
+import gc
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+from .calculators.retirement import MonthlyWageData, calculate_retirement
+from .calculators.retirement_batch import calculate_retirement_batch
+from .config.schema import BusinessPayrollConfig, ExcelStructure
+from .excel.mapper import map_to_standard
+from .excel.reader import read_payroll_excel
+from .reports.acquisition import generate_acquisition_report
+from .reports.loss import generate_loss_report
+from .validators.wage_validator import validate_wage_data
+
+
+BENCH_MONTH = "2026-01"
+
+# 합성 원장 레이아웃 (1-indexed 컬럼)
+_HEADER_ROW = 4
+_DATA_START_ROW = 6
+_BASE_COLUMNS = {"name": 2, "residentNo": 4, "joinDate": 5, "leaveDate": 6, "wage": 7}
+_BASE_HEADERS = ["No", "성명", "부서", "주민등록번호", "입사일", "퇴사일", "기본급"]
+
+_SURNAMES = list("김이박최정강조윤장임한오서신권황안송류홍")
+_GIVEN = list("민서지현우진수영준호윤아연은재하도성")
+
+
+# ──────────────────────────────────────────
+# 합성 급여대장
+# ──────────────────────────────────────────
+
+@dataclass
+class LedgerSpec:
+    """합성 급여대장 설정"""
+    rows: int = 10_000
+    extra_columns: int = 10     # 기본 7개 컬럼 뒤에 붙는 수당 컬럼 수
+    dirty_ratio: float = 0.05   # 값을 지저분한 표기로 바꿀 셀 비율
+    sheets: int = 1             # 전체 시트 수 (급여대장 1 + 기타 시트)
+    seed: int = 0
+
+
+def bench_config(spec: LedgerSpec) -> BusinessPayrollConfig:
+    """합성 원장에 맞는 사업장 config"""
+    return BusinessPayrollConfig(
+        businessId="bench",
+        businessName="벤치마크 사업장",
+        excel=ExcelStructure(
+            filePattern="bench_*.xlsx",
+            headerRow=_HEADER_ROW,
+            dataStartRow=_DATA_START_ROW,
+            columns=dict(_BASE_COLUMNS),
+        ),
+    )
+
+
+def _dirty(rng: np.random.Generator, n: int, ratio: float) -> np.ndarray:
+    return rng.random(n) < ratio
+
+
+def _pick(rng: np.random.Generator, options: list) -> object:
+    """options 중 하나 (rng.choice와 달리 원래 타입 유지)"""
+    return options[int(rng.integers(0, len(options)))]
+
+
+def _ledger_values(spec: LedgerSpec, rng: np.random.Generator) -> dict[str, list]:
+    """컬럼별 셀 값 (깨끗한 값 + dirty_ratio 비율의 지저분한 표기)"""
+    n = spec.rows
+    year, month = map(int, BENCH_MONTH.split("-"))
+    month_first = date(year, month, 1)
+
+    names = [
+        _SURNAMES[a] + _GIVEN[b] + _GIVEN[c]
+        for a, b, c in zip(
+            rng.integers(0, len(_SURNAMES), n),
+            rng.integers(0, len(_GIVEN), n),
+            rng.integers(0, len(_GIVEN), n),
+        )
+    ]
+    births = rng.integers(0, 10 ** 6, n)
+    serials = rng.integers(10 ** 6, 10 ** 7, n)
+    residents = [f"{b:06d}-{s:07d}" for b, s in zip(births, serials)]
+
+    # 입사일: 대부분 과거, 일부는 대상 월 입사
+    join_offsets = rng.integers(1, 3650, n)
+    joins = [month_first - timedelta(days=int(d)) for d in join_offsets]
+    new_hire = rng.random(n) < 0.05
+    for i in np.flatnonzero(new_hire):
+        joins[i] = month_first + timedelta(days=int(rng.integers(0, 28)))
+
+    # 퇴사일: 일부만 대상 월 퇴사
+    leaves: list = [None] * n
+    for i in np.flatnonzero(rng.random(n) < 0.05):
+        leaves[i] = month_first + timedelta(days=int(rng.integers(0, 28)))
+
+    wages = [int(w) * 1000 for w in rng.integers(1500, 6000, n)]
+
+    # 지저분한 표기
+    for i in np.flatnonzero(_dirty(rng, n, spec.dirty_ratio)):
+        names[i] = _pick(rng, ["", f" {names[i]} "])
+    for i in np.flatnonzero(_dirty(rng, n, spec.dirty_ratio)):
+        r = residents[i]
+        residents[i] = _pick(rng, [r.replace("-", ""), f" {r} ", int(r.replace("-", "")), "", "미입력"])
+    for i in np.flatnonzero(_dirty(rng, n, spec.dirty_ratio)):
+        d = joins[i]
+        joins[i] = _pick(rng, [
+            d.strftime("%Y.%m.%d"), d.strftime("%Y%m%d"), f"{d.year}-{d.month}-{d.day}",
+            (d - date(1899, 12, 30)).days, "", "-",
+        ])
+    for i in np.flatnonzero(_dirty(rng, n, spec.dirty_ratio)):
+        w = wages[i]
+        wages[i] = _pick(rng, [f"{w:,}", f"{w:,}원", float(w) + 0.4, "", "N/A", -w])
+
+    values: dict[str, list] = {
+        "name": names,
+        "residentNo": residents,
+        "joinDate": joins,
+        "leaveDate": leaves,
+        "wage": wages,
+    }
+    for k in range(spec.extra_columns):
+        values[f"extra{k}"] = [int(v) for v in rng.integers(0, 300, n) * 1000]
+    return values
+
+
+def generate_ledger(spec: LedgerSpec, path: str | Path) -> BusinessPayrollConfig:
+    """
+    합성 급여대장 xlsx 생성.
+    급여대장 시트("임금대장")는 마지막 시트. Returns 해당 원장용 config
+    """
+    rng = np.random.default_rng(spec.seed)
+    values = _ledger_values(spec, rng)
+
+    wb = Workbook(write_only=True)
+    for k in range(max(spec.sheets, 1) - 1):
+        ws = wb.create_sheet(f"요약{k + 1}")
+        ws.append(["구분", "인원", "금액"])
+        for j in range(20):
+            ws.append([f"항목{j}", j, j * 1000])
+
+    ws = wb.create_sheet("임금대장")
+    headers = _BASE_HEADERS + [f"수당{k + 1}" for k in range(spec.extra_columns)]
+    ws.append([f"{BENCH_MONTH} 임금대장"])
+    ws.append([])
+    ws.append([])
+    ws.append(headers)
+    ws.append([])
+    extras = [values[f"extra{k}"] for k in range(spec.extra_columns)]
+    for i in range(spec.rows):
+        ws.append([
+            i + 1,
+            values["name"][i],
+            "홀",
+            values["residentNo"][i],
+            values["joinDate"][i],
+            values["leaveDate"][i],
+            values["wage"][i],
+            *(col[i] for col in extras),
+        ])
+    wb.save(path)
+    return bench_config(spec)
+
+
+# ──────────────────────────────────────────
+# 측정
+# ──────────────────────────────────────────
+
+@dataclass
+class StageResult:
+    """단계별 측정 결과"""
+    stage: str
+    rows: int
+    seconds: float          # repeat 회 중 최소
+    rows_per_sec: float
+    peak_mb: float          # tracemalloc 기준 최대 할당량
+
+
+def _measure(stage: str, rows: int, fn: Callable[[], object], repeat: int) -> tuple[StageResult, object]:
+    """repeat 회 실행 최소 시간 + 별도 1회 실행의 최대 메모리"""
+    best = float("inf")
+    result = None
+    for _ in range(max(repeat, 1)):
+        gc.collect()
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return StageResult(
+        stage=stage,
+        rows=rows,
+        seconds=best,
+        rows_per_sec=rows / best if best > 0 else 0.0,
+        peak_mb=peak / (1024 * 1024),
+    ), result
+
+
+def _retirement_inputs(mapped: pd.DataFrame) -> tuple[pd.Series, pd.Series, pd.DataFrame]:
+    """입사일이 있는 근로자 전원을 대상 월 말 퇴사로 가정한 퇴직금 입력 (3개월 동일 급여)"""
+    year, month = map(int, BENCH_MONTH.split("-"))
+    month_end = (pd.Timestamp(year, month, 1) + pd.offsets.MonthEnd(0)).strftime("%Y-%m-%d")
+
+    def iso_date(col: pd.Series) -> pd.Series:
+        return pd.to_datetime(col, format="%Y-%m-%d", errors="coerce").notna()
+
+    targets = mapped[iso_date(mapped["joinDate"])].reset_index(drop=True)
+    joins = targets["joinDate"].astype(str)
+    leaves = targets["leaveDate"].where(iso_date(targets["leaveDate"]), month_end).astype(str)
+
+    months = [(pd.Period(BENCH_MONTH, "M") - k).strftime("%Y-%m") for k in range(3)]
+    wage = pd.to_numeric(targets["wage"], errors="coerce").fillna(0).astype("int64")
+    wages = pd.DataFrame({
+        "worker_id": np.repeat(np.arange(len(targets)), len(months)),
+        "year_month": np.tile(months, len(targets)),
+        "total_wage": np.repeat(wage.to_numpy(), len(months)),
+    })
+    return joins, leaves, wages
+
+
+def run_benchmark(
+    spec: LedgerSpec,
+    repeat: int = 3,
+    workdir: str | Path | None = None,
+) -> list[StageResult]:
+    """
+    합성 원장 생성 후 단계별 측정.
+    workdir를 주면 원장 파일을 그곳에 남김 (기본: 임시 디렉토리에서 삭제)
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(workdir) if workdir else Path(tmp)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"bench_{spec.rows}r_{spec.sheets}s.xlsx"
+        config = generate_ledger(spec, path)
+
+        results: list[StageResult] = []
+
+        r, raw = _measure("read", spec.rows, lambda: read_payroll_excel(path, config), repeat)
+        results.append(r)
+
+        r, mapped = _measure("map", len(raw), lambda: map_to_standard(raw, config), repeat)
+        results.append(r)
+
+        r, _ = _measure("validate", len(mapped), lambda: validate_wage_data(mapped), repeat)
+        results.append(r)
+
+        def reports():
+            generate_acquisition_report(mapped, config, BENCH_MONTH)
+            generate_loss_report(mapped, config, BENCH_MONTH)
+
+        r, _ = _measure("reports", len(mapped), reports, repeat)
+        results.append(r)
+
+        joins, leaves, wages = _retirement_inputs(mapped)
+        by_worker = [
+            [MonthlyWageData(ym, int(w)) for ym, w in zip(g["year_month"], g["total_wage"])]
+            for _, g in wages.groupby("worker_id", sort=True)
+        ]
+
+        def retirement():
+            return [
+                calculate_retirement(j, lv, w)
+                for j, lv, w in zip(joins, leaves, by_worker)
+            ]
+
+        r, _ = _measure("retirement", len(joins), retirement, repeat)
+        results.append(r)
+
+        r, _ = _measure(
+            "retirement_batch", len(joins),
+            lambda: calculate_retirement_batch(joins, leaves, wages),
+            repeat,
+        )
+        results.append(r)
+
+    return results
+
+
+def format_results(spec: LedgerSpec, results: list[StageResult]) -> str:
+    """측정 결과 표"""
+    lines = [
+        f"=== 벤치마크: {spec.rows:,}행 / 추가컬럼 {spec.extra_columns} / "
+        f"dirty {spec.dirty_ratio:.0%} / 시트 {spec.sheets} ===",
+        f"  {'단계':<18}{'행':>10}{'시간(s)':>11}{'행/초':>14}{'최대메모리(MB)':>16}",
+    ]
+    for r in results:
+        lines.append(
+            f"  {r.stage:<18}{r.rows:>10,}{r.seconds:>11.4f}{r.rows_per_sec:>14,.0f}{r.peak_mb:>16.1f}"
+        )
+    return "\n".join(lines)
+
+
+def results_to_dict(spec: LedgerSpec, results: list[StageResult]) -> dict:
+    """JSON 출력용"""
+    return {"spec": asdict(spec), "stages": [asdict(r) for r in results]}
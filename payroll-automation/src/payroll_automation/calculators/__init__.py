@@ -1 +1,5 @@
 from .retirement import calculate_retirement
+from .retirement_batch import calculate_retirement_batch
+from .tax_exempt import split_tax_exempt
+from .insurance import calculate_insurance
+from .retirement_projection import project_retirement_accrual
@@ -0,0 +1,154 @@
+"""
+4대보험료 산정 모듈
+국민연금/건강보험/장기요양보험/고용보험 근로자·사업주 부담분을
+사업장 월 원장 전체에 대해 배열 연산으로 한 번에 계산
+- 요율표: constants.INSURANCE_RATES_BY_YEAR (constants.ts와 동일)
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from ..constants import get_insurance_rates
+
+
+EmployerTier = Literal["under_150", "150_priority", "150_to_1000", "over_1000"]
+
+# 고용보험 사업주 추가 요율 키 (고용안정/직업능력개발, 사업장 규모별)
+_EI_TIER_KEYS: dict[str, str] = {
+    "under_150": "EI_EMPLOYER_UNDER_150",
+    "150_priority": "EI_EMPLOYER_150_PRIORITY",
+    "150_to_1000": "EI_EMPLOYER_150_TO_1000",
+    "over_1000": "EI_EMPLOYER_OVER_1000",
+}
+
+# 요율은 백만분율 정수로 변환해 정수 연산 (부동소수점 절사 오차 방지)
+_PPM = 1_000_000
+
+RESULT_COLUMNS = [
+    "nps_base",
+    "nps", "nhic", "ltc", "ei", "employee_total",
+    "nps_employer", "nhic_employer", "ltc_employer", "ei_employer", "employer_total",
+]
+
+
+@dataclass(frozen=True)
+class InsuranceRateTable:
+    """연도별 요율 (백만분율 정수) 및 국민연금 기준소득월액 상/하한"""
+    year: int
+    nps_employee: int
+    nps_employer: int
+    nps_upper: int
+    nps_lower: int
+    nhic_employee: int
+    nhic_employer: int
+    ltc: int
+    ei_employee: int
+    ei_employer: dict[str, int]     # 규모 구분 → 사업주 요율 (기본 + 추가)
+
+
+def _ppm(rate: float) -> int:
+    return int(round(rate * _PPM))
+
+
+@lru_cache(maxsize=None)
+def get_rate_table(year: int) -> InsuranceRateTable:
+    """연도별 요율표 (연도당 한 번만 생성)"""
+    r = get_insurance_rates(year)
+    base = _ppm(r["EI_EMPLOYER_BASE"])
+    return InsuranceRateTable(
+        year=year,
+        nps_employee=_ppm(r["NPS_EMPLOYEE"]),
+        nps_employer=_ppm(r["NPS_EMPLOYER"]),
+        nps_upper=int(r["NPS_UPPER_LIMIT"]),
+        nps_lower=int(r["NPS_LOWER_LIMIT"]),
+        nhic_employee=_ppm(r["NHIC_EMPLOYEE"]),
+        nhic_employer=_ppm(r["NHIC_EMPLOYER"]),
+        ltc=_ppm(r["LTC_RATE"]),
+        ei_employee=_ppm(r["EI_EMPLOYEE"]),
+        ei_employer={tier: base + _ppm(r[key]) for tier, key in _EI_TIER_KEYS.items()},
+    )
+
+
+def _premium(base: np.ndarray, rate_ppm: int) -> np.ndarray:
+    """보험료 = 기준금액 × 요율, 10원 미만 절사"""
+    return base * rate_ppm // _PPM // 10 * 10
+
+
+def calculate_insurance(
+    df: pd.DataFrame,
+    year: int | None = None,
+    year_month: str | None = None,
+    wage_field: str = "wage",
+    employer_tier: EmployerTier = "under_150",
+) -> pd.DataFrame:
+    """
+    월 원장 전체의 4대보험료 계산.
+
+    - 국민연금: 기준소득월액 = 월 보수(천원 미만 절사)를 하한~상한으로 제한
+    - 건강보험: 월 보수 × 요율
+    - 장기요양보험: 건강보험료 × 장기요양 요율
+    - 고용보험: 월 보수 × 요율 (사업주는 기본 + 규모별 추가 요율)
+    - 보험료는 10원 미만 절사. 월 보수가 0 이하/비숫자인 행은 모두 0
+
+    Parameters
+    ----------
+    df : 표준 필드명 DataFrame (map_to_standard 출력)
+    year : 요율 연도 (없으면 year_month의 연도, 둘 다 없으면 올해)
+    year_month : 대상 월 (YYYY-MM)
+    wage_field : 월 보수 컬럼
+    employer_tier : 고용보험 사업주 규모 구분
+
+    Returns
+    -------
+    df와 같은 인덱스, RESULT_COLUMNS 컬럼의 DataFrame (원 단위 정수)
+    """
+    if year is None and year_month:
+        year = int(year_month[:4])
+    if employer_tier not in _EI_TIER_KEYS:
+        raise ValueError(f"지원하지 않는 employer_tier: {employer_tier}")
+    table = get_rate_table(year or pd.Timestamp.today().year)
+
+    if wage_field in df.columns:
+        wage = pd.to_numeric(df[wage_field], errors="coerce").fillna(0).to_numpy()
+        wage = np.maximum(np.floor(wage), 0).astype(np.int64)
+    else:
+        wage = np.zeros(len(df), dtype=np.int64)
+    insured = wage > 0
+
+    nps_base = np.where(
+        insured,
+        np.clip(wage // 1000 * 1000, table.nps_lower, table.nps_upper),
+        0,
+    )
+    nps = _premium(nps_base, table.nps_employee)
+    nps_employer = _premium(nps_base, table.nps_employer)
+
+    nhic = _premium(wage, table.nhic_employee)
+    nhic_employer = _premium(wage, table.nhic_employer)
+    ltc = _premium(nhic, table.ltc)
+    ltc_employer = _premium(nhic_employer, table.ltc)
+
+    ei = _premium(wage, table.ei_employee)
+    ei_employer = _premium(wage, table.ei_employer[employer_tier])
+
+    return pd.DataFrame(
+        {
+            "nps_base": nps_base,
+            "nps": nps,
+            "nhic": nhic,
+            "ltc": ltc,
+            "ei": ei,
+            "employee_total": nps + nhic + ltc + ei,
+            "nps_employer": nps_employer,
+            "nhic_employer": nhic_employer,
+            "ltc_employer": ltc_employer,
+            "ei_employer": ei_employer,
+            "employer_total": nps_employer + nhic_employer + ltc_employer + ei_employer,
+        },
+        index=df.index,
+    )
@@ -12,6 +12,8 @@ from datetime import date, datetime, timedelta
 
 from dateutil.relativedelta import relativedelta
 
+from .tax_tables import get_tax_table
+
 
 @dataclass
 class RetirementResult:
@@ -166,21 +168,13 @@ def truncate_to_10(amount: float) -> int:
 
 
 # ──────────────────────────────────────────
-# 퇴직소득세 계산 (2026년 기준)
+# 퇴직소득세 계산 (귀속연도별 구간표: tax_tables)
 # ──────────────────────────────────────────
 
-def get_service_year_deduction(service_years: float) -> int:
+def get_service_year_deduction(service_years: float, tax_year: int | None = None) -> int:
     """근속연수공제 (소득세법 시행령 별표2)"""
     years = math.ceil(service_years)  # 1년 미만 올림
-
-    if years <= 5:
-        return years * 1_000_000
-    elif years <= 10:
-        return 5_000_000 + (years - 5) * 2_000_000
-    elif years <= 20:
-        return 15_000_000 + (years - 10) * 2_500_000
-    else:
-        return 40_000_000 + (years - 20) * 3_000_000
+    return get_tax_table(tax_year).service_year_deduction(years)
 
 
 def get_converted_income(after_deduction: int, service_years: float) -> int:
@@ -191,38 +185,25 @@ def get_converted_income(after_deduction: int, service_years: float) -> int:
     return round((after_deduction * 12) / years)
 
 
-def _get_tax_rate(converted_income: int) -> tuple[float, int]:
-    """환산급여 기준 소득세율표 (2025년 기준, 소득세법 제55조)"""
-    if converted_income <= 14_000_000:
-        return 0.06, 0
-    elif converted_income <= 50_000_000:
-        return 0.15, 1_260_000
-    elif converted_income <= 88_000_000:
-        return 0.24, 5_760_000
-    elif converted_income <= 150_000_000:
-        return 0.35, 15_440_000
-    elif converted_income <= 300_000_000:
-        return 0.38, 19_940_000
-    elif converted_income <= 500_000_000:
-        return 0.40, 25_940_000
-    elif converted_income <= 1_000_000_000:
-        return 0.42, 35_940_000
-    else:
-        return 0.45, 65_940_000
+def _get_tax_rate(converted_income: int, tax_year: int | None = None) -> tuple[float, int]:
+    """환산급여 기준 소득세율표 (소득세법 제55조) → (세율, 누진공제)"""
+    return get_tax_table(tax_year).tax_bracket(converted_income)
 
 
 def calculate_retirement_tax(
     retirement_pay: int,
     service_years: float,
+    tax_year: int | None = None,
 ) -> tuple[int, int, int, int, int]:
     """
-    퇴직소득세 계산 (2026년 기준).
+    퇴직소득세 계산 (tax_year 귀속연도 구간표, 없으면 최신 표).
     Returns (retirement_tax, local_tax, taxable_income, converted_income, converted_deduction)
     """
+    table = get_tax_table(tax_year)
     years = math.ceil(service_years)
 
     # 1. 근속연수공제
-    syd = get_service_year_deduction(service_years)
+    syd = table.service_year_deduction(years)
 
     # 2. 환산급여
     after_deduction = max(0, retirement_pay - syd)
@@ -230,22 +211,13 @@ def calculate_retirement_tax(
 
     # 3. 환산급여공제
     ci = converted_income
-    if ci <= 8_000_000:
-        converted_deduction = ci
-    elif ci <= 70_000_000:
-        converted_deduction = 8_000_000 + int((ci - 8_000_000) * 0.6)
-    elif ci <= 100_000_000:
-        converted_deduction = 45_200_000 + int((ci - 70_000_000) * 0.55)
-    elif ci <= 300_000_000:
-        converted_deduction = 61_700_000 + int((ci - 100_000_000) * 0.45)
-    else:
-        converted_deduction = 151_700_000 + int((ci - 300_000_000) * 0.35)
+    converted_deduction = table.converted_deduction(ci)
 
     # 4. 과세표준
     taxable_income = max(0, ci - converted_deduction)
 
     # 5. 환산산출세액
-    rate, deduction = _get_tax_rate(taxable_income)
+    rate, deduction = table.tax_bracket(taxable_income)
     converted_tax = max(0, taxable_income * rate - deduction)
 
     # 6. 퇴직소득세 (10원 미만 절사)
@@ -289,9 +261,11 @@ def calculate_retirement(
 
     retirement_pay = calculate_retirement_pay(avg_daily_wage, total_days)
 
-    syd = get_service_year_deduction(total_years)
+    # 퇴직소득 귀속연도 = 퇴사 연도
+    tax_year = int(leave_date[:4])
+    syd = get_service_year_deduction(total_years, tax_year)
     ret_tax, local_tax, taxable, converted, conv_deduction = calculate_retirement_tax(
-        retirement_pay, total_years
+        retirement_pay, total_years, tax_year
     )
 
     net_pay = retirement_pay - ret_tax - local_tax
@@ -0,0 +1,281 @@
+"""
+퇴직금 일괄 산정 모듈
+여러 근로자의 퇴직금을 NumPy 배열 연산으로 한 번에 계산
+- 결과는 calculators.retirement.calculate_retirement와 동일 (스칼라 버전이 기준 구현)
+"""
+from __future__ import annotations
+
+from dataclasses import fields
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from .retirement import RetirementResult
+from .tax_tables import RetirementTaxTable, get_tax_table
+
+
+# 결과 컬럼 순서 = RetirementResult 필드 순서
+RESULT_COLUMNS = [f.name for f in fields(RetirementResult)]
+
+# 긴 형식(long format) 급여 테이블 컬럼
+WAGE_COLUMNS = ("worker_id", "year_month", "total_wage")
+
+
+def _round(x: np.ndarray) -> np.ndarray:
+    """Python round()와 동일한 반올림 (half-to-even) → int64"""
+    return np.round(x).astype(np.int64)
+
+
+def _truncate_to_10(amount: np.ndarray) -> np.ndarray:
+    """10원 단위 절사 (retirement.truncate_to_10 벡터화)"""
+    return (np.floor(amount / 10) * 10).astype(np.int64)
+
+
+# ──────────────────────────────────────────
+# 날짜 헬퍼 (datetime64[D] 배열)
+# ──────────────────────────────────────────
+
+def _parse_dates(values: np.ndarray) -> np.ndarray:
+    """YYYY-MM-DD 문자열 배열 → datetime64[D] (빈값/형식 오류 → NaT)"""
+    parsed = pd.to_datetime(pd.Series(values, dtype=object), format="%Y-%m-%d", errors="coerce")
+    return parsed.to_numpy(dtype="datetime64[D]")
+
+
+def _month_index(days: np.ndarray) -> np.ndarray:
+    """datetime64[D] → 연속 월 번호 (year * 12 + month - 1)"""
+    return days.astype("datetime64[M]").astype(np.int64) + 1970 * 12
+
+
+def _month_first(month_idx: np.ndarray) -> np.ndarray:
+    """월 번호 → 해당 월 1일 (datetime64[D])"""
+    return (month_idx - 1970 * 12).astype("datetime64[M]").astype("datetime64[D]")
+
+
+def _days_in_month(month_idx: np.ndarray) -> np.ndarray:
+    """월 번호 → 해당 월 총 달력 일수"""
+    return (_month_first(month_idx + 1) - _month_first(month_idx)).astype(np.int64)
+
+
+def _minus_months(days: np.ndarray, months: int) -> np.ndarray:
+    """relativedelta(months=-n)과 동일 (말일 초과 시 해당 월 말일로 보정)"""
+    month_idx = _month_index(days)
+    target = month_idx - months
+    day_of_month = (days - _month_first(month_idx)).astype(np.int64)
+    day_of_month = np.minimum(day_of_month, _days_in_month(target) - 1)
+    return _month_first(target) + day_of_month
+
+
+# ──────────────────────────────────────────
+# 최근 3개월 급여 (일할계산)
+# ──────────────────────────────────────────
+
+def _wage_lookup(
+    wages: pd.DataFrame,
+    ids: pd.Index,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    긴 형식 급여 테이블 → 정렬된 (근로자 위치, 월 번호) 키와 급여 배열.
+    같은 (근로자, 월)이 여러 번 있으면 마지막 값 사용 (스칼라 버전의 dict 동작과 동일).
+    """
+    missing = [c for c in WAGE_COLUMNS if c not in wages.columns]
+    if missing:
+        raise ValueError(f"급여 테이블 컬럼 누락: {missing}")
+
+    pos = ids.get_indexer(wages["worker_id"])
+    ym = pd.to_datetime(wages["year_month"].astype(str), format="%Y-%m", errors="coerce")
+    ok = (pos >= 0) & ym.notna().to_numpy()
+    if not ok.any():
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    month_idx = _month_index(ym.to_numpy(dtype="datetime64[D]")[ok])
+    keys = pos[ok].astype(np.int64) * 1_000_000 + month_idx
+    amounts = pd.to_numeric(wages["total_wage"], errors="coerce").fillna(0).to_numpy()[ok]
+
+    # 마지막 값 우선: 역순으로 뒤집은 뒤 첫 등장만 남김
+    keys_rev, amounts_rev = keys[::-1], amounts[::-1]
+    uniq, first = np.unique(keys_rev, return_index=True)
+    return uniq, amounts_rev[first].astype(np.int64)
+
+
+def _last_3months(
+    pos: np.ndarray,
+    leave: np.ndarray,
+    keys: np.ndarray,
+    amounts: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    get_last_3months_data 벡터화 버전.
+    산정 기간(퇴직일 전날부터 역산 3개월)에 걸치는 최대 4개 월을 열 단위로 계산.
+    Returns (wages, days)
+    """
+    period_end = leave - np.timedelta64(1, "D")
+    period_start = _minus_months(period_end, 3) + np.timedelta64(1, "D")
+    total_days = (period_end - period_start).astype(np.int64) + 1
+
+    start_month = _month_index(period_start)
+    end_month = _month_index(period_end)
+    total_wages = np.zeros(len(leave), dtype=np.int64)
+
+    for k in range(4):
+        month_idx = start_month + k
+        in_period = month_idx <= end_month
+
+        month_total_days = _days_in_month(month_idx)
+        first = np.maximum(period_start, _month_first(month_idx))
+        last = np.minimum(period_end, _month_first(month_idx + 1) - np.timedelta64(1, "D"))
+        included_days = (last - first).astype(np.int64) + 1
+
+        month_wage = np.zeros(len(leave), dtype=np.int64)
+        if len(keys):
+            wanted = pos * 1_000_000 + month_idx
+            at = np.minimum(np.searchsorted(keys, wanted), len(keys) - 1)
+            found = keys[at] == wanted
+            month_wage[found] = amounts[at[found]]
+
+        full = included_days >= month_total_days
+        pro_rata = _round(month_wage * included_days / month_total_days)
+        total_wages += np.where(in_period, np.where(full, month_wage, pro_rata), 0)
+
+    return total_wages, total_days
+
+
+# ──────────────────────────────────────────
+# 퇴직소득세 (귀속연도별 구간표: tax_tables)
+# ──────────────────────────────────────────
+
+def _retirement_tax(
+    retirement_pay: np.ndarray,
+    years: np.ndarray,
+    table: RetirementTaxTable,
+) -> dict[str, np.ndarray]:
+    """calculate_retirement_tax 벡터화 (years = 올림된 근속연수)"""
+    syd = table.service_year_deduction_array(years)
+    after_deduction = np.maximum(0, retirement_pay - syd)
+    converted = np.where(
+        years == 0, 0, _round(after_deduction * 12 / np.maximum(years, 1))
+    )
+    conv_deduction = table.converted_deduction_array(converted)
+    taxable = np.maximum(0, converted - conv_deduction)
+    rate, progressive = table.tax_bracket_array(taxable)
+    converted_tax = np.maximum(0, taxable * rate - progressive)
+    ret_tax = _truncate_to_10((converted_tax * years) / 12)
+    return {
+        "service_year_deduction": syd,
+        "converted_income": converted,
+        "converted_deduction": conv_deduction,
+        "taxable_income": taxable,
+        "retirement_tax": ret_tax,
+        "local_tax": _truncate_to_10(ret_tax * 0.1),
+    }
+
+
+def _retirement_tax_by_year(
+    retirement_pay: np.ndarray,
+    years: np.ndarray,
+    leave_year: np.ndarray,
+    tax_year: int | None = None,
+) -> dict[str, np.ndarray]:
+    """근로자별 귀속연도(leave_year) 구간표로 계산 (같은 구간표끼리 묶어 한 번에)"""
+    if tax_year is not None or len(retirement_pay) == 0:
+        return _retirement_tax(retirement_pay, years, get_tax_table(tax_year))
+
+    groups: dict[RetirementTaxTable, list[int]] = {}
+    for y in np.unique(leave_year).tolist():
+        groups.setdefault(get_tax_table(y), []).append(y)
+    tax: dict[str, np.ndarray] = {}
+    for table, group_years in groups.items():
+        part = np.isin(leave_year, group_years)
+        for name, values in _retirement_tax(retirement_pay[part], years[part], table).items():
+            tax.setdefault(name, np.zeros(len(retirement_pay), dtype=np.int64))[part] = values
+    return tax
+
+
+# ──────────────────────────────────────────
+# 일괄 퇴직금 산정
+# ──────────────────────────────────────────
+
+def calculate_retirement_batch(
+    join_dates: Sequence[str] | pd.Series,
+    leave_dates: Sequence[str] | pd.Series,
+    wages: pd.DataFrame,
+    worker_ids: Sequence | pd.Index | None = None,
+    tax_year: int | None = None,
+) -> pd.DataFrame:
+    """
+    여러 근로자의 퇴직금을 한 번에 계산.
+
+    Parameters
+    ----------
+    join_dates : 입사일 배열 (YYYY-MM-DD)
+    leave_dates : 퇴사일 배열 (YYYY-MM-DD)
+    wages : 긴 형식 급여 테이블 [worker_id, year_month(YYYY-MM), total_wage]
+    worker_ids : 근로자 식별자 배열 (없으면 0..n-1 위치 번호)
+    tax_year : 퇴직소득세 구간표 귀속연도 (없으면 근로자별 퇴사 연도)
+
+    Returns
+    -------
+    worker_id 인덱스, RetirementResult 필드 컬럼의 DataFrame.
+    calculate_retirement가 None을 반환하는 근로자
+    (날짜 누락/형식 오류, 1년 미만 근속)는 결과에서 제외.
+    """
+    join_raw = np.asarray(join_dates, dtype=object)
+    leave_raw = np.asarray(leave_dates, dtype=object)
+    join = _parse_dates(join_raw)
+    leave = _parse_dates(leave_raw)
+    if len(join) != len(leave):
+        raise ValueError("join_dates와 leave_dates의 길이가 다릅니다")
+
+    ids = pd.Index(range(len(join)) if worker_ids is None else worker_ids, name="worker_id")
+    if len(ids) != len(join):
+        raise ValueError("worker_ids와 날짜 배열의 길이가 다릅니다")
+    if not ids.is_unique:
+        raise ValueError("worker_ids에 중복이 있습니다")
+
+    # 수급 자격 (1년 이상 근속) - 날짜가 유효한 근로자만
+    valid = ~np.isnat(join) & ~np.isnat(leave)
+    eligible = np.zeros(len(join), dtype=bool)
+    eligible[valid] = (leave[valid] - join[valid]).astype(np.int64) >= 365
+
+    sel = np.flatnonzero(eligible)
+    join, leave = join[sel], leave[sel]
+
+    # 근속
+    total_days = (leave - join).astype(np.int64) + 1
+    total_years = total_days / 365
+
+    # 평균임금
+    keys, amounts = _wage_lookup(wages, ids)
+    last_3m_wages, last_3m_days = _last_3months(sel.astype(np.int64), leave, keys, amounts)
+    avg_daily_wage = _round(last_3m_wages / last_3m_days)
+
+    # 퇴직금
+    retirement_pay = _round(avg_daily_wage * 30 * (total_days / 365))
+
+    # 퇴직소득세 (귀속연도 = tax_year 또는 퇴사 연도)
+    years = np.ceil(total_years).astype(np.int64)
+    leave_year = leave.astype("datetime64[Y]").astype(np.int64) + 1970
+    tax = _retirement_tax_by_year(retirement_pay, years, leave_year, tax_year)
+    ret_tax, local_tax = tax["retirement_tax"], tax["local_tax"]
+
+    result = pd.DataFrame(
+        {
+            "join_date": join_raw[sel],
+            "leave_date": leave_raw[sel],
+            "total_days": total_days,
+            "total_years": total_years,
+            "last_3months_wages": last_3m_wages,
+            "last_3months_days": last_3m_days,
+            "average_daily_wage": avg_daily_wage,
+            "retirement_pay": retirement_pay,
+            "service_year_deduction": tax["service_year_deduction"],
+            "converted_income": tax["converted_income"],
+            "converted_deduction": tax["converted_deduction"],
+            "taxable_income": tax["taxable_income"],
+            "retirement_tax": ret_tax,
+            "local_tax": local_tax,
+            "net_retirement_pay": retirement_pay - ret_tax - local_tax,
+        },
+        index=ids[sel],
+    )
+    return result[RESULT_COLUMNS]
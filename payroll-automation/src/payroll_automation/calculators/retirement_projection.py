@@ -0,0 +1,194 @@
+"""
+퇴직급여 충당 추계 모듈
+재직 근로자 전원이 향후 N개월의 각 월말에 퇴사한다고 가정한 퇴직금/퇴직소득세 추계
+- 월말별 결과는 calculate_retirement(입사일, 월말, 급여)와 동일
+- 날짜마다 처음부터 다시 계산하지 않고, 급여를 (근로자 × 월) 행렬로 한 번 만든 뒤
+  근속일수는 월말 간격만큼 누적, 최근 3개월 급여는 누적합으로 구간을 밀어가며 계산
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from .retirement_batch import (
+    RESULT_COLUMNS,
+    _days_in_month,
+    _minus_months,
+    _month_first,
+    _month_index,
+    _parse_dates,
+    _retirement_tax_by_year,
+    _round,
+    _wage_lookup,
+)
+
+
+def _month_ends(start_month: str, months: int) -> np.ndarray:
+    """start_month부터 months개 월의 말일 (datetime64[D])"""
+    try:
+        first = np.datetime64(start_month, "M")
+    except ValueError:
+        raise ValueError(f"start_month 형식 오류 (YYYY-MM): {start_month}") from None
+    month_idx = _month_index(first.astype("datetime64[D]")) + np.arange(months)
+    return _month_first(month_idx + 1) - np.timedelta64(1, "D")
+
+
+def _wage_matrix(
+    wages: pd.DataFrame,
+    ids: pd.Index,
+    first_month: int,
+    n_months: int,
+    carry_forward: bool,
+) -> np.ndarray:
+    """
+    긴 형식 급여 테이블 → (근로자 × 월) 급여 행렬 (first_month부터 n_months개 월).
+    carry_forward이면 근로자별 마지막 급여 기록 이후 월은 그 급여로 채움.
+    """
+    matrix = np.zeros((len(ids), n_months), dtype=np.int64)
+    keys, amounts = _wage_lookup(wages, ids)
+    if not len(keys):
+        return matrix
+
+    pos, month = np.divmod(keys, 1_000_000)
+    col = month - first_month
+    inside = (col >= 0) & (col < n_months)
+    matrix[pos[inside], col[inside]] = amounts[inside]
+
+    if carry_forward:
+        # keys는 (근로자, 월) 순으로 정렬 → 근로자별 마지막 원소가 최근 기록
+        last = np.flatnonzero(np.r_[pos[1:] != pos[:-1], True])
+        after = np.arange(n_months) > (month[last] - first_month)[:, None]
+        rows = np.broadcast_to(amounts[last][:, None], after.shape)
+        matrix[pos[last]] = np.where(after, rows, matrix[pos[last]])
+    return matrix
+
+
+def _window_wages(
+    matrix: np.ndarray,
+    first_month: int,
+    leave: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    월말(leave)별 최근 3개월 급여 합계 (_last_3months의 열 단위 버전).
+    구간 양 끝 월만 일할계산하고 사이 월은 누적합 차이로 구함.
+    Returns (wages[근로자, 월말], days[월말])
+    """
+    period_end = leave - np.timedelta64(1, "D")
+    period_start = _minus_months(period_end, 3) + np.timedelta64(1, "D")
+    total_days = (period_end - period_start).astype(np.int64) + 1
+
+    start_month = _month_index(period_start)
+    end_month = _month_index(period_end)
+    cumsum = np.zeros((matrix.shape[0], matrix.shape[1] + 1), dtype=np.int64)
+    np.cumsum(matrix, axis=1, out=cumsum[:, 1:])
+
+    def edge(month_idx: np.ndarray, first: np.ndarray, last: np.ndarray) -> np.ndarray:
+        month_total_days = _days_in_month(month_idx)
+        included_days = (last - first).astype(np.int64) + 1
+        month_wage = matrix[:, month_idx - first_month]
+        pro_rata = _round(month_wage * included_days / month_total_days)
+        return np.where(included_days >= month_total_days, month_wage, pro_rata)
+
+    head = edge(start_month, period_start, _month_first(start_month + 1) - np.timedelta64(1, "D"))
+    tail = edge(end_month, _month_first(end_month), period_end)
+    middle = cumsum[:, end_month - first_month] - cumsum[:, start_month - first_month + 1]
+    return head + middle + tail, total_days
+
+
+def project_retirement_accrual(
+    join_dates: Sequence[str] | pd.Series,
+    wages: pd.DataFrame,
+    start_month: str,
+    months: int,
+    worker_ids: Sequence | pd.Index | None = None,
+    carry_forward: bool = True,
+    tax_year: int | None = None,
+) -> pd.DataFrame:
+    """
+    재직 근로자의 월말별 퇴직금 추계.
+
+    start_month부터 months개 월의 각 말일을 퇴사일로 가정하여
+    calculate_retirement와 같은 규칙으로 퇴직금/퇴직소득세/실수령액을 계산.
+
+    Parameters
+    ----------
+    join_dates : 입사일 배열 (YYYY-MM-DD)
+    wages : 긴 형식 급여 테이블 [worker_id, year_month(YYYY-MM), total_wage]
+    start_month : 첫 추계 월 (YYYY-MM)
+    months : 추계 개월 수
+    worker_ids : 근로자 식별자 배열 (없으면 0..n-1 위치 번호)
+    carry_forward : 급여 기록이 끝난 이후 월은 마지막 급여가 유지된다고 가정
+                    (False면 기록 없는 월은 0원 - calculate_retirement와 동일)
+    tax_year : 퇴직소득세 구간표 귀속연도 (없으면 각 월말의 연도)
+
+    Returns
+    -------
+    (worker_id, year_month) 인덱스, RetirementResult 필드 컬럼의 DataFrame.
+    해당 월말 기준 날짜 누락/형식 오류, 1년 미만 근속인 (근로자, 월)은 제외.
+    """
+    if months < 1:
+        raise ValueError(f"months는 1 이상이어야 합니다: {months}")
+
+    join_raw = np.asarray(join_dates, dtype=object)
+    join = _parse_dates(join_raw)
+    ids = pd.Index(range(len(join)) if worker_ids is None else worker_ids, name="worker_id")
+    if len(ids) != len(join):
+        raise ValueError("worker_ids와 join_dates의 길이가 다릅니다")
+    if not ids.is_unique:
+        raise ValueError("worker_ids에 중복이 있습니다")
+
+    leave = _month_ends(start_month, months)
+
+    # 누적 근속: 근로자 × 월말 (입사일 누락은 자격 없음으로 처리)
+    valid = ~np.isnat(join)
+    join_days = np.where(valid, join, leave[0]).astype(np.int64)
+    elapsed = leave.astype(np.int64)[None, :] - join_days[:, None]
+    eligible = valid[:, None] & (elapsed >= 365)
+    total_days = elapsed + 1
+
+    # 최근 3개월 급여: 첫 월말의 산정 시작 월 ~ 마지막 월
+    first_month = int(_month_index(leave[:1])[0]) - 3
+    matrix = _wage_matrix(wages, ids, first_month, months + 3, carry_forward)
+    window_wages, window_days = _window_wages(matrix, first_month, leave)
+
+    worker_pos, month_pos = np.nonzero(eligible)
+    total_days = total_days[worker_pos, month_pos]
+    total_years = total_days / 365
+    last_3m_wages = window_wages[worker_pos, month_pos]
+    last_3m_days = window_days[month_pos]
+    avg_daily_wage = _round(last_3m_wages / last_3m_days)
+    retirement_pay = _round(avg_daily_wage * 30 * (total_days / 365))
+
+    years = np.ceil(total_years).astype(np.int64)
+    leave_year = leave.astype("datetime64[Y]").astype(np.int64)[month_pos] + 1970
+    tax = _retirement_tax_by_year(retirement_pay, years, leave_year, tax_year)
+    ret_tax, local_tax = tax["retirement_tax"], tax["local_tax"]
+
+    leave_str = np.datetime_as_string(leave, unit="D").astype(object)
+    month_str = np.datetime_as_string(leave, unit="M").astype(object)
+    result = pd.DataFrame(
+        {
+            "join_date": join_raw[worker_pos],
+            "leave_date": leave_str[month_pos],
+            "total_days": total_days,
+            "total_years": total_years,
+            "last_3months_wages": last_3m_wages,
+            "last_3months_days": last_3m_days,
+            "average_daily_wage": avg_daily_wage,
+            "retirement_pay": retirement_pay,
+            "service_year_deduction": tax["service_year_deduction"],
+            "converted_income": tax["converted_income"],
+            "converted_deduction": tax["converted_deduction"],
+            "taxable_income": tax["taxable_income"],
+            "retirement_tax": ret_tax,
+            "local_tax": local_tax,
+            "net_retirement_pay": retirement_pay - ret_tax - local_tax,
+        },
+        index=pd.MultiIndex.from_arrays(
+            [ids[worker_pos], month_str[month_pos]],
+            names=["worker_id", "year_month"],
+        ),
+    )
+    return result[RESULT_COLUMNS]
@@ -0,0 +1,108 @@
+"""
+비과세 수당 한도 적용 모듈
+config.wageClassification.taxExemptItems의 월 한도로 수당을 비과세/과세분으로 나누고
+근로자별 과세 급여 합계를 계산 (여러 달 원장을 컬럼 단위로 한 번에 처리)
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from ..config.schema import BusinessPayrollConfig, TaxExemptItem
+
+
+@dataclass
+class TaxExemptSplit:
+    """비과세 한도 적용 결과"""
+    monthly: pd.DataFrame   # (근로자, 월) 인덱스 - 항목별 비과세/과세분, 과세 급여
+    totals: pd.DataFrame    # 근로자 인덱스 - 기간 합계
+
+
+def _amounts(df: pd.DataFrame, field: str) -> np.ndarray:
+    """금액 컬럼 (없거나 비숫자 → 0)"""
+    if field not in df.columns:
+        return np.zeros(len(df), dtype=np.int64)
+    return pd.to_numeric(df[field], errors="coerce").fillna(0).to_numpy(dtype=np.int64)
+
+
+def split_tax_exempt(
+    df: pd.DataFrame,
+    config: BusinessPayrollConfig | None = None,
+    items: list[TaxExemptItem] | None = None,
+    year_month: str | None = None,
+    worker_field: str = "residentNo",
+    month_field: str = "year_month",
+    gross_field: str = "wage",
+) -> TaxExemptSplit:
+    """
+    수당별 월 비과세 한도를 적용하여 비과세/과세분 분리.
+
+    한 근로자가 같은 달에 여러 행이면 먼저 합산한 뒤 한도 적용.
+    과세 급여 = 총 급여(gross_field) - 비과세 합계 (0 미만이면 0).
+
+    Parameters
+    ----------
+    df : 표준 필드명 DataFrame (여러 달이면 month_field 컬럼 필요)
+    config : 사업장 config (items가 없으면 config의 taxExemptItems 사용)
+    items : 비과세 항목 목록
+    year_month : month_field 컬럼이 없을 때 모든 행에 적용할 월 (YYYY-MM)
+    worker_field : 근로자 식별 컬럼 (빈 값 행은 제외)
+    month_field : 귀속 월 컬럼 (YYYY-MM)
+    gross_field : 총 급여 컬럼
+
+    Returns
+    -------
+    TaxExemptSplit
+        monthly 컬럼: gross, {field}, {field}_exempt, {field}_taxable (항목별),
+                      exempt_total, taxable_wage
+        totals 컬럼: months, gross, exempt_total, taxable_wage
+    """
+    if items is None:
+        if config is None:
+            raise ValueError("config 또는 items가 필요합니다")
+        items = config.wageClassification.taxExemptItems
+
+    if worker_field not in df.columns:
+        raise ValueError(f"근로자 식별 컬럼이 없습니다: {worker_field}")
+    if month_field in df.columns:
+        months = df[month_field].fillna("").astype(str).str.strip().to_numpy()
+    elif year_month:
+        months = np.full(len(df), year_month, dtype=object)
+    else:
+        raise ValueError(f"{month_field} 컬럼이 없으면 year_month가 필요합니다")
+
+    workers = df[worker_field].fillna("").astype(str).str.strip().to_numpy()
+    keep = (workers != "") & (months != "")
+
+    fields = list(dict.fromkeys(item.field for item in items))
+    values = {"gross": _amounts(df, gross_field)[keep]}
+    for f in fields:
+        values[f] = _amounts(df, f)[keep]
+
+    # (근로자, 월) 합산
+    monthly = (
+        pd.DataFrame(values)
+        .groupby([workers[keep], months[keep]], sort=True)
+        .sum()
+    )
+    monthly.index.names = [worker_field, month_field]
+
+    exempt_total = np.zeros(len(monthly), dtype=np.int64)
+    limits = {item.field: item.monthlyLimit for item in items}  # 같은 필드가 여러 번이면 마지막 한도
+    for f in fields:
+        amount = monthly[f].to_numpy()
+        exempt = np.clip(amount, 0, limits[f])
+        monthly[f"{f}_exempt"] = exempt
+        monthly[f"{f}_taxable"] = amount - exempt
+        exempt_total += exempt
+
+    monthly["exempt_total"] = exempt_total
+    monthly["taxable_wage"] = np.maximum(monthly["gross"].to_numpy() - exempt_total, 0)
+
+    grouped = monthly.groupby(level=0)
+    totals = grouped[["gross", "exempt_total", "taxable_wage"]].sum()
+    totals.insert(0, "months", grouped.size())
+
+    return TaxExemptSplit(monthly=monthly, totals=totals)
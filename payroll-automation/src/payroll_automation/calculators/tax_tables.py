@@ -0,0 +1,140 @@
+"""
+퇴직소득세 구간표 (귀속연도별, 버전 관리)
+근속연수공제 / 환산급여공제 / 소득세율표를 구간 상한 배열로 보관하고
+구간 위치는 이진 탐색(bisect / np.searchsorted)으로 조회.
+- 스칼라 계산(retirement.py)과 일괄 계산(retirement_batch.py)이 같은 표를 사용
+- 새 연도 규정은 register_tax_table로 표만 추가 (계산 코드 수정 불필요)
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class RetirementTaxTable:
+    """
+    퇴직소득세 구간표 1벌.
+
+    각 표는 구간 상한(upper, 오름차순) + 구간별 값(상한 개수 + 1개).
+    값 v가 속하는 구간 = bisect_left(upper, v) (상한 이하 → 해당 구간)
+    """
+    tax_year: int           # 적용 시작 귀속연도
+    version: str            # 표 버전 (규정 개정 식별)
+
+    # 근속연수공제 (소득세법 시행령 별표2): 기본공제 + (연수 - 구간 하한) × 연당 공제액
+    syd_upper: tuple[int, ...]
+    syd_base: tuple[int, ...]
+    syd_from: tuple[int, ...]
+    syd_per_year: tuple[int, ...]
+
+    # 환산급여공제: 기본공제 + int((환산급여 - 구간 하한) × 공제율)
+    cd_upper: tuple[int, ...]
+    cd_base: tuple[int, ...]
+    cd_from: tuple[int, ...]
+    cd_rate: tuple[float, ...]
+
+    # 소득세율표 (소득세법 제55조): 과세표준 × 세율 - 누진공제
+    tax_upper: tuple[int, ...]
+    tax_rate: tuple[float, ...]
+    tax_deduction: tuple[int, ...]
+
+    _arrays: dict[str, np.ndarray] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for prefix, cols in (
+            ("syd", ("upper", "base", "from", "per_year")),
+            ("cd", ("upper", "base", "from", "rate")),
+            ("tax", ("upper", "rate", "deduction")),
+        ):
+            n = len(getattr(self, f"{prefix}_upper"))
+            for col in cols[1:]:
+                if len(getattr(self, f"{prefix}_{col}")) != n + 1:
+                    raise ValueError(f"{self.version}: {prefix}_{col} 길이는 구간 상한 수 + 1이어야 합니다")
+            for col in cols:
+                self._arrays[f"{prefix}_{col}"] = np.asarray(getattr(self, f"{prefix}_{col}"))
+
+    def _a(self, name: str) -> np.ndarray:
+        return self._arrays[name]
+
+    # ── 스칼라 조회 ──
+
+    def service_year_deduction(self, years: int) -> int:
+        """근속연수공제 (years = 올림된 근속연수)"""
+        b = bisect_left(self.syd_upper, years)
+        return self.syd_base[b] + (years - self.syd_from[b]) * self.syd_per_year[b]
+
+    def converted_deduction(self, converted_income: int) -> int:
+        """환산급여공제"""
+        b = bisect_left(self.cd_upper, converted_income)
+        return self.cd_base[b] + int((converted_income - self.cd_from[b]) * self.cd_rate[b])
+
+    def tax_bracket(self, taxable_income: int) -> tuple[float, int]:
+        """과세표준 → (세율, 누진공제)"""
+        b = bisect_left(self.tax_upper, taxable_income)
+        return self.tax_rate[b], self.tax_deduction[b]
+
+    # ── 배열 조회 ──
+
+    def service_year_deduction_array(self, years: np.ndarray) -> np.ndarray:
+        b = np.searchsorted(self._a("syd_upper"), years, side="left")
+        return self._a("syd_base")[b] + (years - self._a("syd_from")[b]) * self._a("syd_per_year")[b]
+
+    def converted_deduction_array(self, ci: np.ndarray) -> np.ndarray:
+        b = np.searchsorted(self._a("cd_upper"), ci, side="left")
+        return self._a("cd_base")[b] + np.trunc((ci - self._a("cd_from")[b]) * self._a("cd_rate")[b]).astype(np.int64)
+
+    def tax_bracket_array(self, taxable: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        b = np.searchsorted(self._a("tax_upper"), taxable, side="left")
+        return self._a("tax_rate")[b], self._a("tax_deduction")[b]
+
+
+# ──────────────────────────────────────────
+# 귀속연도별 표
+# ──────────────────────────────────────────
+
+TAX_TABLES: dict[int, RetirementTaxTable] = {}
+_TABLE_YEARS: list[int] = []     # TAX_TABLES 키 (정렬)
+
+
+def register_tax_table(table: RetirementTaxTable) -> RetirementTaxTable:
+    """구간표 등록 (같은 귀속연도는 덮어씀)"""
+    TAX_TABLES[table.tax_year] = table
+    _TABLE_YEARS[:] = sorted(TAX_TABLES)
+    return table
+
+
+def get_tax_table(tax_year: int | None = None) -> RetirementTaxTable:
+    """
+    귀속연도에 적용할 구간표.
+    해당 연도 이하 중 가장 최근 표 (없으면 가장 오래된 표). tax_year=None이면 최신 표
+    """
+    if tax_year is None:
+        return TAX_TABLES[_TABLE_YEARS[-1]]
+    i = bisect_left(_TABLE_YEARS, tax_year + 1) - 1
+    return TAX_TABLES[_TABLE_YEARS[max(i, 0)]]
+
+
+register_tax_table(RetirementTaxTable(
+    tax_year=2025,
+    version="2025.1",
+    syd_upper=(5, 10, 20),
+    syd_base=(0, 5_000_000, 15_000_000, 40_000_000),
+    syd_from=(0, 5, 10, 20),
+    syd_per_year=(1_000_000, 2_000_000, 2_500_000, 3_000_000),
+    cd_upper=(8_000_000, 70_000_000, 100_000_000, 300_000_000),
+    cd_base=(0, 8_000_000, 45_200_000, 61_700_000, 151_700_000),
+    cd_from=(0, 8_000_000, 70_000_000, 100_000_000, 300_000_000),
+    cd_rate=(1.0, 0.6, 0.55, 0.45, 0.35),
+    tax_upper=(
+        14_000_000, 50_000_000, 88_000_000, 150_000_000,
+        300_000_000, 500_000_000, 1_000_000_000,
+    ),
+    tax_rate=(0.06, 0.15, 0.24, 0.35, 0.38, 0.40, 0.42, 0.45),
+    tax_deduction=(
+        0, 1_260_000, 5_760_000, 15_440_000,
+        19_940_000, 25_940_000, 35_940_000, 65_940_000,
+    ),
+))
@@ -4,17 +4,24 @@ payroll-automation CLI 진입점.
 Usage:
     python -m payroll_automation list-businesses
     python -m payroll_automation config-check --business biz-kukuku-bupyeong
+    python -m payroll_automation detect --file 급여대장.xlsx
     python -m payroll_automation validate --business biz-kukuku-bupyeong --file 급여대장.xlsx
     python -m payroll_automation import --business biz-kukuku-bupyeong --file 급여대장.xlsx --month 2026-01
+    python -m payroll_automation import-sheets --business biz-kukuku-bupyeong --file 2025_급여대장.xlsx --history
+    python -m payroll_automation import-all --dir ./급여대장 --month 2026-01 --workers 4
     python -m payroll_automation retirement --join 2023-01-02 --leave 2026-01-31 --wages 3000000
+    python -m payroll_automation retirement --join 2023-01-02 --leave 2026-01-31 --business biz-kukuku-bupyeong --resident 9001011234567
+    python -m payroll_automation bench --rows 10000 --dirty 0.05 --sheets 3
 """
 from __future__ import annotations
 
 import argparse
 import json
 import sys
+import time
+from pathlib import Path
 
-from .config.loader import list_configs, load_config
+from .config.loader import list_configs, load_config, load_configs
 from .calculators.retirement import (
     MonthlyWageData,
     calculate_retirement,
@@ -29,12 +36,11 @@ def cmd_list_businesses(args: argparse.Namespace) -> None:
         print("등록된 사업장 config가 없습니다.")
         return
     print(f"=== 사업장 config 목록 ({len(configs)}개) ===")
-    for biz_id in configs:
-        try:
-            cfg = load_config(biz_id)
+    for biz_id, cfg in load_configs(configs).items():
+        if isinstance(cfg, Exception):
+            print(f"  {biz_id}: [로드 실패] {cfg}")
+        else:
             print(f"  {biz_id}: {cfg.businessName}")
-        except Exception as e:
-            print(f"  {biz_id}: [로드 실패] {e}")
 
 
 def cmd_config_check(args: argparse.Namespace) -> None:
@@ -67,26 +73,69 @@ def cmd_config_check(args: argparse.Namespace) -> None:
     print(f"  주 소정근로시간: {defs.workHours}h")
     print(f"  국적코드: {defs.nationality}")
 
+    if cfg.validationRules:
+        from .validators.rules import RULES
+
+        print(f"  추가 검증 규칙: {', '.join(cfg.validationRules)}")
+        unknown = [r for r in cfg.validationRules if r not in RULES]
+        if unknown:
+            print(f"\n[ERROR] 등록되지 않은 검증 규칙: {', '.join(unknown)}")
+            sys.exit(1)
+
     print("\n[OK] Config 검증 통과")
 
 
+def cmd_detect(args: argparse.Namespace) -> None:
+    """엑셀 헤더/컬럼 자동 감지 (신규 사업장 config 작성용)"""
+    from .excel.detector import detect_columns
+
+    cfg = load_config(args.business) if args.business else None
+    result = detect_columns(args.file, cfg, sheet_name=args.sheet, use_cache=not args.no_cache)
+    if result is None:
+        print("[FAIL] 감지 실패 (데이터 행 부족)")
+        sys.exit(1)
+
+    if args.json_output:
+        excel = {
+            "sheetName": result.sheet_name,
+            "headerRow": result.header_row,
+            "dataStartRow": result.data_start_row,
+            "columns": result.columns,
+        }
+        print(json.dumps({"excel": excel}, ensure_ascii=False, indent=2))
+        return
+
+    print(f"=== 레이아웃 감지: {Path(args.file).name} ===")
+    print(f"  시트: {result.sheet_name}")
+    print(f"  헤더 행: {result.header_row} (별칭 일치 {result.header_score}개)")
+    print(f"  데이터 시작 행: {result.data_start_row}")
+    print(f"  컬럼 매핑 ({len(result.columns)}개):")
+    by_col = {d.col: d for d in result.detections}
+    for field, col in result.columns.items():
+        d = by_col.get(col)
+        detail = f"{d.header or '-'} | {d.dominant_type} {d.confidence:.0%}" if d else ""
+        print(f"    {field}: 열 {col}  ({detail})")
+
+
 def cmd_validate(args: argparse.Namespace) -> None:
-    """엑셀 파일 검증"""
-    from .excel.reader import read_payroll_excel
+    """엑셀 파일 검증 (파싱 캐시를 쓰지 않고 원시 행부터 다시 읽음)"""
+    from .excel.cache import resolve_layout
     from .excel.mapper import map_to_standard
+    from .excel.reader import read_payroll_excel
     from .validators.wage_validator import validate_wage_data
 
     cfg = load_config(args.business)
     print(f"=== 데이터 검증: {cfg.businessName} ===")
     print(f"  파일: {args.file}")
 
+    cfg = resolve_layout(args.file, cfg, use_cache=not args.no_cache)
     raw_df = read_payroll_excel(args.file, cfg)
     print(f"  원시 행 수: {len(raw_df)}")
 
     mapped_df = map_to_standard(raw_df, cfg)
     print(f"  매핑 후 행 수: {len(mapped_df)}")
 
-    result = validate_wage_data(mapped_df)
+    result = validate_wage_data(mapped_df, cfg, args.month)
     print(f"\n  전체: {result.total_rows}행")
     print(f"  유효: {result.valid_rows}행")
     print(f"  에러: {result.error_count}건")
@@ -107,26 +156,66 @@ def cmd_validate(args: argparse.Namespace) -> None:
 
 def cmd_import(args: argparse.Namespace) -> None:
     """엑셀 임포트 + 신고서 생성"""
-    from .excel.reader import read_payroll_excel
-    from .excel.mapper import map_to_standard
+    from .excel.cache import load_standard_ledger
     from .reports.acquisition import generate_acquisition_report
     from .reports.loss import generate_loss_report
 
     cfg = load_config(args.business)
     print(f"=== 임포트: {cfg.businessName} ({args.month}) ===")
 
-    raw_df = read_payroll_excel(args.file, cfg)
-    mapped_df = map_to_standard(raw_df, cfg)
+    mapped_df = load_standard_ledger(args.file, cfg, use_cache=not args.no_cache)
     print(f"  매핑 완료: {len(mapped_df)}명")
 
+    registry = None
+    if args.registry:
+        # 근로자 레지스트리: 기존 근로자 제외 + 입사일 보완
+        from .registry import WorkerRegistry
+
+        registry = WorkerRegistry.open()
+        print(f"  레지스트리: {len(registry)}명 등록")
+
+    if args.incremental:
+        # 증분: 전월 스냅샷 대비 변동 근로자만 판정
+        from .incremental import SnapshotStore, run_incremental_import
+
+        store = SnapshotStore()
+        if not store.available:
+            print("[ERROR] --incremental에는 pyarrow가 필요합니다 (pip install 'payroll-automation[cache]')")
+            sys.exit(1)
+        inc = run_incremental_import(mapped_df, cfg, args.month, store=store, registry=registry)
+        if inc.diff is None:
+            print(f"  [INFO] {inc.base_month} 스냅샷 없음 → 전체 처리")
+        else:
+            d = inc.diff
+            print(
+                f"  {inc.base_month} 대비: 추가 {len(d.added)}명 / 변경 {len(d.changed)}명"
+                f" / 삭제 {len(d.removed)}명 / 동일 {d.unchanged_count}명"
+            )
+        acq, loss = inc.acquisition, inc.loss
+    else:
+        acq = generate_acquisition_report(mapped_df, cfg, args.month, registry=registry)
+        loss = generate_loss_report(mapped_df, cfg, args.month, registry=registry)
+
+    if registry is not None:
+        added = registry.update(cfg.businessId, mapped_df, args.month)
+        registry.save()
+        print(f"  레지스트리 갱신: 신규 {added}명")
+
+    if args.history:
+        # 급여 이력: 퇴직금 평균임금 산정용 월 임금총액 기록
+        from .wage_history import WageHistoryStore
+
+        history = WageHistoryStore.open()
+        recorded = history.record(cfg.businessId, mapped_df, args.month)
+        history.save()
+        print(f"  급여 이력 기록: {recorded}명 ({args.month})")
+
     # 취득신고
-    acq = generate_acquisition_report(mapped_df, cfg, args.month)
     print(f"\n  --- 취득신고 대상: {len(acq.records)}명 ---")
     for r in acq.records:
         print(f"    {r.name} | {r.resident_no[:6]}-******* | 입사 {r.join_date} | 보수 {r.wage:,}원")
 
     # 상실신고
-    loss = generate_loss_report(mapped_df, cfg, args.month)
     print(f"\n  --- 상실신고 대상: {len(loss.records)}명 ---")
     for r in loss.records:
         tag = " [퇴직금대상]" if r.retirement_eligible else ""
@@ -157,6 +246,104 @@ def cmd_import(args: argparse.Namespace) -> None:
         print(f"\n{json.dumps(output, ensure_ascii=False, indent=2)}")
 
 
+def cmd_import_all(args: argparse.Namespace) -> None:
+    """전체 사업장 일괄 임포트 (filePattern으로 파일 탐색, 프로세스 병렬 처리)"""
+    from .pipeline import ImportSummary, discover_jobs, run_import_jobs
+
+    biz_ids = args.business or list_configs()
+    configs = []
+    failed: list[ImportSummary] = []
+    for biz_id, cfg in load_configs(biz_ids).items():
+        if isinstance(cfg, Exception):
+            failed.append(ImportSummary(
+                business_id=biz_id, business_name="", filepath="",
+                year_month=args.month, failure=f"config 로드 실패: {cfg}",
+            ))
+        else:
+            configs.append(cfg)
+
+    jobs, skipped = discover_jobs(configs, args.dir, args.month, use_cache=not args.no_cache)
+    print(f"=== 일괄 임포트 ({args.month}) ===")
+    print(f"  사업장: {len(biz_ids)}곳 / 처리 대상 파일: {len(jobs)}개")
+
+    summaries = run_import_jobs(jobs, max_workers=args.workers) + skipped + failed
+
+    print("\n  --- 처리 결과 ---")
+    print(f"  {'사업장':<28} {'행':>5} {'에러':>5} {'경고':>5} {'취득':>5} {'상실':>5} {'시간(s)':>8}  비고")
+    for s in summaries:
+        note = s.failure.splitlines()[0] if s.failure else Path(s.filepath).name
+        if s.ok:
+            print(
+                f"  {s.business_id:<28} {s.rows:>5} {s.error_count:>5} {s.warning_count:>5}"
+                f" {len(s.acquisitions):>5} {len(s.losses):>5} {s.elapsed:>8.2f}  {note}"
+            )
+        else:
+            print(f"  {s.business_id:<28} {'-':>5} {'-':>5} {'-':>5} {'-':>5} {'-':>5} {'-':>8}  [FAIL] {note}")
+
+    done = [s for s in summaries if s.ok]
+    print(
+        f"\n  완료 {len(done)}건 / 실패 {len(summaries) - len(done)}건"
+        f" | 취득 {sum(len(s.acquisitions) for s in done)}명"
+        f" | 상실 {sum(len(s.losses) for s in done)}명"
+    )
+
+    if getattr(args, "json_output", False):
+        output = [
+            {
+                "businessId": s.business_id,
+                "file": s.filepath,
+                "failure": s.failure,
+                "acquisition": [
+                    {"name": r.name, "residentNo": r.resident_no, "joinDate": r.join_date, "wage": r.wage}
+                    for r in s.acquisitions
+                ],
+                "loss": [
+                    {
+                        "name": r.name,
+                        "residentNo": r.resident_no,
+                        "leaveDate": r.leave_date,
+                        "retirementEligible": r.retirement_eligible,
+                    }
+                    for r in s.losses
+                ],
+            }
+            for s in summaries
+        ]
+        print(f"\n{json.dumps(output, ensure_ascii=False, indent=2)}")
+
+    if len(done) < len(summaries):
+        sys.exit(1)
+
+
+def cmd_import_sheets(args: argparse.Namespace) -> None:
+    """월별 시트 워크북 임포트 (sheetKeywords에 맞는 시트 전체, 시트별 프로세스 병렬 파싱)"""
+    from .excel.sheets import load_monthly_ledger
+
+    cfg = load_config(args.business)
+    print(f"=== 월별 시트 임포트: {cfg.businessName} ===")
+
+    started = time.perf_counter()
+    ledger = load_monthly_ledger(
+        args.file, cfg, year=args.year, max_workers=args.workers, use_cache=not args.no_cache,
+    )
+    elapsed = time.perf_counter() - started
+
+    sheets = ledger.groupby("sheet", sort=False)["year_month"].agg(["first", "size"])
+    print(f"  시트 {len(sheets)}개 / {len(ledger)}행 ({elapsed:.2f}s)")
+    for sheet, row in sheets.iterrows():
+        month = row["first"] or "[월 미확인]"
+        print(f"    {sheet:<24} {month:<10} {row['size']:>6}행")
+
+    if args.history:
+        from .wage_history import WageHistoryStore
+
+        history = WageHistoryStore.open()
+        for year_month, df in ledger[ledger["year_month"] != ""].groupby("year_month"):
+            recorded = history.record(cfg.businessId, df, year_month)
+            print(f"  급여 이력 기록: {recorded}명 ({year_month})")
+        history.save()
+
+
 def cmd_retirement(args: argparse.Namespace) -> None:
     """퇴직금 계산"""
     join_date = args.join
@@ -167,20 +354,39 @@ def cmd_retirement(args: argparse.Namespace) -> None:
         print("[FAIL] 1년 미만 근속 → 퇴직금 미대상")
         sys.exit(1)
 
-    # 간이 계산: 매월 동일 급여로 가정
-    from datetime import datetime
-    leave = datetime.strptime(leave_date, "%Y-%m-%d")
     wages_data: list[MonthlyWageData] = []
-    for i in range(3):
-        y = leave.year
-        m = leave.month - i
-        if m <= 0:
-            m += 12
-            y -= 1
-        wages_data.append(MonthlyWageData(
-            year_month=f"{y}-{m:02d}",
-            total_wage=wage,
-        ))
+    if args.business and args.resident:
+        # 급여 이력 저장소의 실제 월 급여
+        from .excel.reader import parse_resident_no
+        from .wage_history import WageHistoryStore
+
+        # 원장과 같은 정규화 (900101-1234567 → 9001011234567)
+        resident_no = parse_resident_no(args.resident)
+        if not resident_no or len(resident_no) > 13:
+            print(f"[FAIL] 주민번호 형식 오류: {args.resident}")
+            sys.exit(1)
+
+        history = WageHistoryStore.open()
+        wages_data = history.monthly_wages(args.business, resident_no, leave_date)
+        print(f"  급여 이력: {len(wages_data)}개월 ({', '.join(w.year_month for w in wages_data) or '없음'})")
+
+    if not wages_data:
+        if wage is None:
+            print("[FAIL] --wages 또는 --business/--resident(급여 이력)가 필요합니다")
+            sys.exit(1)
+        # 간이 계산: 매월 동일 급여로 가정
+        from datetime import datetime
+        leave = datetime.strptime(leave_date, "%Y-%m-%d")
+        for i in range(3):
+            y = leave.year
+            m = leave.month - i
+            if m <= 0:
+                m += 12
+                y -= 1
+            wages_data.append(MonthlyWageData(
+                year_month=f"{y}-{m:02d}",
+                total_wage=wage,
+            ))
 
     result = calculate_retirement(join_date, leave_date, wages_data)
     if result is None:
@@ -207,6 +413,30 @@ def cmd_retirement(args: argparse.Namespace) -> None:
     print(f"  ★ 실수령액: {result.net_retirement_pay:,}원")
 
 
+def cmd_bench(args: argparse.Namespace) -> None:
+    """합성 급여대장으로 단계별 성능 측정"""
+    from .benchmark import LedgerSpec, format_results, results_to_dict, run_benchmark
+
+    outputs = []
+    for rows in args.rows:
+        spec = LedgerSpec(
+            rows=rows,
+            extra_columns=args.columns,
+            dirty_ratio=args.dirty,
+            sheets=args.sheets,
+            seed=args.seed,
+        )
+        results = run_benchmark(spec, repeat=args.repeat, workdir=args.keep)
+        if args.json_output:
+            outputs.append(results_to_dict(spec, results))
+        else:
+            print(format_results(spec, results))
+            print()
+
+    if args.json_output:
+        print(json.dumps(outputs, ensure_ascii=False, indent=2))
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         prog="payroll",
@@ -221,10 +451,20 @@ def main() -> None:
     p_check = sub.add_parser("config-check", help="config 검증")
     p_check.add_argument("--business", "-b", required=True, help="사업장 ID")
 
+    # detect
+    p_det = sub.add_parser("detect", help="엑셀 헤더/컬럼 자동 감지")
+    p_det.add_argument("--file", "-f", required=True, help="엑셀 파일 경로")
+    p_det.add_argument("--business", "-b", default=None, help="사업장 ID (fieldAliases/sheetKeywords 사용)")
+    p_det.add_argument("--sheet", default=None, help="시트 이름 (기본: 자동 선택)")
+    p_det.add_argument("--json", dest="json_output", action="store_true", help="config excel 섹션 JSON 출력")
+    p_det.add_argument("--no-cache", action="store_true", help="감지 캐시 사용 안 함")
+
     # validate
     p_val = sub.add_parser("validate", help="엑셀 파일 검증")
     p_val.add_argument("--business", "-b", required=True)
     p_val.add_argument("--file", "-f", required=True, help="엑셀 파일 경로")
+    p_val.add_argument("--no-cache", action="store_true", help="감지 캐시 사용 안 함")
+    p_val.add_argument("--month", "-m", default=None, help="대상 월 (YYYY-MM, 최저 기준 등 추가 규칙용)")
 
     # import
     p_imp = sub.add_parser("import", help="엑셀 임포트 + 신고서 생성")
@@ -232,21 +472,60 @@ def main() -> None:
     p_imp.add_argument("--file", "-f", required=True)
     p_imp.add_argument("--month", "-m", required=True, help="대상 월 (YYYY-MM)")
     p_imp.add_argument("--json", dest="json_output", action="store_true")
+    p_imp.add_argument("--no-cache", action="store_true", help="파싱 캐시 사용 안 함")
+    p_imp.add_argument("--incremental", action="store_true", help="전월 스냅샷 대비 변동 근로자만 처리")
+    p_imp.add_argument("--registry", action="store_true", help="근로자 레지스트리로 기존 근로자 제외 후 갱신")
+    p_imp.add_argument("--history", action="store_true", help="급여 이력 저장소에 이번 달 임금총액 기록")
+
+    # import-sheets
+    p_sheets = sub.add_parser("import-sheets", help="월별 시트 워크북 임포트 (시트 병렬)")
+    p_sheets.add_argument("--business", "-b", required=True)
+    p_sheets.add_argument("--file", "-f", required=True)
+    p_sheets.add_argument("--year", "-y", type=int, default=None, help="시트 이름에 연도가 없을 때 연도 (기본: 파일명)")
+    p_sheets.add_argument("--workers", "-w", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    p_sheets.add_argument("--no-cache", action="store_true", help="파싱 캐시 사용 안 함")
+    p_sheets.add_argument("--history", action="store_true", help="시트별 임금총액을 급여 이력 저장소에 기록")
+
+    # import-all
+    p_all = sub.add_parser("import-all", help="전체 사업장 일괄 임포트 (병렬)")
+    p_all.add_argument("--dir", "-d", required=True, help="급여대장 파일 디렉토리")
+    p_all.add_argument("--month", "-m", required=True, help="대상 월 (YYYY-MM)")
+    p_all.add_argument("--business", "-b", action="append", help="사업장 ID (여러 번 지정 가능, 기본: 전체)")
+    p_all.add_argument("--workers", "-w", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    p_all.add_argument("--json", dest="json_output", action="store_true")
+    p_all.add_argument("--no-cache", action="store_true", help="파싱 캐시 사용 안 함")
 
     # retirement
     p_ret = sub.add_parser("retirement", help="퇴직금 계산")
     p_ret.add_argument("--join", required=True, help="입사일 (YYYY-MM-DD)")
     p_ret.add_argument("--leave", required=True, help="퇴사일 (YYYY-MM-DD)")
-    p_ret.add_argument("--wages", type=int, required=True, help="월 급여 (원)")
+    p_ret.add_argument("--wages", type=int, default=None, help="월 급여 (원, 급여 이력이 없을 때 3개월 동일 가정)")
+    p_ret.add_argument("--business", "-b", default=None, help="사업장 ID (급여 이력 조회)")
+    p_ret.add_argument("--resident", default=None, help="주민번호 (급여 이력 조회, 하이픈 허용)")
+
+    # bench
+    p_bench = sub.add_parser("bench", help="합성 급여대장 벤치마크")
+    p_bench.add_argument("--rows", "-r", type=int, nargs="+", default=[10_000], help="행 수 (여러 개 지정 가능)")
+    p_bench.add_argument("--columns", type=int, default=10, help="추가 수당 컬럼 수")
+    p_bench.add_argument("--dirty", type=float, default=0.05, help="지저분한 값 비율 (0~1)")
+    p_bench.add_argument("--sheets", type=int, default=1, help="시트 수")
+    p_bench.add_argument("--repeat", type=int, default=3, help="단계별 반복 횟수 (최소 시간 사용)")
+    p_bench.add_argument("--seed", type=int, default=0)
+    p_bench.add_argument("--keep", default=None, help="합성 원장을 남길 디렉토리")
+    p_bench.add_argument("--json", dest="json_output", action="store_true")
 
     args = parser.parse_args()
 
     commands = {
         "list-businesses": cmd_list_businesses,
         "config-check": cmd_config_check,
+        "detect": cmd_detect,
         "validate": cmd_validate,
         "import": cmd_import,
+        "import-sheets": cmd_import_sheets,
+        "import-all": cmd_import_all,
         "retirement": cmd_retirement,
+        "bench": cmd_bench,
     }
 
     if args.command in commands:
@@ -1,2 +1,10 @@
-from .loader import load_config, list_configs, get_config_dir
+from .loader import (
+    clear_config_cache,
+    get_config_dir,
+    get_data_dir,
+    list_configs,
+    load_all_configs,
+    load_config,
+    load_configs,
+)
 from .schema import BusinessPayrollConfig
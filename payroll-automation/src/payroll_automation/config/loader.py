@@ -5,8 +5,11 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 from pathlib import Path
 
+from pydantic import TypeAdapter, ValidationError
+
 from .schema import BusinessPayrollConfig
 
 # config 디렉토리 경로 결정
@@ -23,18 +26,135 @@ def get_config_dir() -> Path:
     return _DEFAULT_CONFIG_REL
 
 
+def get_data_dir() -> Path:
+    """
+    처리 결과 저장 디렉토리 (월별 스냅샷 등)
+    1순위: 환경변수 PAYROLL_DATA_DIR
+    2순위: ~/.payroll-automation
+    """
+    env_dir = os.environ.get("PAYROLL_DATA_DIR")
+    if env_dir:
+        return Path(env_dir)
+    return Path.home() / ".payroll-automation"
+
+
+# ──────────────────────────────────────────
+# 프로세스 단위 config 캐시
+# business_id → (파일 경로, (mtime_ns, size), 검증된 config)
+# 파일의 mtime/size가 바뀐 경우에만 다시 읽고 검증
+# ──────────────────────────────────────────
+
+_FileSig = tuple[int, int]
+
+_cache: dict[str, tuple[Path, _FileSig, BusinessPayrollConfig]] = {}
+_cache_lock = threading.Lock()
+_list_adapter = TypeAdapter(list[BusinessPayrollConfig])
+
+
+def _config_path(business_id: str) -> Path:
+    return get_config_dir() / f"{business_id}.json"
+
+
+def _file_sig(path: Path) -> _FileSig:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _cached(business_id: str, path: Path, sig: _FileSig) -> BusinessPayrollConfig | None:
+    """캐시 항목이 같은 파일/같은 상태이면 반환"""
+    with _cache_lock:
+        entry = _cache.get(business_id)
+    if entry and entry[0] == path and entry[1] == sig:
+        return entry[2]
+    return None
+
+
+def _store(business_id: str, path: Path, sig: _FileSig, config: BusinessPayrollConfig) -> None:
+    with _cache_lock:
+        _cache[business_id] = (path, sig, config)
+
+
+def _read_json(path: Path) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def clear_config_cache() -> None:
+    """config 캐시 비우기 (테스트/강제 재로드용)"""
+    with _cache_lock:
+        _cache.clear()
+
+
 def load_config(business_id: str) -> BusinessPayrollConfig:
-    """사업장 ID로 config JSON 로드 + Pydantic 검증"""
-    config_dir = get_config_dir()
-    config_path = config_dir / f"{business_id}.json"
+    """
+    사업장 ID로 config JSON 로드 + Pydantic 검증.
+
+    검증 결과는 프로세스 단위로 캐시되며, 파일의 mtime/size가
+    바뀌었을 때만 다시 읽고 검증함. 반환 객체는 캐시와 공유되므로 수정하지 말 것.
+    """
+    config_path = _config_path(business_id)
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config 파일 없음: {config_path}")
+    try:
+        sig = _file_sig(config_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config 파일 없음: {config_path}") from None
 
-    with open(config_path, encoding="utf-8") as f:
-        data = json.load(f)
+    config = _cached(business_id, config_path, sig)
+    if config is None:
+        config = BusinessPayrollConfig(**_read_json(config_path))
+        _store(business_id, config_path, sig, config)
+    return config
 
-    return BusinessPayrollConfig(**data)
+
+def load_configs(
+    business_ids: list[str] | None = None,
+) -> dict[str, BusinessPayrollConfig | Exception]:
+    """
+    여러 사업장 config 일괄 로드 (없으면 list_configs() 전체).
+
+    캐시에 없거나 변경된 파일만 읽어서 한 번의 Pydantic 검증으로 처리.
+    로드 실패한 사업장은 값으로 예외 객체를 담아 반환.
+    """
+    ids = list_configs() if business_ids is None else business_ids
+    results: dict[str, BusinessPayrollConfig | Exception] = {}
+    pending: list[tuple[str, Path, _FileSig, dict]] = []
+
+    for biz_id in ids:
+        path = _config_path(biz_id)
+        try:
+            sig = _file_sig(path)
+        except FileNotFoundError:
+            results[biz_id] = FileNotFoundError(f"Config 파일 없음: {path}")
+            continue
+
+        config = _cached(biz_id, path, sig)
+        if config is not None:
+            results[biz_id] = config
+            continue
+
+        try:
+            pending.append((biz_id, path, sig, _read_json(path)))
+        except (OSError, ValueError) as e:
+            results[biz_id] = e
+
+    if pending:
+        try:
+            validated = _list_adapter.validate_python([p[3] for p in pending])
+        except ValidationError:
+            # 일부 파일이 잘못된 경우: 파일별로 다시 검증해서 실패 항목만 분리
+            validated = []
+            for _, _, _, data in pending:
+                try:
+                    validated.append(BusinessPayrollConfig(**data))
+                except (ValidationError, TypeError) as e:
+                    validated.append(e)
+
+        for (biz_id, path, sig, _), config in zip(pending, validated):
+            if isinstance(config, BusinessPayrollConfig):
+                _store(biz_id, path, sig, config)
+            results[biz_id] = config
+
+    return {biz_id: results[biz_id] for biz_id in ids}
 
 
 def list_configs() -> list[str]:
@@ -52,9 +172,9 @@ def list_configs() -> list[str]:
 def load_all_configs() -> list[BusinessPayrollConfig]:
     """모든 사업장 config 로드"""
     configs = []
-    for biz_id in list_configs():
-        try:
-            configs.append(load_config(biz_id))
-        except Exception as e:
-            print(f"  [WARN] {biz_id} 로드 실패: {e}")
+    for biz_id, result in load_configs().items():
+        if isinstance(result, Exception):
+            print(f"  [WARN] {biz_id} 로드 실패: {result}")
+        else:
+            configs.append(result)
     return configs
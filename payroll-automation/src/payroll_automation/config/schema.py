@@ -52,6 +52,7 @@ class BusinessPayrollConfig(BaseModel):
     wageClassification: WageClassification = Field(default_factory=WageClassification)
     bonus: BonusInfo | None = None
     defaults: Defaults = Field(default_factory=Defaults)
+    validationRules: list[str] = Field(default_factory=list)   # 추가 검증 규칙 ID (기본 규칙 외)
 
     def get_column(self, field: str) -> int | None:
         """필드에 해당하는 1-indexed 컬럼 번호 반환 (없으면 None)"""
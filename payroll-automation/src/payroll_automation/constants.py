@@ -0,0 +1,68 @@
+"""
+급여 관련 상수
+payroll-manager/src/lib/constants.ts와 동일한 값
+"""
+from __future__ import annotations
+
+from datetime import date
+
+
+# 연도별 기본 월평균보수 (최저시급 × 209시간) - DEFAULTS.MONTHLY_WAGE_{year}
+MONTHLY_WAGE_BY_YEAR: dict[int, int] = {
+    2025: 2_060_740,
+    2026: 2_096_270,
+}
+
+
+def get_default_monthly_wage(year: int | None = None) -> int:
+    """
+    연도 기준 기본 월평균보수 (getDefaultMonthlyWage).
+    표에 없는 연도는 가장 가까운 이전 연도 값 (표보다 이전이면 첫 연도 값)
+    """
+    y = year or date.today().year
+    known = [k for k in MONTHLY_WAGE_BY_YEAR if k <= y]
+    return MONTHLY_WAGE_BY_YEAR[max(known) if known else min(MONTHLY_WAGE_BY_YEAR)]
+
+
+# 4대보험 요율 (INSURANCE_RATES_2026 / INSURANCE_RATES_2025)
+# 국민연금: 기준소득월액 × 요율 (상/하한 적용)
+# 건강보험: 보수월액 × 요율, 장기요양보험: 건강보험료 × LTC_RATE
+# 고용보험: 월 급여 × 요율 (사업주는 기본 + 규모별 고용안정/직업능력개발)
+INSURANCE_RATES_BY_YEAR: dict[int, dict[str, float]] = {
+    2025: {
+        "NPS_EMPLOYEE": 0.045,
+        "NPS_EMPLOYER": 0.045,
+        "NPS_UPPER_LIMIT": 6_170_000,
+        "NPS_LOWER_LIMIT": 390_000,
+        "NHIC_EMPLOYEE": 0.03545,
+        "NHIC_EMPLOYER": 0.03545,
+        "LTC_RATE": 0.1295,
+        "EI_EMPLOYEE": 0.009,
+        "EI_EMPLOYER_BASE": 0.009,
+        "EI_EMPLOYER_UNDER_150": 0.0025,
+        "EI_EMPLOYER_150_PRIORITY": 0.0045,
+        "EI_EMPLOYER_150_TO_1000": 0.0065,
+        "EI_EMPLOYER_OVER_1000": 0.0085,
+    },
+    2026: {
+        "NPS_EMPLOYEE": 0.0475,
+        "NPS_EMPLOYER": 0.0475,
+        "NPS_UPPER_LIMIT": 6_170_000,   # 2026년 공단 고시 확인 필요
+        "NPS_LOWER_LIMIT": 390_000,
+        "NHIC_EMPLOYEE": 0.03595,
+        "NHIC_EMPLOYER": 0.03595,
+        "LTC_RATE": 0.1314,
+        "EI_EMPLOYEE": 0.009,
+        "EI_EMPLOYER_BASE": 0.009,
+        "EI_EMPLOYER_UNDER_150": 0.0025,
+        "EI_EMPLOYER_150_PRIORITY": 0.0045,
+        "EI_EMPLOYER_150_TO_1000": 0.0065,
+        "EI_EMPLOYER_OVER_1000": 0.0085,
+    },
+}
+
+
+def get_insurance_rates(year: int | None = None) -> dict[str, float]:
+    """연도별 4대보험 요율 (getInsuranceRates). 2026년 이후는 2026년, 이전은 2025년 요율"""
+    y = year or date.today().year
+    return INSURANCE_RATES_BY_YEAR[2026 if y >= 2026 else 2025]
@@ -1,2 +1,4 @@
 from .reader import read_payroll_excel
 from .mapper import map_to_standard
+from .detector import detect_columns, detect_best_sheet
+from .sheets import load_monthly_ledger, load_sheet_ledgers
@@ -0,0 +1,236 @@
+"""
+매핑 결과(표준 DataFrame) 디스크 캐시
+같은 엑셀 파일 + 같은 config이면 XLSX를 다시 파싱하지 않고 Arrow IPC 파일에서 로드
+
+- 키: 파일 내용 SHA-256 + config(excel 섹션, version) 지문 + 캐시 포맷 버전
+- 저장: Arrow IPC (feather) - pyarrow 필요. 없으면 캐시 없이 동작
+- 용량 제한: 최근 사용 시각(mtime) 기준 LRU 삭제
+- 위치: ~/.cache/payroll-automation/ledgers (PAYROLL_CACHE_DIR로 변경, --no-cache로 끔)
+- 보안: 캐시 파일에는 주민번호가 평문으로 들어 있으므로 디렉토리는 소유자 전용(0700)으로
+  만들고 파일은 0600으로 씀. 공유 PC에서는 --no-cache 사용 또는 캐시 디렉토리 정리 필요
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Callable, Literal
+
+import pandas as pd
+
+from ..config.schema import BusinessPayrollConfig
+from .mapper import map_to_standard
+from .reader import read_payroll_excel
+
+try:
+    import pyarrow  # noqa: F401  (feather 읽기/쓰기용)
+    _HAS_ARROW = True
+except ImportError:
+    _HAS_ARROW = False
+
+
+# 리더/매퍼 파싱 규칙이 바뀌면 올려서 기존 캐시 무효화
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024   # 512MB
+_SUFFIX = ".arrow"
+
+
+def _default_cache_dir() -> Path:
+    """캐시 디렉토리 (환경변수 PAYROLL_CACHE_DIR 우선)"""
+    env_dir = os.environ.get("PAYROLL_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir)
+    return Path.home() / ".cache" / "payroll-automation" / "ledgers"
+
+
+def ensure_private_dir(directory: Path) -> None:
+    """디렉토리 생성 + 소유자 전용 권한(0700) 적용 (기존 디렉토리도 권한 조정)"""
+    directory.mkdir(parents=True, exist_ok=True, mode=0o700)
+    try:
+        os.chmod(directory, 0o700)
+    except OSError:
+        pass  # 권한 변경 불가 (다른 소유자 / Windows 등)
+
+
+def write_private_file(path: Path, write: Callable[[IO], None], mode: str = "wb") -> None:
+    """
+    소유자 전용 임시 파일(0600)에 쓴 뒤 원자적으로 교체 (디렉토리는 ensure_private_dir).
+    주민번호가 들어가는 레지스트리/급여 이력/스냅샷 저장용.
+    """
+    ensure_private_dir(path.parent)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, encoding=None if "b" in mode else "utf-8") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def file_digest(filepath: str | Path, chunk_size: int = 1024 * 1024) -> str:
+    """파일 내용 SHA-256 (청크 단위 읽기)"""
+    h = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        while chunk := f.read(chunk_size):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def config_fingerprint(config: BusinessPayrollConfig) -> str:
+    """파싱 결과에 영향을 주는 config 부분(excel 섹션 + version)의 지문"""
+    payload = f"{config.businessId}|{config.version}|{config.excel.model_dump_json()}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class LedgerCache:
+    """표준 DataFrame 디스크 캐시 (크기 제한 LRU, 소유자 전용 디렉토리)"""
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.directory = Path(directory) if directory else _default_cache_dir()
+        self.max_bytes = max_bytes
+
+    @property
+    def available(self) -> bool:
+        """pyarrow가 있어야 캐시 사용 가능"""
+        return _HAS_ARROW
+
+    def key(
+        self,
+        filepath: str | Path,
+        config: BusinessPayrollConfig,
+        sheet_name: str | None = None,
+    ) -> str:
+        """캐시 키 = 파일 해시 + config 지문 (+ 시트 지정 시 시트 이름 지문) + 포맷 버전"""
+        key = f"{file_digest(filepath)}-{config_fingerprint(config)}"
+        if sheet_name is not None:
+            key += "-" + hashlib.sha256(sheet_name.encode("utf-8")).hexdigest()[:8]
+        return f"{key}-v{CACHE_FORMAT_VERSION}"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """캐시 조회 (없거나 손상되었으면 None). 적중 시 LRU 순서 갱신"""
+        if not self.available:
+            return None
+        path = self._path(key)
+        try:
+            df = pd.read_feather(path)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # 손상된 캐시 파일 → 삭제 후 미스 처리
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """캐시 저장 (임시 파일에 쓴 뒤 원자적으로 교체) + 용량 초과분 삭제"""
+        if not self.available:
+            return
+        ensure_private_dir(self.directory)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            df.reset_index(drop=True).to_feather(tmp)
+            os.replace(tmp, self._path(key))
+        except Exception:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """총 용량이 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+        entries = []
+        for p in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        for p in self.directory.glob(f"*{_SUFFIX}"):
+            p.unlink(missing_ok=True)
+
+
+_default_cache: LedgerCache | None = None
+
+
+def default_cache() -> LedgerCache:
+    """프로세스 기본 캐시 (PAYROLL_CACHE_DIR / PAYROLL_CACHE_MAX_MB 반영)"""
+    global _default_cache
+    if _default_cache is None:
+        max_mb = os.environ.get("PAYROLL_CACHE_MAX_MB")
+        _default_cache = LedgerCache(
+            max_bytes=int(max_mb) * 1024 * 1024 if max_mb else DEFAULT_MAX_BYTES,
+        )
+    return _default_cache
+
+
+def resolve_layout(
+    filepath: str | Path,
+    config: BusinessPayrollConfig,
+    sheet_name: str | None = None,
+    use_cache: bool = True,
+) -> BusinessPayrollConfig:
+    """config.excel.columns가 비어 있으면 헤더 자동 감지 결과로 시트/행/컬럼을 채운 config"""
+    if config.excel.columns:
+        return config
+    from .detector import apply_detection, detect_columns
+
+    detected = detect_columns(filepath, config, sheet_name=sheet_name, use_cache=use_cache)
+    return apply_detection(config, detected) if detected is not None else config
+
+
+def load_standard_ledger(
+    filepath: str | Path,
+    config: BusinessPayrollConfig,
+    cache: LedgerCache | None = None,
+    use_cache: bool = True,
+    sheet_name: str | None = None,
+    engine: Literal["stream", "xml", "pandas"] = "stream",
+) -> pd.DataFrame:
+    """
+    read_payroll_excel + map_to_standard (캐시 적용).
+
+    같은 파일 내용과 같은 config로 이미 매핑한 결과가 있으면 캐시에서 로드.
+    config.excel.columns가 비어 있으면 헤더 자동 감지 결과로 시트/행/컬럼을 채움.
+    sheet_name을 지정하면 config의 시트 선택 대신 해당 시트를 읽음. engine은 read_payroll_excel 참고.
+    """
+    config = resolve_layout(filepath, config, sheet_name=sheet_name, use_cache=use_cache)
+
+    cache = cache or default_cache()
+    if not use_cache or not cache.available:
+        return map_to_standard(read_payroll_excel(filepath, config, sheet_name, engine), config)
+
+    key = cache.key(filepath, config, sheet_name)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    mapped = map_to_standard(read_payroll_excel(filepath, config, sheet_name, engine), config)
+    try:
+        cache.put(key, mapped)
+    except Exception:
+        pass  # 캐시 저장 실패는 무시 (결과에는 영향 없음)
+    return mapped
@@ -0,0 +1,741 @@
+"""
+엑셀 레이아웃 자동 감지
+payroll-manager/src/lib/excelDetector.ts (detectColumns / detectBestSheet) 포팅
+
+- 시트 XML을 직접 스트리밍 파싱하여 앞부분(기본 100행)만 읽고 중단
+  (openpyxl read_only는 dimension 정보가 없는 파일에서 시트 전체를 훑으므로 사용하지 않음)
+- 앞부분 행으로 데이터 시작 행/헤더 행/컬럼 매핑 추정
+- 헤더 후보 행은 fieldAliases(기본 별칭 + config 오버라이드) 일치 수로 점수화
+- 헤더 매칭 결과는 데이터 패턴(주민번호/이름/날짜/금액)으로 확인, 헤더가 없으면 패턴으로 보완
+- 결과는 파일 내용 해시 + 별칭 지문 기준으로 디스크에 캐시 (JSON)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import posixpath
+import re
+import tempfile
+import zipfile
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, time
+from pathlib import Path
+from xml.etree.ElementTree import iterparse
+
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel
+
+from ..config.schema import BusinessPayrollConfig
+from .cache import _default_cache_dir, ensure_private_dir, file_digest
+
+
+# 감지 규칙이 바뀌면 올려서 기존 캐시 무효화
+DETECTOR_VERSION = 1
+
+MAX_SCAN_ROWS = 100     # 감지에 읽는 최대 행 수
+MAX_SCAN_COLS = 100     # 감지에 읽는 최대 열 수
+SAMPLE_ROWS = 30        # 데이터 시작 행부터 패턴 분석에 쓰는 행 수
+
+# 시트 자동 선택 키워드 (detectBestSheet)
+DEFAULT_SHEET_KEYWORDS = ["임금대장", "급여대장", "급여", "임금", "급여현황", "급여명세"]
+
+# 표준 필드 → 헤더 별칭 (useExcelImport.ts FIELD_ALIASES, Python 표준 필드명 기준)
+DEFAULT_FIELD_ALIASES: dict[str, list[str]] = {
+    "name": ["이름", "성명", "근로자명", "사원명", "직원명"],
+    "residentNo": ["주민번호", "주민등록번호", "생년월일"],
+    "joinDate": ["입사일", "입사일자", "채용일", "취득일"],
+    "leaveDate": ["퇴사일", "퇴사일자", "퇴직일", "상실일"],
+    "phone": ["전화번호", "연락처", "핸드폰", "휴대폰", "휴대전화"],
+    "wage": ["임금총액", "지급총액", "지급합계", "총지급액", "급여총액", "총액"],
+    "basicWage": ["기본급", "기본급여", "월급"],
+    "overtimePay": ["연장근로", "연장수당", "연장근로수당", "시간외수당", "평일연장"],
+    "nightPay": ["야간근로", "야간수당", "야간근로수당"],
+    "holidayPay": ["휴일근로", "휴일수당", "휴일근로수당"],
+    "bonus": ["상여금", "상여", "보너스"],
+    "mealAllowance": ["식대", "식비", "중식대"],
+    "carAllowance": ["차량유지비", "자가운전", "차량비"],
+    "incomeTax": ["소득세", "근로소득세", "갑근세"],
+    "localIncomeTax": ["주민세", "지방소득세", "지방세"],
+    "nationalPension": ["국민연금", "연금"],
+    "healthInsurance": ["건강보험", "건보"],
+    "longTermCare": ["장기요양", "장기요양보험", "노인장기"],
+    "employmentInsurance": ["고용보험", "실업급여"],
+    "totalDeduction": ["공제액계", "공제합계", "총공제액", "공제총액"],
+    "netPay": ["실지급액", "실수령액", "차인지급액", "실지급", "수령액"],
+}
+
+# 셀 타입
+RESIDENT_NO = "RESIDENT_NO"
+KOREAN_NAME = "KOREAN_NAME"
+DATE = "DATE"
+LARGE_NUMBER = "LARGE_NUMBER"   # >= 100,000 (급여급)
+SMALL_NUMBER = "SMALL_NUMBER"   # < 100,000 (보험료/세금급)
+PHONE = "PHONE"
+TEXT = "TEXT"
+EMPTY = "EMPTY"
+
+_MONEY_TYPES = (LARGE_NUMBER, SMALL_NUMBER, EMPTY)
+
+# 헤더로 매칭된 필드가 받아들이는 데이터 타입 (EMPTY = 샘플 구간에 값 없음)
+_FIELD_TYPES: dict[str, tuple[str, ...]] = {
+    "name": (KOREAN_NAME, TEXT, EMPTY),
+    "residentNo": (RESIDENT_NO, TEXT),     # 헤더가 있으면 생년월일 검증 실패 값(가공 번호)도 허용
+    "joinDate": (DATE, EMPTY),
+    "leaveDate": (DATE, EMPTY),
+    "phone": (PHONE, EMPTY),
+}
+
+
+@dataclass
+class ColumnDetection:
+    """컬럼 1개 감지 결과"""
+    col: int                    # 1-indexed
+    dominant_type: str
+    confidence: float           # 0~1
+    samples: list[str] = field(default_factory=list)   # 최대 3개
+    header: str = ""            # 헤더 텍스트 (여러 행이면 공백으로 연결)
+    alias_field: str | None = None  # 헤더가 가리키는 표준 필드
+
+
+@dataclass
+class DetectionResult:
+    """시트 레이아웃 감지 결과"""
+    sheet_name: str
+    header_row: int             # 1-indexed
+    data_start_row: int         # 1-indexed
+    columns: dict[str, int]     # 표준 필드 → 1-indexed 컬럼 (config.excel.columns 형식)
+    header_score: int = 0       # 헤더 행의 별칭 일치 수
+    detections: list[ColumnDetection] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DetectionResult":
+        data = dict(data)
+        data["detections"] = [ColumnDetection(**d) for d in data.get("detections", [])]
+        return cls(**data)
+
+
+# ──────────────────────────────────────────
+# 셀 패턴 판별
+# ──────────────────────────────────────────
+
+_NAME_RE = re.compile(r"^[가-힣]{2,4}$")
+_PHONE_RE = re.compile(r"^01[016789]\d{7,8}$")
+_DATE_TEXT_RES = (
+    re.compile(r"^\d{4}-\d{2}-\d{2}$"),
+    re.compile(r"^\d{2}\.\d{1,2}\.\d{1,2}$"),
+    re.compile(r"^\d{4}[./]\d{1,2}[./]\d{1,2}$"),
+)
+_HEADER_STRIP_RE = re.compile(r"[\s\[\]().,/\-_]+")
+
+
+def _is_blank(val: object) -> bool:
+    return val is None or val == ""
+
+
+def _text(val: object) -> str:
+    """셀 값 → 문자열 (정수 값 float은 소수점 없이, 날짜는 YYYY-MM-DD)"""
+    if isinstance(val, (datetime, date)):
+        return val.strftime("%Y-%m-%d")
+    if isinstance(val, float) and val.is_integer():
+        return str(int(val))
+    return str(val).strip()
+
+
+def _number(val: object) -> float | None:
+    if isinstance(val, bool):
+        return None
+    if isinstance(val, (int, float)):
+        return float(val)
+    try:
+        return float(str(val).replace(",", ""))
+    except ValueError:
+        return None
+
+
+def is_resident_no(val: object) -> bool:
+    """주민번호 패턴 (숫자 13자리, 월 01~12 / 일 01~31)"""
+    if _is_blank(val) or isinstance(val, (datetime, date, time)):
+        return False
+    digits = re.sub(r"[^0-9]", "", _text(val))
+    if len(digits) != 13:
+        return False
+    month, day = int(digits[2:4]), int(digits[4:6])
+    return 1 <= month <= 12 and 1 <= day <= 31
+
+
+def classify_cell(val: object) -> str:
+    """
+    셀 값의 타입 (주민번호 > 전화번호 > 이름 > 날짜 > 큰숫자 > 작은숫자 > 텍스트).
+
+    TS 버전은 xlsx 날짜를 시리얼 숫자로 받아 1~73050 숫자를 모두 날짜로 보지만,
+    openpyxl은 날짜 서식 셀을 datetime으로 주므로 숫자는 금액으로만 판단.
+    숫자 0과 값이 0인 시각(time) 셀(빈 날짜 서식 셀)은 빈 값으로 취급.
+    """
+    if _is_blank(val) or (isinstance(val, time) and val == time(0, 0)):
+        return EMPTY
+    if isinstance(val, (int, float)) and not isinstance(val, bool) and val == 0:
+        return EMPTY
+    if isinstance(val, (datetime, date)):
+        return DATE
+    if is_resident_no(val):
+        return RESIDENT_NO
+    text = _text(val)
+    if _PHONE_RE.match(re.sub(r"[^0-9]", "", text)):
+        return PHONE
+    if _NAME_RE.match(text):
+        return KOREAN_NAME
+    if isinstance(val, str):
+        if any(r.match(text) for r in _DATE_TEXT_RES):
+            return DATE
+        if re.fullmatch(r"\d{8}", text) and 1 <= int(text[4:6]) <= 12:
+            return DATE
+    num = _number(val)
+    if num is not None and num >= 100_000:
+        return LARGE_NUMBER
+    if num is not None and 1 <= num < 100_000:
+        return SMALL_NUMBER
+    return TEXT
+
+
+# ──────────────────────────────────────────
+# 헤더 별칭 매칭
+# ──────────────────────────────────────────
+
+def normalize_header(text: str) -> str:
+    """헤더 텍스트 정규화 (공백·괄호·구두점 제거, 소문자)"""
+    return _HEADER_STRIP_RE.sub("", text).lower()
+
+
+def resolve_aliases(config: BusinessPayrollConfig | None = None) -> dict[str, list[str]]:
+    """기본 별칭 + config.excel.fieldAliases (필드 단위로 덮어씀)"""
+    aliases = dict(DEFAULT_FIELD_ALIASES)
+    if config is not None and config.excel.fieldAliases:
+        aliases.update(config.excel.fieldAliases)
+    return aliases
+
+
+class _AliasMatcher:
+    """정규화된 별칭 → 필드. 정확히 일치 > 긴 별칭 포함 순으로 선택"""
+
+    def __init__(self, aliases: dict[str, list[str]]):
+        self._pairs = sorted(
+            ((normalize_header(a), f) for f, names in aliases.items() for a in names if a.strip()),
+            key=lambda p: -len(p[0]),
+        )
+        self._exact = {}
+        for alias, f in self._pairs:
+            self._exact.setdefault(alias, f)
+
+    def match(self, text: object) -> str | None:
+        if _is_blank(text) or not isinstance(text, str):
+            return None
+        norm = normalize_header(text)
+        if not norm:
+            return None
+        if norm in self._exact:
+            return self._exact[norm]
+        for alias, f in self._pairs:
+            if alias in norm:
+                return f
+        return None
+
+
+# ──────────────────────────────────────────
+# 감지
+# ──────────────────────────────────────────
+
+def _cell(rows: list[tuple], r: int, c: int) -> object:
+    row = rows[r] if 0 <= r < len(rows) else ()
+    return row[c] if c < len(row) else None
+
+
+def _find_data_start(rows: list[tuple], n_cols: int) -> int:
+    """패턴 기반 데이터 시작 행 (0-indexed): 주민번호가 처음 나오는 행 → 숫자 3개 이상 행 → 2"""
+    for r, row in enumerate(rows):
+        if any(is_resident_no(v) for v in row[:n_cols]):
+            return r
+    for r, row in enumerate(rows):
+        numeric = sum(isinstance(v, (int, float)) and not isinstance(v, bool) for v in row[:n_cols])
+        if numeric >= 3:
+            return r
+    return 2
+
+
+def _locate_header(
+    rows: list[tuple],
+    n_cols: int,
+    matcher: _AliasMatcher,
+) -> tuple[int, int, int]:
+    """
+    헤더 행 / 데이터 시작 행 (0-indexed)과 헤더 점수.
+
+    읽은 모든 행을 별칭 일치 셀 수로 점수화하여 2개 이상 일치한 최고점 행(동점이면 위쪽)을 헤더로,
+    그 아래 별칭이 없는 첫 비어 있지 않은 행을 데이터 시작으로 봄 (2단 헤더의 아래 행은 건너뜀).
+    별칭 일치 행이 없으면 TS 버전처럼 패턴으로 데이터 시작을 찾고 그 위 3행 중 최고점 행을 헤더로.
+    """
+    scores = [sum(matcher.match(v) is not None for v in row[:n_cols]) for row in rows]
+    best = max(scores, default=0)
+    if best >= 2:
+        header = scores.index(best)
+        for r in range(header + 1, len(rows)):
+            if scores[r] == 0 and any(not _is_blank(v) for v in rows[r][:n_cols]):
+                return header, r, best
+        return header, min(header + 1, len(rows) - 1), best
+
+    data_start = _find_data_start(rows, n_cols)
+    header, best = max(0, data_start - 1), 0
+    for r in range(max(0, data_start - 3), min(data_start, len(rows))):
+        if scores[r] > best:
+            best, header = scores[r], r
+    return header, data_start, best
+
+
+def _detect_rows(
+    rows: list[tuple],
+    sheet_name: str,
+    matcher: _AliasMatcher,
+) -> DetectionResult | None:
+    """시트 앞부분 행(values_only 튜플)으로 레이아웃 감지"""
+    if len(rows) < 3:
+        return None
+    n_cols = min(max((len(r) for r in rows), default=0), MAX_SCAN_COLS)
+    header_row, data_start, best = _locate_header(rows, n_cols, matcher)
+
+    # 헤더 구간: 헤더 행 바로 위 ~ 데이터 시작 직전 (2단 헤더 대응)
+    band = range(max(0, header_row - 1), data_start)
+
+    sample_end = min(data_start + SAMPLE_ROWS, len(rows))
+    detections: list[ColumnDetection] = []
+    for c in range(n_cols):
+        counts: dict[str, int] = {}
+        samples: list[str] = []
+        for r in range(data_start, sample_end):
+            val = _cell(rows, r, c)
+            kind = classify_cell(val)
+            counts[kind] = counts.get(kind, 0) + 1
+            if kind != EMPTY and len(samples) < 3:
+                samples.append(_text(val)[:20])
+
+        non_empty = {k: n for k, n in counts.items() if k != EMPTY}
+        if non_empty:
+            dominant = max(non_empty, key=lambda k: non_empty[k])
+            confidence = non_empty[dominant] / sum(non_empty.values())
+        else:
+            dominant, confidence = EMPTY, 0.0
+
+        # 헤더 텍스트: 데이터에 가까운 행부터 별칭 매칭 (병합 셀은 빈 값 → 위 행 사용)
+        texts = [_cell(rows, r, c) for r in band]
+        texts = [t for t in texts if isinstance(t, str) and t.strip()]
+        alias_field = next((f for f in map(matcher.match, reversed(texts)) if f), None)
+        header = " ".join(dict.fromkeys(" ".join(_text(t).split()) for t in texts))
+
+        if alias_field and dominant in _FIELD_TYPES.get(alias_field, _MONEY_TYPES):
+            confidence = min(1.0, confidence + 0.2)   # 헤더 + 데이터 패턴 일치 보너스
+
+        if dominant == EMPTY and not header:
+            continue
+        detections.append(ColumnDetection(
+            col=c + 1,
+            dominant_type=dominant,
+            confidence=round(confidence, 4),
+            samples=samples,
+            header=header,
+            alias_field=alias_field,
+        ))
+
+    return DetectionResult(
+        sheet_name=sheet_name,
+        header_row=header_row + 1,
+        data_start_row=data_start + 1,
+        columns=_build_mapping(detections),
+        header_score=best,
+        detections=detections,
+    )
+
+
+def _build_mapping(detections: list[ColumnDetection]) -> dict[str, int]:
+    """
+    감지된 컬럼 → 표준 필드 매핑 (buildMapping).
+
+    1차: 헤더 별칭 + 데이터 패턴 일치 (필드별 가장 왼쪽 컬럼)
+    2차: 패턴 기반 보완 - 주민번호(신뢰도 최고), 이름(주민번호 왼쪽 1~2칸),
+         입사/퇴사일(날짜 컬럼 순서), 임금총액(마지막 큰 숫자 컬럼)
+    """
+    mapping: dict[str, int] = {}
+    used: set[int] = set()
+
+    def assign(f: str, det: ColumnDetection) -> None:
+        mapping[f] = det.col
+        used.add(det.col)
+
+    for det in detections:
+        f = det.alias_field
+        if f and f not in mapping and det.col not in used \
+                and det.dominant_type in _FIELD_TYPES.get(f, _MONEY_TYPES):
+            assign(f, det)
+
+    free = [d for d in detections if d.col not in used]
+
+    if "residentNo" not in mapping:
+        residents = [d for d in free if d.dominant_type == RESIDENT_NO]
+        if residents:
+            assign("residentNo", max(residents, key=lambda d: d.confidence))
+
+    if "name" not in mapping:
+        names = [d for d in free if d.dominant_type == KOREAN_NAME and d.col not in used]
+        if names:
+            assign("name", names[0])
+        elif "residentNo" in mapping:
+            by_col = {d.col: d for d in free}
+            for offset in (1, 2):
+                cand = by_col.get(mapping["residentNo"] - offset)
+                if cand and cand.col not in used and cand.dominant_type in (TEXT, KOREAN_NAME):
+                    assign("name", cand)
+                    break
+
+    dates = [d for d in free if d.dominant_type == DATE and d.col not in used]
+    for f in ("joinDate", "leaveDate"):
+        if f not in mapping and dates:
+            assign(f, dates.pop(0))
+
+    if "wage" not in mapping:
+        large = [d for d in free if d.dominant_type == LARGE_NUMBER and d.col not in used]
+        if large:
+            assign("wage", large[-1])
+
+    if "phone" not in mapping:
+        phones = [d for d in free if d.dominant_type == PHONE and d.col not in used]
+        if phones:
+            assign("phone", phones[0])
+
+    return dict(sorted(mapping.items(), key=lambda kv: kv[1]))
+
+
+def _best_sheet(book: "_XlsxHead", keywords: list[str]) -> str:
+    """
+    최적 시트 (detectBestSheet).
+    1) 키워드를 포함하는 시트 (키워드 순서 우선) 2) 앞 30행×30열 주민번호가 가장 많은 시트 3) 첫 시트
+    """
+    names = book.sheetnames
+    for kw in keywords:
+        for name in names:
+            if kw in name:
+                return name
+
+    best, best_count = names[0], 0
+    for name in names:
+        rows = book.rows(name, max_rows=30, max_cols=30)
+        count = sum(is_resident_no(v) for row in rows for v in row)
+        if count > best_count:
+            best, best_count = name, count
+    return best
+
+
+def detect_best_sheet(filepath: str | Path, keywords: list[str] | None = None) -> str:
+    """워크북에서 급여대장 시트 자동 선택"""
+    with _XlsxHead(filepath) as book:
+        return _best_sheet(book, keywords or DEFAULT_SHEET_KEYWORDS)
+
+
+# ──────────────────────────────────────────
+# 시트 앞부분 스트리밍 읽기 (xlsx XML 직접 파싱)
+# ──────────────────────────────────────────
+
+_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+class _XlsxHead:
+    """
+    xlsx 시트의 앞 N행만 읽는 최소 리더.
+
+    - 시트 XML을 iterparse로 읽다가 max_rows를 넘으면 중단 (압축 해제도 그 지점까지만)
+    - 공유 문자열은 읽은 행에서 참조한 최대 인덱스까지만 파싱
+    - 날짜 서식 숫자 셀은 datetime으로 변환 (openpyxl과 같은 값, workbookPr date1904 반영)
+    """
+
+    def __init__(self, filepath: str | Path):
+        self._zip = zipfile.ZipFile(filepath)
+        self._epoch = CALENDAR_WINDOWS_1900
+        self._sheets = self._sheet_paths()
+        self._date_styles: set[int] | None = None
+        self._strings: list[str] = []
+        self._strings_done = False
+
+    def __enter__(self) -> "_XlsxHead":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._zip.close()
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return list(self._sheets)
+
+    def _parse(self, name: str):
+        with self._zip.open(name) as f:
+            yield from iterparse(f, events=("end",))
+
+    def _sheet_paths(self) -> dict[str, str]:
+        """시트 이름 → zip 내부 경로 (workbook.xml + 관계 파일). 날짜 기준(1900/1904)도 함께 읽음"""
+        targets = {}
+        for _, el in self._parse("xl/_rels/workbook.xml.rels"):
+            if el.tag == f"{_PKG_REL_NS}Relationship":
+                target = el.get("Target", "")
+                targets[el.get("Id")] = (
+                    target.lstrip("/") if target.startswith("/") else posixpath.normpath(f"xl/{target}")
+                )
+        sheets = {}
+        for _, el in self._parse("xl/workbook.xml"):
+            if el.tag == f"{_NS}sheet":
+                sheets[el.get("name")] = targets.get(el.get(f"{_REL_NS}id"), "")
+            elif el.tag == f"{_NS}workbookPr" and el.get("date1904", "").lower() in ("1", "true"):
+                self._epoch = CALENDAR_MAC_1904
+        return sheets
+
+    def _load_date_styles(self) -> set[int]:
+        """날짜 서식인 셀 스타일(cellXfs) 인덱스"""
+        if self._date_styles is not None:
+            return self._date_styles
+        custom: dict[int, str] = {}
+        fmt_ids: list[int] = []
+        if "xl/styles.xml" in self._zip.namelist():
+            in_xfs = False
+            with self._zip.open("xl/styles.xml") as f:
+                for event, el in iterparse(f, events=("start", "end")):
+                    if el.tag == f"{_NS}cellXfs":
+                        in_xfs = event == "start"
+                    elif event == "end" and el.tag == f"{_NS}numFmt":
+                        custom[int(el.get("numFmtId"))] = el.get("formatCode", "")
+                    elif event == "end" and in_xfs and el.tag == f"{_NS}xf":
+                        fmt_ids.append(int(el.get("numFmtId", 0)))
+        self._date_styles = {
+            i for i, fid in enumerate(fmt_ids)
+            if is_date_format(custom.get(fid) or BUILTIN_FORMATS.get(fid, "General"))
+        }
+        return self._date_styles
+
+    def _shared_strings(self, upto: int) -> list[str]:
+        """공유 문자열 0..upto (필요한 만큼만 이어서 파싱)"""
+        if len(self._strings) > upto or self._strings_done:
+            return self._strings
+        self._strings = []
+        if "xl/sharedStrings.xml" in self._zip.namelist():
+            for _, el in self._parse("xl/sharedStrings.xml"):
+                if el.tag == f"{_NS}si":
+                    # 발음 표기(rPh) 제외, 본문/서식 run의 텍스트만
+                    parts = [t.text or "" for t in el.findall(f"{_NS}t")]
+                    parts += [t.text or "" for t in el.findall(f"{_NS}r/{_NS}t")]
+                    self._strings.append("".join(parts))
+                    el.clear()
+                    if len(self._strings) > upto:
+                        return self._strings
+        self._strings_done = True
+        return self._strings
+
+    def rows(self, sheet: str, max_rows: int, max_cols: int = MAX_SCAN_COLS) -> list[tuple]:
+        """시트 앞 max_rows행 (values_only 튜플, 행 번호 = 인덱스 + 1)"""
+        path = self._sheets.get(sheet)
+        if not path:
+            raise KeyError(f"시트가 없습니다: {sheet}")
+        date_styles = self._load_date_styles()
+
+        cells: dict[int, dict[int, tuple[str, str | None, int]]] = {}
+        shared_max = -1
+        row_no = 0
+        for _, el in self._parse(path):
+            if el.tag != f"{_NS}row":
+                continue
+            row_no = int(el.get("r", row_no + 1))
+            if row_no > max_rows:
+                break
+            values = {}
+            col = 0
+            for c in el.iter(f"{_NS}c"):
+                ref = c.get("r")
+                col = column_index_from_string(coordinate_from_string(ref)[0]) if ref else col + 1
+                if col > max_cols:
+                    continue
+                kind = c.get("t", "n")
+                if kind == "inlineStr":
+                    text = "".join(t.text or "" for t in c.iter(f"{_NS}t")) or None
+                else:
+                    v = c.find(f"{_NS}v")
+                    text = v.text if v is not None else None
+                if text is None:
+                    continue
+                if kind == "s":
+                    shared_max = max(shared_max, int(text))
+                values[col] = (kind, text, int(c.get("s", 0)))
+            cells[row_no] = values
+            el.clear()
+
+        strings = self._shared_strings(shared_max) if shared_max >= 0 else []
+        out: list[tuple] = []
+        for r in range(1, min(row_no, max_rows) + 1):
+            values = cells.get(r, {})
+            width = max(values, default=0)
+            row = [None] * width
+            for col, (kind, text, style) in values.items():
+                row[col - 1] = self._value(kind, text, style, strings, date_styles, self._epoch)
+            out.append(tuple(row))
+        return out
+
+    @staticmethod
+    def _value(
+        kind: str,
+        text: str,
+        style: int,
+        strings: list[str],
+        date_styles: set[int],
+        epoch: datetime = CALENDAR_WINDOWS_1900,
+    ) -> object:
+        if kind == "s":
+            return strings[int(text)]
+        if kind in ("str", "inlineStr"):
+            return text
+        if kind == "b":
+            return text == "1"
+        if kind == "e":
+            return text     # 오류 값 (#N/A 등) - openpyxl과 동일하게 문자열
+        if kind == "d":
+            return datetime.fromisoformat(text)
+        num = float(text) if any(ch in text for ch in ".eE") else int(text)
+        if style in date_styles:
+            try:
+                return from_excel(num, epoch)
+            except (ValueError, OverflowError):
+                return num
+        return num
+
+
+# ──────────────────────────────────────────
+# 캐시 + 진입점
+# ──────────────────────────────────────────
+
+# 프로세스 내 감지 결과 (최근 사용 순, 장시간 실행 시 무한히 커지지 않도록 상한)
+_MEMORY_CACHE_SIZE = 256
+_memory_cache: OrderedDict[str, DetectionResult] = OrderedDict()
+
+
+def _remember(key: str, result: DetectionResult) -> None:
+    _memory_cache[key] = result
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _detection_cache_dir() -> Path:
+    return _default_cache_dir() / "detections"
+
+
+def _detection_key(
+    filepath: str | Path,
+    aliases: dict[str, list[str]],
+    keywords: list[str],
+    sheet_name: str | None,
+    max_rows: int,
+) -> str:
+    """캐시 키 = 파일 내용 해시 + 감지 조건(별칭/키워드/시트/행 수) 지문 + 감지 규칙 버전"""
+    payload = json.dumps([aliases, keywords, sheet_name, max_rows], ensure_ascii=False, sort_keys=True)
+    params = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+    return f"{file_digest(filepath)}-{params}-v{DETECTOR_VERSION}"
+
+
+def _load_cached(path: Path) -> DetectionResult | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return DetectionResult.from_dict(json.load(f))
+    except FileNotFoundError:
+        return None
+    except Exception:
+        path.unlink(missing_ok=True)   # 손상된 캐시 → 삭제 후 미스 처리
+        return None
+
+
+def _store_cached(path: Path, result: DetectionResult) -> None:
+    ensure_private_dir(path.parent)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(asdict(result), f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except Exception:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def detect_columns(
+    filepath: str | Path,
+    config: BusinessPayrollConfig | None = None,
+    sheet_name: str | None = None,
+    max_rows: int = MAX_SCAN_ROWS,
+    use_cache: bool = True,
+    cache_dir: str | Path | None = None,
+) -> DetectionResult | None:
+    """
+    엑셀 파일의 헤더 행 / 데이터 시작 행 / 컬럼 매핑 자동 감지.
+
+    Parameters
+    ----------
+    filepath : 엑셀 파일 경로
+    config : 사업장 config (fieldAliases / sheetName / sheetKeywords 사용, 없으면 기본값)
+    sheet_name : 대상 시트 (없으면 config.sheetName → 키워드/주민번호 밀도로 선택)
+    max_rows : 시트 앞에서 읽을 최대 행 수
+    use_cache : 파일 내용 해시 기준 감지 결과 캐시 사용
+    cache_dir : 캐시 디렉토리 (기본: 파싱 캐시 디렉토리/detections)
+
+    Returns
+    -------
+    DetectionResult (행이 3개 미만인 시트면 None)
+    """
+    aliases = resolve_aliases(config)
+    keywords = list(config.excel.sheetKeywords or []) if config else []
+    keywords += [k for k in DEFAULT_SHEET_KEYWORDS if k not in keywords]
+    preferred = sheet_name or (config.excel.sheetName if config else None)
+
+    path = None
+    if use_cache:
+        key = _detection_key(filepath, aliases, keywords, preferred, max_rows)
+        if key in _memory_cache:
+            _memory_cache.move_to_end(key)
+            return _memory_cache[key]
+        path = Path(cache_dir) if cache_dir else _detection_cache_dir()
+        path = path / f"{key}.json"
+        cached = _load_cached(path)
+        if cached is not None:
+            _remember(key, cached)
+            return cached
+
+    with _XlsxHead(filepath) as book:
+        if sheet_name:
+            sheet = sheet_name
+        elif preferred in book.sheetnames:
+            sheet = preferred
+        else:
+            sheet = _best_sheet(book, keywords)
+        rows = book.rows(sheet, max_rows)
+    result = _detect_rows(rows, sheet, _AliasMatcher(aliases))
+
+    if use_cache and result is not None:
+        _remember(key, result)
+        try:
+            _store_cached(path, result)
+        except OSError:
+            pass  # 캐시 저장 실패는 무시 (결과에는 영향 없음)
+    return result
+
+
+def apply_detection(config: BusinessPayrollConfig, result: DetectionResult) -> BusinessPayrollConfig:
+    """감지 결과로 config.excel의 시트/헤더 행/데이터 시작 행/컬럼을 채운 사본"""
+    excel = config.excel.model_copy(update={
+        "sheetName": result.sheet_name,
+        "headerRow": result.header_row,
+        "dataStartRow": result.data_start_row,
+        "columns": dict(result.columns),
+    })
+    return config.model_copy(update={"excel": excel})
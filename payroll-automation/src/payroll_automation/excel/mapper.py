@@ -7,17 +7,17 @@ from __future__ import annotations
 import pandas as pd
 
 from ..config.schema import BusinessPayrollConfig
-from .reader import parse_date, parse_number, parse_resident_no
+from .reader import parse_date_series, parse_number_series, parse_resident_no_series
 
 
-# 표준 필드 → 파서 매핑
+# 표준 필드 → 컬럼 단위 파서 매핑 (스칼라 기준 구현은 reader.parse_*)
 _PARSERS: dict[str, callable] = {
-    "residentNo": parse_resident_no,
-    "joinDate": parse_date,
-    "leaveDate": parse_date,
+    "residentNo": parse_resident_no_series,
+    "joinDate": parse_date_series,
+    "leaveDate": parse_date_series,
 }
 
-# 금액 필드 (자동으로 parse_number 적용)
+# 금액 필드 (자동으로 parse_number_series 적용)
 _MONEY_FIELDS = {
     "wage", "basicWage", "totalWage",
     "mealAllowance", "carAllowance", "childcareAllowance",
@@ -28,6 +28,11 @@ _MONEY_FIELDS = {
 }
 
 
+def _parse_text_series(series: pd.Series) -> pd.Series:
+    """기본 문자열 변환 (NaN → 빈 문자열, 앞뒤 공백 제거)"""
+    return series.astype(str).str.strip().where(series.notna(), "")
+
+
 def map_to_standard(
     df: pd.DataFrame,
     config: BusinessPayrollConfig,
@@ -36,10 +41,10 @@ def map_to_standard(
     원시 DataFrame → 표준 필드명 DataFrame.
 
     config.excel.columns에서 {필드: 1-indexed 컬럼번호} 매핑을 읽어
-    해당 필드에 맞는 파서를 자동 적용.
+    해당 필드에 맞는 파서를 컬럼 단위(벡터화)로 적용.
     """
     columns = config.excel.columns
-    result: dict[str, list] = {}
+    result: dict[str, pd.Series] = {}
 
     for field, col_1indexed in columns.items():
         if col_1indexed is None:
@@ -47,24 +52,23 @@ def map_to_standard(
 
         col_idx = col_1indexed - 1  # 0-indexed
 
-        if col_idx < 0 or col_idx >= len(df.columns):
+        # 리더가 반환한 컬럼 라벨 = 0-indexed 엑셀 컬럼 번호
+        # (스트리밍 리더는 config에 지정된 컬럼만 포함)
+        if col_idx < 0 or col_idx not in df.columns:
             continue
 
-        raw_series = df.iloc[:, col_idx]
+        raw_series = df[col_idx]
 
         # 필드별 파서 적용
         if field in _PARSERS:
-            result[field] = [_PARSERS[field](v) for v in raw_series]
+            result[field] = _PARSERS[field](raw_series)
         elif field in _MONEY_FIELDS:
-            result[field] = [parse_number(v) for v in raw_series]
+            result[field] = parse_number_series(raw_series)
         else:
             # 기본: 문자열 변환 (NaN → 빈 문자열)
-            result[field] = [
-                "" if pd.isna(v) else str(v).strip()
-                for v in raw_series
-            ]
+            result[field] = _parse_text_series(raw_series)
 
-    mapped = pd.DataFrame(result)
+    mapped = pd.DataFrame(result).reset_index(drop=True)
 
     # 빈 행 제거 (이름이 비어있으면 skip)
     if "name" in mapped.columns:
@@ -5,18 +5,20 @@ Config 기반 범용 엑셀 리더
 from __future__ import annotations
 
 import re
+import sys
+from datetime import date, datetime
 from pathlib import Path
+from typing import Iterable, Literal
 
+import numpy as np
 import pandas as pd
+from openpyxl import load_workbook
 
 from ..config.schema import BusinessPayrollConfig
 
 
-def _find_sheet(filepath: str, config: BusinessPayrollConfig) -> str:
-    """config 기반 시트 자동 선택"""
-    xl = pd.ExcelFile(filepath)
-    sheet_names = xl.sheet_names
-
+def _select_sheet(sheet_names: list[str], config: BusinessPayrollConfig) -> str:
+    """시트 이름 목록에서 config 기반으로 대상 시트 선택"""
     # 1순위: config에 지정된 sheetName
     if config.excel.sheetName in sheet_names:
         return config.excel.sheetName
@@ -31,19 +33,106 @@ def _find_sheet(filepath: str, config: BusinessPayrollConfig) -> str:
     return sheet_names[0]
 
 
-def read_payroll_excel(
-    filepath: str | Path,
+def _find_sheet(filepath: str, config: BusinessPayrollConfig) -> str:
+    """config 기반 시트 자동 선택"""
+    xl = pd.ExcelFile(filepath)
+    return _select_sheet(xl.sheet_names, config)
+
+
+def _configured_columns(config: BusinessPayrollConfig) -> list[int]:
+    """config.excel.columns에 지정된 0-indexed 컬럼 번호 (정렬, 중복 제거)"""
+    return sorted({
+        v - 1
+        for v in config.excel.columns.values()
+        if v is not None and v >= 1
+    })
+
+
+def _read_streaming(
+    filepath: str,
     config: BusinessPayrollConfig,
-    sheet_name: str | None = None,
+    sheet_name: str | None,
 ) -> pd.DataFrame:
     """
-    config 기반으로 엑셀 파일을 읽어 원시 DataFrame 반환.
+    openpyxl read_only 모드 스트리밍 읽기.
 
-    - config.excel.headerRow / dataStartRow가 있으면 무조건 신뢰 (자동감지 안 함).
-    - 숨겨진 행/열을 포함하여 있는 그대로 읽음 (skipfooter, comment 없음).
-    - config.excel.columns 인덱스가 실제 범위를 벗어나도 에러 없이 빈값 처리.
+    워크북을 한 번만 열어 같은 핸들에서 시트를 고르고,
+    dataStartRow부터 config에 지정된 컬럼만 추출.
+    반환 DataFrame의 컬럼 라벨은 0-indexed 엑셀 컬럼 번호.
     """
-    filepath = str(filepath)
+    col_idxs = _configured_columns(config)
+    if not col_idxs:
+        return pd.DataFrame()
+
+    wb = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        sheet = sheet_name or _select_sheet(wb.sheetnames, config)
+        ws = wb[sheet]
+        return _rows_to_frame(
+            ws.iter_rows(
+                min_row=config.excel.dataStartRow,
+                max_col=col_idxs[-1] + 1,
+                values_only=True,
+            ),
+            col_idxs,
+        )
+    finally:
+        wb.close()
+
+
+def _read_xml(
+    filepath: str,
+    config: BusinessPayrollConfig,
+    sheet_name: str | None,
+) -> pd.DataFrame:
+    """
+    시트 XML 직접 스트리밍 읽기 (detector._XlsxHead).
+
+    openpyxl read_only는 워크북을 열 때 dimension 정보가 없는 시트를 모두 훑으므로
+    시트가 많은 워크북에서 시트 1개만 읽을 때는 대상 시트 XML만 파싱하는 쪽이 빠름.
+    값 변환(공유 문자열/날짜 서식)은 openpyxl과 동일.
+    """
+    from .detector import _XlsxHead  # detector → cache → reader 순환 import 방지
+
+    col_idxs = _configured_columns(config)
+    if not col_idxs:
+        return pd.DataFrame()
+
+    with _XlsxHead(filepath) as book:
+        sheet = sheet_name or _select_sheet(book.sheetnames, config)
+        rows = book.rows(sheet, max_rows=sys.maxsize, max_cols=col_idxs[-1] + 1)
+    return _rows_to_frame(rows[config.excel.dataStartRow - 1:], col_idxs)
+
+
+def _rows_to_frame(rows: Iterable[tuple], col_idxs: list[int]) -> pd.DataFrame:
+    """values_only 행 → 지정 컬럼만 담은 DataFrame (컬럼 라벨 = 0-indexed 컬럼 번호)"""
+    cols: dict[int, list] = {c: [] for c in col_idxs}
+    n_rows = 0      # 마지막으로 값이 있던 행까지의 행 수
+    buffered = 0    # 아직 확정되지 않은 빈 행 수
+
+    for row in rows:
+        values = [row[c] if c < len(row) else None for c in col_idxs]
+        for c, v in zip(col_idxs, values):
+            cols[c].append(v)
+        # 끝부분 빈 행은 pandas 리더와 동일하게 잘라냄
+        if any(v is not None and v != "" for v in values):
+            n_rows += buffered + 1
+            buffered = 0
+        else:
+            buffered += 1
+
+    if n_rows == 0:
+        return pd.DataFrame()
+
+    return pd.DataFrame({c: vals[:n_rows] for c, vals in cols.items()})
+
+
+def _read_pandas(
+    filepath: str,
+    config: BusinessPayrollConfig,
+    sheet_name: str | None,
+) -> pd.DataFrame:
+    """pd.read_excel 기반 전체 읽기 (기존 방식, 비교/디버깅용)"""
     sheet = sheet_name or _find_sheet(filepath, config)
 
     # header=None: 수동 행 제어. 숨겨진 행/열 포함 전체 읽기.
@@ -72,6 +161,37 @@ def read_payroll_excel(
     return df
 
 
+def read_payroll_excel(
+    filepath: str | Path,
+    config: BusinessPayrollConfig,
+    sheet_name: str | None = None,
+    engine: Literal["stream", "xml", "pandas"] = "stream",
+) -> pd.DataFrame:
+    """
+    config 기반으로 엑셀 파일을 읽어 원시 DataFrame 반환.
+
+    - config.excel.headerRow / dataStartRow가 있으면 무조건 신뢰 (자동감지 안 함).
+    - 숨겨진 행/열을 포함하여 있는 그대로 읽음 (skipfooter, comment 없음).
+    - config.excel.columns 인덱스가 실제 범위를 벗어나도 에러 없이 빈값 처리.
+    - 컬럼 라벨은 0-indexed 엑셀 컬럼 번호 (map_to_standard가 라벨로 조회).
+
+    engine
+        "stream": openpyxl read_only 스트리밍. 워크북을 한 번만 열고
+                  config에 지정된 컬럼만 읽음 (기본값).
+        "xml": 대상 시트 XML만 직접 스트리밍 파싱. 시트가 많은 워크북에서
+               시트 1개를 읽을 때 다른 시트를 훑지 않음.
+        "pandas": pd.read_excel로 전체 시트를 읽음 (기존 방식).
+    """
+    filepath = str(filepath)
+    if engine == "pandas":
+        return _read_pandas(filepath, config, sheet_name)
+    if engine == "stream":
+        return _read_streaming(filepath, config, sheet_name)
+    if engine == "xml":
+        return _read_xml(filepath, config, sheet_name)
+    raise ValueError(f"지원하지 않는 engine: {engine}")
+
+
 def parse_resident_no(raw: object) -> str:
     """주민번호 정규화 (비숫자 제거 + 13자리 패딩)"""
     if raw is None or pd.isna(raw):
@@ -84,11 +204,11 @@ def parse_resident_no(raw: object) -> str:
 
 def parse_date(raw: object) -> str:
     """날짜 파싱 → YYYY-MM-DD 문자열"""
-    if raw is None or (isinstance(raw, float) and pd.isna(raw)):
+    if raw is None or raw is pd.NaT or (isinstance(raw, float) and pd.isna(raw)):
         return ""
 
-    # pandas Timestamp
-    if isinstance(raw, pd.Timestamp):
+    # pandas Timestamp / datetime / date (스트리밍 리더는 datetime 원본 반환)
+    if isinstance(raw, (pd.Timestamp, datetime, date)):
         return raw.strftime("%Y-%m-%d")
 
     # 숫자 (엑셀 시리얼)
@@ -130,3 +250,125 @@ def parse_number(raw: object) -> int:
         return int(float(cleaned))
     except (ValueError, TypeError):
         return 0
+
+
+# ──────────────────────────────────────────
+# 벡터화 파서 (pd.Series 단위)
+# 위 스칼라 파서와 동일한 결과를 컬럼 전체에 대해 한 번에 계산
+# ──────────────────────────────────────────
+
+_EXCEL_EPOCH = pd.Timestamp("1899-12-30")
+# 엑셀 시리얼 → Timestamp 변환이 가능한 일수 범위 (pandas ns 범위)
+_SERIAL_MIN = (pd.Timestamp.min.date() - _EXCEL_EPOCH.date()).days + 1
+_SERIAL_MAX = (pd.Timestamp.max.date() - _EXCEL_EPOCH.date()).days
+
+_DATE_TYPES = (datetime, date, pd.Timestamp)
+
+
+def _text_mask(series: pd.Series) -> pd.Series:
+    """원본 값이 문자열(str)인 위치. 타입 분류만 원소 단위로 수행"""
+    if pd.api.types.is_string_dtype(series) and series.dtype != object:
+        return series.notna()
+    return series.map(type) == str
+
+
+def parse_resident_no_series(series: pd.Series) -> pd.Series:
+    """parse_resident_no 벡터화 버전"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        series = series.astype(object)
+    na = series.isna()
+    digits = series.astype(str).str.replace(r"[^0-9]", "", regex=True)
+    n = digits.str.len()
+    short = (n > 0) & (n < 13)
+    if short.any():
+        digits[short] = digits[short].str.zfill(13)
+    return digits.where(~na, "")
+
+
+def parse_number_series(series: pd.Series) -> pd.Series:
+    """parse_number 벡터화 버전"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        series = series.astype(object)
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+        values = series.astype("float64")
+    else:
+        is_text = _text_mask(series)
+        direct = pd.to_numeric(series.where(~is_text), errors="coerce")
+        # 숫자로 바로 변환되지 않는 값은 스칼라 버전처럼 str() 후 정리
+        as_text = is_text | (series.notna() & direct.isna())
+        values = direct.astype("float64")
+        if as_text.any():
+            cleaned = series[as_text].astype(str).str.replace(r"[^0-9.\-]", "", regex=True)
+            values[as_text] = pd.to_numeric(cleaned, errors="coerce").astype("float64")
+
+    values = values.where(np.isfinite(values), 0)
+    return pd.Series(np.trunc(values.to_numpy()).astype("int64"), index=series.index)
+
+
+def _format_timestamps(ts: pd.Series) -> pd.Series:
+    """datetime64 Series → YYYY-MM-DD 문자열 (strftime 대신 numpy 일 단위 변환)"""
+    days = ts.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+    return pd.Series(np.datetime_as_string(days, unit="D"), index=ts.index, dtype=object)
+
+
+def _format_serial_dates(days: pd.Series) -> pd.Series:
+    """엑셀 시리얼 일수 → YYYY-MM-DD (범위 밖/NaN은 빈 문자열)"""
+    days = days.astype("float64")
+    ok = np.isfinite(days) & (days >= _SERIAL_MIN) & (days <= _SERIAL_MAX)
+    whole = np.trunc(days.where(ok, 0)).astype("int64")
+    ts = _EXCEL_EPOCH + pd.to_timedelta(whole, unit="D")
+    return _format_timestamps(ts).where(ok, "")
+
+
+def _format_date_text(s: pd.Series) -> pd.Series:
+    """문자열 날짜 정규화 (YYYY-MM-DD / YYYYMMDD / YY.MM.DD, 그 외는 그대로)"""
+    out = s.astype(object)
+    n = s.str.len()
+
+    # YYYYMMDD (길이로 먼저 걸러낸 뒤 정규식 확인)
+    cand = s[n == 8]
+    ymd8 = cand[cand.str.match(r"^\d{8}$")]
+    if len(ymd8):
+        out[ymd8.index] = ymd8.str[:4] + "-" + ymd8.str[4:6] + "-" + ymd8.str[6:8]
+
+    # YY.MM.DD
+    cand = s[(n >= 6) & (n <= 8) & s.str.contains(".", regex=False)]
+    parts = cand.str.extract(r"^(\d{2})\.(\d{1,2})\.(\d{1,2})$").dropna()
+    if len(parts):
+        yy = parts[0]
+        century = pd.Series("19", index=yy.index).where(yy.astype(int) >= 50, "20")
+        out[parts.index] = (
+            century + yy + "-" + parts[1].str.zfill(2) + "-" + parts[2].str.zfill(2)
+        )
+
+    return out
+
+
+def parse_date_series(series: pd.Series) -> pd.Series:
+    """parse_date 벡터화 버전"""
+    na = series.isna()
+
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return _format_timestamps(series).where(~na, "")
+
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+        return _format_serial_dates(series).where(~na, "")
+
+    # object/문자열 컬럼: 값 종류(문자열 / 날짜 / 숫자 / 기타)별로 나눠 처리
+    kinds = series.map(type)
+    is_text = (kinds == str) & ~na
+    is_stamp = kinds.isin(_DATE_TYPES) & ~na
+    other = ~na & ~is_text & ~is_stamp
+    number = pd.to_numeric(series.where(other), errors="coerce")
+    is_number = number.notna()
+    as_text = is_text | (other & ~is_number)
+
+    out = pd.Series("", index=series.index, dtype=object)
+    if is_number.any():
+        out[is_number] = _format_serial_dates(number[is_number])
+    if is_stamp.any():
+        stamp = pd.to_datetime(series[is_stamp].astype(object), errors="coerce")
+        out[is_stamp] = _format_timestamps(stamp)
+    if as_text.any():
+        out[as_text] = _format_date_text(series[as_text].astype(str).str.strip())
+    return out
@@ -0,0 +1,165 @@
+"""
+다중 시트 워크북 리더
+한 워크북에 월별 시트를 두는 사업장용 - sheetKeywords에 맞는 시트를 모두 읽어
+시트별 표준 DataFrame으로 반환 (시트마다 별도 프로세스에서 병렬 파싱)
+
+- 시트 목록은 workbook.xml만 읽어서 구함 (시트 본문은 워커에서 파싱)
+- 워커는 자기 시트 XML만 파싱 (openpyxl read_only는 열 때 모든 시트를 훑어서
+  워커마다 워크북 전체 비용이 드므로 사용하지 않음)
+- 시트별 결과는 load_standard_ledger와 같은 규칙 (자동 감지 / 파싱 캐시 포함)
+- 연결 결과에는 시트 이름에서 추출한 year_month(YYYY-MM) 컬럼 추가
+- 키워드가 맞아도 월을 알 수 없는 시트(예: "임금대장(파트)")는 제외하고 경고 로그
+"""
+from __future__ import annotations
+
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from ..config.schema import BusinessPayrollConfig
+from .cache import load_standard_ledger
+from .detector import _XlsxHead
+from .reader import _select_sheet
+
+
+logger = logging.getLogger(__name__)
+
+# 시트 이름 → 연/월
+_YEAR_MONTH_RE = re.compile(r"(?<!\d)((?:19|20)\d{2})\s*(?:년|[.\-/_])?\s*(0?[1-9]|1[0-2])(?!\d)")
+_SHORT_YEAR_MONTH_RE = re.compile(r"(?<!\d)(\d{2})\s*(?:년|[.\-/_])\s*(0?[1-9]|1[0-2])\s*월")
+_MONTH_RE = re.compile(r"(?<!\d)(0?[1-9]|1[0-2])\s*월")
+_YEAR_RE = re.compile(r"(?<!\d)((?:19|20)\d{2})(?!\d)")
+
+
+def select_sheets(sheet_names: list[str], config: BusinessPayrollConfig) -> list[str]:
+    """
+    sheetKeywords 중 하나라도 포함하고 시트 이름에서 월을 알 수 있는 시트 전부 (워크북 순서).
+
+    키워드만 맞고 월을 알 수 없는 시트("임금대장(파트)" 등)는 제외하고 경고 로그를 남김.
+    월을 알 수 있는 시트가 하나도 없으면 단월 워크북으로 보고 첫 번째 일치 시트 1개.
+    일치하는 시트가 없으면 _select_sheet로 고른 시트 1개.
+    """
+    keywords = config.excel.sheetKeywords or []
+    matched = [name for name in sheet_names if any(kw in name for kw in keywords)]
+    if not matched:
+        return [_select_sheet(sheet_names, config)]
+
+    monthly = [name for name in matched if _has_month(name)]
+    selected = monthly or matched[:1]
+    skipped = [name for name in matched if name not in selected]
+    if skipped:
+        logger.warning("월을 알 수 없는 시트 제외: %s", ", ".join(skipped))
+    return selected
+
+
+def sheet_year_month(sheet_name: str, year: int | None = None) -> str:
+    """
+    시트 이름에서 대상 월 추출 → YYYY-MM (알 수 없으면 빈 문자열).
+
+    "2025년 1월 임금대장", "2025-01", "202501", "25년 1월", "1월 급여대장" 등.
+    시트 이름에 연도가 없으면 year 사용.
+    """
+    m = _YEAR_MONTH_RE.search(sheet_name)
+    if m:
+        return f"{m.group(1)}-{int(m.group(2)):02d}"
+    m = _SHORT_YEAR_MONTH_RE.search(sheet_name)
+    if m:
+        return f"20{m.group(1)}-{int(m.group(2)):02d}"
+
+    m = _MONTH_RE.search(sheet_name)
+    y = _YEAR_RE.search(sheet_name)
+    if m and (y or year):
+        return f"{int(y.group(1)) if y else year}-{int(m.group(1)):02d}"
+    return ""
+
+
+def _has_month(sheet_name: str) -> bool:
+    """시트 이름에 월이 있는지 (연도는 없어도 됨)"""
+    return bool(sheet_year_month(sheet_name) or _MONTH_RE.search(sheet_name))
+
+
+def _load_sheet(
+    filepath: str,
+    config: BusinessPayrollConfig,
+    sheet_name: str,
+    use_cache: bool,
+) -> pd.DataFrame:
+    """워커 프로세스: 시트 1개 읽기 + 매핑 (대상 시트 XML만 파싱)"""
+    return load_standard_ledger(
+        filepath, config, use_cache=use_cache, sheet_name=sheet_name, engine="xml",
+    )
+
+
+def load_sheet_ledgers(
+    filepath: str | Path,
+    config: BusinessPayrollConfig,
+    sheet_names: list[str] | None = None,
+    max_workers: int | None = None,
+    use_cache: bool = True,
+) -> dict[str, pd.DataFrame]:
+    """
+    워크북의 대상 시트를 모두 읽어 시트별 표준 DataFrame 반환.
+
+    Parameters
+    ----------
+    filepath : 엑셀 파일 경로
+    config : 사업장 config (sheetKeywords로 대상 시트 선택, columns가 비어 있으면 시트별 자동 감지)
+    sheet_names : 읽을 시트 (없으면 select_sheets)
+    max_workers : 프로세스 수 (기본: CPU 수). 1이면 현재 프로세스에서 순차 실행
+    use_cache : 파싱 캐시 사용 여부 (시트별 캐시)
+
+    Returns
+    -------
+    {시트 이름: 표준 DataFrame} (워크북 순서)
+    """
+    filepath = str(filepath)
+    if sheet_names is None:
+        with _XlsxHead(filepath) as book:
+            sheet_names = select_sheets(book.sheetnames, config)
+    if not sheet_names:
+        return {}
+
+    workers = min(max_workers or os.cpu_count() or 1, len(sheet_names))
+    if workers <= 1:
+        frames = [_load_sheet(filepath, config, name, use_cache) for name in sheet_names]
+    else:
+        n = len(sheet_names)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            frames = list(pool.map(
+                _load_sheet, [filepath] * n, [config] * n, sheet_names, [use_cache] * n,
+            ))
+    return dict(zip(sheet_names, frames))
+
+
+def load_monthly_ledger(
+    filepath: str | Path,
+    config: BusinessPayrollConfig,
+    year: int | None = None,
+    max_workers: int | None = None,
+    use_cache: bool = True,
+) -> pd.DataFrame:
+    """
+    월별 시트 워크북 → 하나의 표준 DataFrame (year_month, sheet 컬럼 추가).
+
+    year_month는 시트 이름에서 추출 (sheet_year_month).
+    시트 이름에 연도가 없으면 year → 파일명의 연도 순으로 사용.
+    시트 이름에 월이 없으면 파일명의 연월 (예: 매장_202601.xlsx), 그것도 없으면 빈 문자열.
+    """
+    stem = Path(filepath).stem
+    file_month = sheet_year_month(stem)
+    if year is None:
+        m = _YEAR_RE.search(stem)
+        year = int(file_month[:4]) if file_month else int(m.group(1)) if m else None
+
+    ledgers = load_sheet_ledgers(filepath, config, max_workers=max_workers, use_cache=use_cache)
+    frames = [
+        df.assign(year_month=sheet_year_month(name, year) or file_month, sheet=name)
+        for name, df in ledgers.items()
+    ]
+    if not frames:
+        return pd.DataFrame(columns=["year_month", "sheet"])
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,219 @@
+"""
+전월 대비 증분 임포트
+이번 달 매핑 결과를 저장된 전월 스냅샷과 주민번호 기준으로 비교하여
+변동이 없고 입사일/퇴사일도 대상 월이 아닌 근로자는 취득/상실신고 판정에서 제외
+
+- 스냅샷: Arrow IPC (feather) - pyarrow 필요
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (feather 읽기/쓰기용)
+    _HAS_ARROW = True
+except ImportError:
+    _HAS_ARROW = False
+
+from .config.loader import get_data_dir
+from .config.schema import BusinessPayrollConfig
+from .excel.cache import ensure_private_dir, write_private_file
+from .reports.acquisition import AcquisitionReport, generate_acquisition_report
+from .reports.loss import LossReport, generate_loss_report
+from .registry import WorkerRegistry
+
+
+KEY_FIELD = "residentNo"
+
+
+def previous_month(year_month: str) -> str:
+    """YYYY-MM → 전월 YYYY-MM"""
+    year, month = map(int, year_month.split("-"))
+    if month == 1:
+        return f"{year - 1}-12"
+    return f"{year}-{month - 1:02d}"
+
+
+# ──────────────────────────────────────────
+# 월별 스냅샷 저장소
+# ──────────────────────────────────────────
+
+class SnapshotStore:
+    """
+    사업장/월별 매핑 결과 스냅샷.
+    {data_dir}/snapshots/{business_id}/{YYYY-MM}.arrow
+    """
+
+    def __init__(self, directory: str | Path | None = None):
+        self.directory = Path(directory) if directory else get_data_dir() / "snapshots"
+
+    @property
+    def available(self) -> bool:
+        """pyarrow가 있어야 스냅샷 사용 가능"""
+        return _HAS_ARROW
+
+    def _require_arrow(self) -> None:
+        if not self.available:
+            raise RuntimeError(
+                "증분 임포트 스냅샷에는 pyarrow가 필요합니다 (pip install 'payroll-automation[cache]')"
+            )
+
+    def _path(self, business_id: str, year_month: str) -> Path:
+        return self.directory / business_id / f"{year_month}.arrow"
+
+    def load(self, business_id: str, year_month: str) -> pd.DataFrame | None:
+        """스냅샷 로드 (없으면 None)"""
+        self._require_arrow()
+        path = self._path(business_id, year_month)
+        if not path.exists():
+            return None
+        return pd.read_feather(path)
+
+    def save(self, business_id: str, year_month: str, df: pd.DataFrame) -> Path:
+        """
+        스냅샷 저장 (임시 파일에 쓴 뒤 원자적으로 교체).
+        원장 전체(주민번호 포함)이므로 디렉토리 0700 / 파일 0600 (write_private_file)
+        """
+        self._require_arrow()
+        path = self._path(business_id, year_month)
+        ensure_private_dir(self.directory)
+        write_private_file(path, df.reset_index(drop=True).to_feather)
+        return path
+
+
+# ──────────────────────────────────────────
+# 원장 비교
+# ──────────────────────────────────────────
+
+@dataclass
+class LedgerDiff:
+    """전월 대비 변동 근로자"""
+    added: pd.DataFrame         # 이번 달에 새로 나타난 근로자 (이번 달 행)
+    removed: pd.DataFrame       # 이번 달에 사라진 근로자 (전월 행)
+    changed: pd.DataFrame       # 값이 바뀐 근로자 (이번 달 행)
+    unchanged_count: int = 0
+
+    @property
+    def changes(self) -> pd.DataFrame:
+        """추가 + 변경된 행 (이번 달 기준)"""
+        return pd.concat([self.added, self.changed], ignore_index=True)
+
+    def affected(self, current: pd.DataFrame) -> pd.Series:
+        """이번 달 원장에서 추가/변경된 근로자 행 마스크 (주민번호 없는 행 포함)"""
+        key = _key_series(current)
+        changed_keys = _key_series(self.changes)
+        return (key == "") | key.isin(changed_keys[changed_keys != ""])
+
+
+def _key_series(df: pd.DataFrame) -> pd.Series:
+    """정규화된 주민번호 (컬럼이 없으면 빈 문자열)"""
+    if KEY_FIELD not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[KEY_FIELD].fillna("").astype(str).str.strip()
+
+
+def _in_month(df: pd.DataFrame, year_month: str) -> pd.Series:
+    """입사일 또는 퇴사일이 대상 월인 행 마스크"""
+    mask = pd.Series(False, index=df.index)
+    for col in ("joinDate", "leaveDate"):
+        if col in df.columns:
+            mask |= df[col].fillna("").astype(str).str.strip().str.startswith(year_month)
+    return mask
+
+
+def _keyed(df: pd.DataFrame, key: pd.Series) -> pd.DataFrame:
+    """주민번호가 있는 행만, 주민번호 인덱스로 (중복 시 마지막 행)"""
+    has_key = key != ""
+    keyed = df[has_key].copy()
+    keyed.index = pd.Index(key[has_key], name=KEY_FIELD)
+    return keyed[~keyed.index.duplicated(keep="last")]
+
+
+def diff_ledgers(previous: pd.DataFrame, current: pd.DataFrame) -> LedgerDiff:
+    """
+    두 매핑 결과를 주민번호 기준으로 비교.
+
+    공통 컬럼 값을 문자열로 비교하여 하나라도 다르면 변경으로 판단.
+    주민번호가 없는 행은 비교할 수 없으므로 추가로 간주.
+    """
+    prev = _keyed(previous, _key_series(previous))
+    curr_key = _key_series(current)
+    curr = _keyed(current, curr_key)
+    no_key = current[curr_key == ""]
+
+    is_new = ~curr.index.isin(prev.index)
+    is_gone = ~prev.index.isin(curr.index)
+
+    both = curr[~is_new]
+    before = prev.reindex(both.index)
+    common = [c for c in both.columns if c in before.columns]
+    differs = pd.Series(False, index=both.index)
+    for col in common:
+        differs |= both[col].astype(str) != before[col].astype(str)
+
+    return LedgerDiff(
+        added=pd.concat([curr[is_new], no_key], ignore_index=True),
+        removed=prev[is_gone].reset_index(drop=True),
+        changed=both[differs].reset_index(drop=True),
+        unchanged_count=int((~differs).sum()),
+    )
+
+
+# ──────────────────────────────────────────
+# 증분 임포트
+# ──────────────────────────────────────────
+
+@dataclass
+class IncrementalImportResult:
+    """증분 임포트 결과"""
+    acquisition: AcquisitionReport
+    loss: LossReport
+    diff: LedgerDiff | None     # 전월 스냅샷이 없으면 None (전체 처리)
+    base_month: str             # 비교 기준 월 (YYYY-MM)
+
+
+def run_incremental_import(
+    mapped_df: pd.DataFrame,
+    config: BusinessPayrollConfig,
+    year_month: str,
+    store: SnapshotStore | None = None,
+    existing_resident_nos: set[str] | None = None,
+    save_snapshot: bool = True,
+    registry: WorkerRegistry | None = None,
+) -> IncrementalImportResult:
+    """
+    전월 스냅샷과 비교하여 취득/상실신고 대상 판정 범위를 줄임.
+
+    신고 대상은 이번 달 전체 원장에서 판정하되, 전월과 같고 입사일/퇴사일도
+    대상 월이 아닌 근로자만 건너뜀. 전월에 이미 입력된 퇴사일이 대상 월이면
+    변동이 없어도 상실신고 대상에 포함.
+    전월 스냅샷이 없으면 전체 원장으로 판정.
+    처리 후 이번 달 매핑 결과를 스냅샷으로 저장 (다음 달 비교 기준).
+    """
+    store = store or SnapshotStore()
+    base_month = previous_month(year_month)
+    previous = store.load(config.businessId, base_month)
+
+    if previous is None:
+        diff = None
+        targets = mapped_df
+    else:
+        diff = diff_ledgers(previous, mapped_df)
+        targets = mapped_df[diff.affected(mapped_df) | _in_month(mapped_df, year_month)]
+
+    result = IncrementalImportResult(
+        acquisition=generate_acquisition_report(
+            targets, config, year_month,
+            existing_resident_nos=existing_resident_nos, registry=registry,
+        ),
+        loss=generate_loss_report(targets, config, year_month, registry=registry),
+        diff=diff,
+        base_month=base_month,
+    )
+
+    if save_snapshot:
+        store.save(config.businessId, year_month, mapped_df)
+    return result
@@ -0,0 +1,179 @@
+"""
+사업장 단위 임포트 파이프라인
+읽기 → 매핑 → 검증 → 취득/상실신고 생성을 사업장별로 실행 (다중 사업장 병렬 처리)
+"""
+from __future__ import annotations
+
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .config.loader import load_config
+from .config.schema import BusinessPayrollConfig
+from .excel.cache import load_standard_ledger
+from .reports.acquisition import AcquisitionRecord, generate_acquisition_report
+from .reports.loss import LossRecord, generate_loss_report
+from .validators.wage_validator import validate_wage_data
+
+
+logger = logging.getLogger(__name__)
+
+# 파일명의 월 표기 (YYYYMM / YYYY-MM)
+_MONTH_TOKEN_RE = re.compile(r"(?<!\d)(?:19|20)\d{2}-?(?:0[1-9]|1[0-2])(?!\d)")
+
+
+@dataclass
+class ImportJob:
+    """사업장 1곳의 임포트 작업"""
+    business_id: str
+    filepath: str
+    year_month: str             # 대상 월 (YYYY-MM)
+    use_cache: bool = True      # 파싱 캐시 사용 여부
+
+
+@dataclass
+class ImportSummary:
+    """사업장 1곳의 임포트 결과"""
+    business_id: str
+    business_name: str
+    filepath: str
+    year_month: str
+    rows: int = 0
+    error_count: int = 0
+    warning_count: int = 0
+    acquisitions: list[AcquisitionRecord] = field(default_factory=list)
+    losses: list[LossRecord] = field(default_factory=list)
+    elapsed: float = 0.0        # 초
+    failure: str | None = None  # 처리 실패 사유 (성공 시 None)
+
+    @property
+    def ok(self) -> bool:
+        return self.failure is None
+
+
+# ──────────────────────────────────────────
+# 파일 탐색
+# ──────────────────────────────────────────
+
+def find_business_files(
+    config: BusinessPayrollConfig,
+    directory: str | Path,
+    year_month: str,
+) -> list[Path]:
+    """
+    config.excel.filePattern으로 대상 월의 급여대장 파일 탐색 (사업장+월당 최대 1개).
+
+    - 파일명에 대상 월(YYYYMM / YYYY-MM)이 들어간 파일 우선
+    - 대상 월 파일이 없으면, 패턴에 맞는 파일이 1개뿐이고 파일명에 월 표기가 없을 때만 그 파일 사용
+      (다른 월 파일을 대상 월로 잘못 임포트하지 않도록)
+    - 대상 월 파일이 여러 개면 (수정본 등) 가장 최근에 수정된 파일만 사용하고 나머지는 경고 로그
+    """
+    pattern = config.excel.filePattern
+    if not pattern:
+        return []
+
+    matches = sorted(p for p in Path(directory).glob(pattern) if p.is_file())
+    tokens = (year_month.replace("-", ""), year_month)
+    for_month = [p for p in matches if any(t in p.name for t in tokens)]
+    if for_month:
+        newest = max(for_month, key=lambda p: (p.stat().st_mtime, p.name))
+        ignored = [p.name for p in for_month if p != newest]
+        if ignored:
+            logger.warning(
+                "%s %s 파일 %d개 중 최신 파일만 사용: %s (제외: %s)",
+                config.businessId, year_month, len(for_month), newest.name, ", ".join(ignored),
+            )
+        return [newest]
+    if len(matches) == 1 and not _MONTH_TOKEN_RE.search(matches[0].name):
+        return matches
+    return []
+
+
+def discover_jobs(
+    configs: list[BusinessPayrollConfig],
+    directory: str | Path,
+    year_month: str,
+    use_cache: bool = True,
+) -> tuple[list[ImportJob], list[ImportSummary]]:
+    """
+    사업장 config 목록 → 임포트 작업 목록.
+    Returns (jobs, skipped) - 대상 파일이 없는 사업장은 실패 요약으로 반환
+    """
+    jobs: list[ImportJob] = []
+    skipped: list[ImportSummary] = []
+
+    for cfg in configs:
+        files = find_business_files(cfg, directory, year_month)
+        if not files:
+            reason = "filePattern 미설정" if not cfg.excel.filePattern else "대상 파일 없음"
+            skipped.append(ImportSummary(
+                business_id=cfg.businessId,
+                business_name=cfg.businessName,
+                filepath="",
+                year_month=year_month,
+                failure=reason,
+            ))
+            continue
+        jobs.extend(ImportJob(cfg.businessId, str(f), year_month, use_cache) for f in files)
+
+    return jobs, skipped
+
+
+# ──────────────────────────────────────────
+# 실행
+# ──────────────────────────────────────────
+
+def run_import_job(job: ImportJob) -> ImportSummary:
+    """
+    사업장 1곳 처리: 읽기 → 매핑 → 검증 → 취득/상실신고.
+    예외는 요약의 failure로 담아 반환 (다른 사업장 처리에 영향 없음).
+    """
+    started = time.perf_counter()
+    summary = ImportSummary(
+        business_id=job.business_id,
+        business_name="",
+        filepath=job.filepath,
+        year_month=job.year_month,
+    )
+
+    try:
+        cfg = load_config(job.business_id)
+        summary.business_name = cfg.businessName
+
+        mapped_df = load_standard_ledger(job.filepath, cfg, use_cache=job.use_cache)
+        summary.rows = len(mapped_df)
+
+        validation = validate_wage_data(mapped_df, cfg, job.year_month)
+        summary.error_count = validation.error_count
+        summary.warning_count = validation.warning_count
+
+        summary.acquisitions = generate_acquisition_report(mapped_df, cfg, job.year_month).records
+        summary.losses = generate_loss_report(mapped_df, cfg, job.year_month).records
+    except Exception as e:
+        summary.failure = f"{type(e).__name__}: {e}"
+
+    summary.elapsed = time.perf_counter() - started
+    return summary
+
+
+def run_import_jobs(
+    jobs: list[ImportJob],
+    max_workers: int | None = None,
+) -> list[ImportSummary]:
+    """
+    여러 사업장 임포트를 프로세스 풀에서 병렬 실행.
+    결과는 jobs 순서대로 반환. max_workers=1이면 현재 프로세스에서 순차 실행.
+    """
+    if not jobs:
+        return []
+
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [run_import_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_import_job, jobs))
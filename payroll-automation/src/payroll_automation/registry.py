@@ -0,0 +1,258 @@
+"""
+근로자 레지스트리 (컬럼형)
+사업장별 근로자(주민번호, 입사/퇴사일, 최근 급여)를 NumPy 배열로 보관하고
+(사업장, 주민번호) 정렬 키 인덱스로 조회. 디스크의 .npy 파일을 mmap으로 로드.
+
+디렉토리 구조 ({data_dir}/registry):
+    meta.json           사업장 ID 목록, 행 수, 포맷 버전
+    key.npy             int64  사업장코드 * 10^13 + 주민번호 (정렬됨 = 인덱스)
+    join_date.npy       datetime64[D]  (없으면 NaT)
+    leave_date.npy      datetime64[D]  (없으면 NaT)
+    last_wage.npy       int64
+    last_month.npy      datetime64[M]  최근 급여 월
+    first_month.npy     datetime64[M]  최초 등록 월 (같은 월 재임포트 시 취득 대상 유지용)
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config.loader import get_data_dir
+from .excel.cache import write_private_file
+
+
+REGISTRY_FORMAT_VERSION = 2
+
+# 주민번호(13자리 이하 숫자) → int64, 사업장 코드는 그 위 자릿수에 배치
+_RESIDENT_SPAN = 10 ** 13
+
+_COLUMNS = {
+    "key": np.int64,
+    "join_date": "datetime64[D]",
+    "leave_date": "datetime64[D]",
+    "last_wage": np.int64,
+    "last_month": "datetime64[M]",
+    "first_month": "datetime64[M]",
+}
+
+
+def _resident_keys(resident_nos: pd.Series) -> np.ndarray:
+    """주민번호 문자열 → int64 (숫자 13자리 이하가 아니면 -1)"""
+    s = pd.Series(resident_nos, dtype=object).fillna("").astype(str).str.strip()
+    valid = s.str.fullmatch(r"\d{1,13}").fillna(False).astype(bool)
+    keys = np.full(len(s), -1, dtype=np.int64)
+    if valid.any():
+        keys[valid.to_numpy()] = s[valid].astype(np.int64).to_numpy()
+    return keys
+
+
+def _to_days(dates: pd.Series) -> np.ndarray:
+    """YYYY-MM-DD 문자열 → datetime64[D] (빈값/형식 오류 → NaT)"""
+    parsed = pd.to_datetime(pd.Series(dates, dtype=object), format="%Y-%m-%d", errors="coerce")
+    return parsed.to_numpy(dtype="datetime64[D]")
+
+
+def _format_days(days: np.ndarray) -> np.ndarray:
+    """datetime64[D] → YYYY-MM-DD 문자열 (NaT → 빈 문자열)"""
+    out = np.datetime_as_string(days, unit="D").astype(object)
+    out[np.isnat(days)] = ""
+    return out
+
+
+class WorkerRegistry:
+    """
+    컬럼형 근로자 레지스트리.
+
+    - 조회: contains / lookup_join_dates (정렬 키 + searchsorted, 전부 배열 연산)
+    - 갱신: update (매핑된 월 원장 반영) → save
+    """
+
+    def __init__(self, directory: str | Path | None = None):
+        self.directory = Path(directory) if directory else get_data_dir() / "registry"
+        self.businesses: list[str] = []
+        self._codes: dict[str, int] = {}
+        self._cols: dict[str, np.ndarray] = {
+            name: np.empty(0, dtype=dtype) for name, dtype in _COLUMNS.items()
+        }
+
+    # ── 로드/저장 ──
+
+    @classmethod
+    def open(cls, directory: str | Path | None = None, mmap: bool = True) -> "WorkerRegistry":
+        """디스크에서 로드 (없으면 빈 레지스트리). mmap=True면 읽기 전용 메모리 매핑"""
+        reg = cls(directory)
+        meta_path = reg.directory / "meta.json"
+        if not meta_path.exists():
+            return reg
+
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != REGISTRY_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 레지스트리 버전: {meta.get('version')}")
+
+        reg.businesses = list(meta["businesses"])
+        reg._codes = {b: i for i, b in enumerate(reg.businesses)}
+        mode = "r" if mmap else None
+        reg._cols = {
+            name: np.load(reg.directory / f"{name}.npy", mmap_mode=mode)
+            for name in _COLUMNS
+        }
+        return reg
+
+    def save(self) -> None:
+        """
+        디스크에 저장 (컬럼별 .npy + meta.json, 임시 파일 후 교체).
+        주민번호가 들어 있으므로 디렉토리 0700 / 파일 0600 (write_private_file)
+        """
+        for name, arr in self._cols.items():
+            write_private_file(
+                self.directory / f"{name}.npy", lambda f, arr=arr: np.save(f, np.asarray(arr)),
+            )
+
+        meta = {
+            "version": REGISTRY_FORMAT_VERSION,
+            "businesses": self.businesses,
+            "count": len(self),
+        }
+        write_private_file(
+            self.directory / "meta.json",
+            lambda f: json.dump(meta, f, ensure_ascii=False, indent=2),
+            mode="w",
+        )
+
+    def __len__(self) -> int:
+        return len(self._cols["key"])
+
+    # ── 조회 ──
+
+    def _keys_for(self, business_id: str, resident_nos: pd.Series) -> np.ndarray:
+        """(사업장, 주민번호) → 정렬 키 (사업장 미등록/주민번호 형식 오류 → -1)"""
+        resident = _resident_keys(resident_nos)
+        code = self._codes.get(business_id)
+        if code is None:
+            return np.full(len(resident), -1, dtype=np.int64)
+        return np.where(resident >= 0, code * _RESIDENT_SPAN + resident, -1)
+
+    def _positions(self, keys: np.ndarray) -> np.ndarray:
+        """정렬 키 → 행 위치 (없으면 -1)"""
+        index = self._cols["key"]
+        if len(index) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+        at = np.minimum(np.searchsorted(index, keys), len(index) - 1)
+        found = (keys >= 0) & (index[at] == keys)
+        return np.where(found, at, -1)
+
+    def contains(
+        self,
+        business_id: str,
+        resident_nos: pd.Series,
+        before: str | None = None,
+    ) -> np.ndarray:
+        """
+        사업장에 이미 등록된 근로자인지 (bool 배열).
+
+        before(YYYY-MM)를 주면 그 월보다 먼저 등록된 근로자만 True.
+        같은 월을 다시 임포트해도 그 월에 처음 등록된 근로자는 취득 대상으로 남음.
+        """
+        pos = self._positions(self._keys_for(business_id, resident_nos))
+        found = pos >= 0
+        if before is None:
+            return found
+        first = np.full(len(pos), np.datetime64("NaT"), dtype="datetime64[M]")
+        first[found] = self._cols["first_month"][pos[found]]
+        return found & (first < np.datetime64(before, "M"))
+
+    def lookup_join_dates(self, business_id: str, resident_nos: pd.Series) -> np.ndarray:
+        """등록된 입사일 (YYYY-MM-DD, 미등록/입사일 없음 → 빈 문자열)"""
+        pos = self._positions(self._keys_for(business_id, resident_nos))
+        days = np.full(len(pos), np.datetime64("NaT"), dtype="datetime64[D]")
+        found = pos >= 0
+        days[found] = self._cols["join_date"][pos[found]]
+        return _format_days(days)
+
+    def to_frame(self, business_id: str | None = None) -> pd.DataFrame:
+        """레지스트리 내용 (사업장 지정 시 해당 사업장만)"""
+        keys = np.asarray(self._cols["key"])
+        codes = keys // _RESIDENT_SPAN
+        sel = np.ones(len(keys), dtype=bool)
+        if business_id is not None:
+            sel = codes == self._codes.get(business_id, -1)
+        return pd.DataFrame({
+            "businessId": np.array(self.businesses, dtype=object)[codes[sel]]
+            if self.businesses else np.empty(0, dtype=object),
+            "residentNo": pd.Series(keys[sel] % _RESIDENT_SPAN).astype(str).str.zfill(13).to_numpy(),
+            "joinDate": _format_days(np.asarray(self._cols["join_date"])[sel]),
+            "leaveDate": _format_days(np.asarray(self._cols["leave_date"])[sel]),
+            "lastWage": np.asarray(self._cols["last_wage"])[sel],
+            "lastMonth": np.datetime_as_string(np.asarray(self._cols["last_month"])[sel], unit="M"),
+            "firstMonth": np.datetime_as_string(np.asarray(self._cols["first_month"])[sel], unit="M"),
+        })
+
+    # ── 갱신 ──
+
+    def update(self, business_id: str, mapped_df: pd.DataFrame, year_month: str) -> int:
+        """
+        매핑된 월 원장을 반영 (신규 근로자 추가, 기존 근로자 날짜/급여 갱신).
+        원장에 값이 있는 필드만 덮어씀. 같은 월을 여러 번 반영해도 결과는 같음.
+        Returns 신규 추가 수
+        """
+        if business_id not in self._codes:
+            self._codes[business_id] = len(self.businesses)
+            self.businesses.append(business_id)
+
+        if "residentNo" not in mapped_df.columns or len(mapped_df) == 0:
+            return 0
+
+        keys = self._keys_for(business_id, mapped_df["residentNo"])
+        ok = keys >= 0
+        # 같은 근로자가 원장에 여러 번 있으면 마지막 행 사용
+        rows = pd.DataFrame({"key": keys[ok]}, index=np.flatnonzero(ok))
+        rows = rows[~rows["key"].duplicated(keep="last")]
+        keys = rows["key"].to_numpy()
+        src = mapped_df.iloc[rows.index]
+
+        def column(field: str) -> pd.Series:
+            if field in src.columns:
+                return src[field]
+            return pd.Series("", index=src.index, dtype=object)
+
+        join = _to_days(column("joinDate"))
+        leave = _to_days(column("leaveDate"))
+        wage_raw = pd.to_numeric(column("wage"), errors="coerce")
+        has_wage = wage_raw.notna().to_numpy()
+        wage = wage_raw.fillna(0).to_numpy(dtype=np.int64)
+        month = np.datetime64(year_month, "M")
+
+        # 기존 배열을 쓰기 가능한 메모리 사본으로
+        cols = {name: np.array(arr) for name, arr in self._cols.items()}
+        self._cols = cols
+
+        pos = self._positions(keys)
+        hit = pos >= 0
+        p = pos[hit]
+        cols["join_date"][p] = np.where(np.isnat(join[hit]), cols["join_date"][p], join[hit])
+        cols["leave_date"][p] = np.where(np.isnat(leave[hit]), cols["leave_date"][p], leave[hit])
+        newer = (cols["last_month"][p] <= month) & has_wage[hit]
+        cols["last_wage"][p] = np.where(newer, wage[hit], cols["last_wage"][p])
+        cols["last_month"][p] = np.where(newer, month, cols["last_month"][p])
+        # 이전 월을 나중에 반영한 경우 최초 등록 월을 앞당김
+        cols["first_month"][p] = np.minimum(cols["first_month"][p], month)
+
+        new = ~hit
+        if new.any():
+            added = {
+                "key": keys[new],
+                "join_date": join[new],
+                "leave_date": leave[new],
+                "last_wage": wage[new],
+                "last_month": np.full(int(new.sum()), month),
+                "first_month": np.full(int(new.sum()), month),
+            }
+            merged = {name: np.concatenate([cols[name], added[name]]) for name in _COLUMNS}
+            order = np.argsort(merged["key"], kind="stable")
+            self._cols = {name: arr[order] for name, arr in merged.items()}
+
+        return int(new.sum())
@@ -0,0 +1,21 @@
+"""
+신고서 생성 공통 컬럼 헬퍼
+표준 DataFrame에서 필드를 정규화된 Series로 꺼냄 (필드가 없어도 같은 길이로 반환)
+"""
+from __future__ import annotations
+
+import pandas as pd
+
+
+def text_column(df: pd.DataFrame, field: str) -> pd.Series:
+    """문자열 컬럼 (없으면 빈 문자열, NaN → 빈 문자열, 앞뒤 공백 제거)"""
+    if field not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[field].fillna("").astype(str).str.strip()
+
+
+def wage_column(df: pd.DataFrame) -> pd.Series:
+    """월 보수액(wage) 컬럼 (없거나 비숫자 → 0)"""
+    if "wage" not in df.columns:
+        return pd.Series(0, index=df.index, dtype="int64")
+    return pd.to_numeric(df["wage"], errors="coerce").fillna(0).astype("int64")
@@ -6,10 +6,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
 from ..config.schema import BusinessPayrollConfig
+from ._columns import text_column, wage_column
+
+if TYPE_CHECKING:
+    from ..registry import WorkerRegistry
 
 
 @dataclass
@@ -44,50 +49,60 @@ def generate_acquisition_report(
     config: BusinessPayrollConfig,
     year_month: str,
     existing_resident_nos: set[str] | None = None,
+    registry: WorkerRegistry | None = None,
 ) -> AcquisitionReport:
     """
     표준화된 DataFrame에서 취득신고 대상을 추출.
 
+    대상 판정은 컬럼 단위 마스크로 계산하고,
+    최종 선택된 행만 AcquisitionRecord로 변환.
+
     Parameters
     ----------
     df : 표준 필드명 DataFrame (map_to_standard 출력)
     config : 사업장 config
     year_month : 대상 월 (YYYY-MM)
     existing_resident_nos : 이미 등록된 근로자 주민번호 Set (있으면 중복 제외)
+    registry : 근로자 레지스트리 (있으면 대상 월 이전부터 이 사업장에 등록된 근로자 제외)
     """
-    existing = existing_resident_nos or set()
     defaults = config.defaults
-    records: list[AcquisitionRecord] = []
 
-    for _, row in df.iterrows():
-        name = str(row.get("name", "")).strip()
-        resident_no = str(row.get("residentNo", "")).strip()
-        join_date = str(row.get("joinDate", "")).strip()
+    name = text_column(df, "name")
+    resident_no = text_column(df, "residentNo")
+    join_date = text_column(df, "joinDate")
 
-        # 필수 필드 누락 → skip
-        if not name or not resident_no:
-            continue
+    # 필수 필드 누락 → skip
+    mask = (name != "") & (resident_no != "")
 
-        # 이미 등록된 근로자 → skip
-        if resident_no in existing:
-            continue
+    # 이미 등록된 근로자 → skip
+    if existing_resident_nos:
+        mask &= ~resident_no.isin(existing_resident_nos)
+    if registry is not None:
+        mask &= ~registry.contains(config.businessId, resident_no, before=year_month)
 
-        # 입사일이 대상 월에 해당하는지 확인
-        if join_date and not join_date.startswith(year_month):
-            continue
+    # 입사일이 대상 월에 해당하는지 확인 (입사일 없으면 대상 월 1일로 간주)
+    mask &= (join_date == "") | join_date.str.startswith(year_month)
 
-        # 월 보수액
-        wage = int(row.get("wage", 0) or 0)
+    selected = mask.to_numpy()
+    join_date = join_date[selected].where(join_date[selected] != "", f"{year_month}-01")
 
-        records.append(AcquisitionRecord(
-            name=name,
-            resident_no=resident_no,
-            join_date=join_date or f"{year_month}-01",
-            wage=wage,
+    records = [
+        AcquisitionRecord(
+            name=n,
+            resident_no=r,
+            join_date=j,
+            wage=int(w),
             jikjong_code=defaults.jikjongCode,
             work_hours=defaults.workHours,
             nationality=defaults.nationality,
-        ))
+        )
+        for n, r, j, w in zip(
+            name[selected],
+            resident_no[selected],
+            join_date,
+            wage_column(df)[selected],
+        )
+    ]
 
     return AcquisitionReport(
         business_id=config.businessId,
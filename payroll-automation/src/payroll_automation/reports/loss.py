@@ -6,10 +6,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
 from ..config.schema import BusinessPayrollConfig
+from ._columns import text_column, wage_column
+
+if TYPE_CHECKING:
+    from ..registry import WorkerRegistry
 
 
 @dataclass
@@ -38,59 +43,67 @@ class LossReport:
             self.generated_at = datetime.now().isoformat()
 
 
-def _is_retirement_eligible(join_date: str, leave_date: str) -> bool:
-    """퇴직금 수급 자격 (1년 이상 근속)"""
-    if not join_date or not leave_date:
-        return False
-    try:
-        join = datetime.strptime(join_date, "%Y-%m-%d")
-        leave = datetime.strptime(leave_date, "%Y-%m-%d")
-        return (leave - join).days >= 365
-    except ValueError:
-        return False
+def _vec_retirement_eligible(join_date: pd.Series, leave_date: pd.Series) -> pd.Series:
+    """퇴직금 수급 자격 (1년 이상 근속). 날짜 누락/파싱 실패 → False"""
+    join = pd.to_datetime(join_date, format="%Y-%m-%d", errors="coerce")
+    leave = pd.to_datetime(leave_date, format="%Y-%m-%d", errors="coerce")
+    return ((leave - join).dt.days >= 365).fillna(False).astype(bool)
 
 
 def generate_loss_report(
     df: pd.DataFrame,
     config: BusinessPayrollConfig,
     year_month: str,
+    registry: WorkerRegistry | None = None,
 ) -> LossReport:
     """
     표준화된 DataFrame에서 상실신고 대상을 추출.
 
+    대상 판정과 퇴직금 자격은 컬럼 단위로 계산하고,
+    최종 선택된 행만 LossRecord로 변환.
+
     Parameters
     ----------
     df : 표준 필드명 DataFrame (map_to_standard 출력)
     config : 사업장 config
     year_month : 대상 월 (YYYY-MM)
+    registry : 근로자 레지스트리 (있으면 원장에 입사일이 없는 퇴사자는 등록된 입사일 사용)
     """
-    records: list[LossRecord] = []
-
-    for _, row in df.iterrows():
-        name = str(row.get("name", "")).strip()
-        resident_no = str(row.get("residentNo", "")).strip()
-        leave_date = str(row.get("leaveDate", "")).strip()
-        join_date = str(row.get("joinDate", "")).strip()
-
-        # 필수 필드 누락 → skip
-        if not name or not resident_no:
-            continue
-
-        # 퇴사일이 없거나 대상 월이 아니면 skip
-        if not leave_date or not leave_date.startswith(year_month):
-            continue
-
-        wage = int(row.get("wage", 0) or 0)
-        eligible = _is_retirement_eligible(join_date, leave_date)
-
-        records.append(LossRecord(
-            name=name,
-            resident_no=resident_no,
-            leave_date=leave_date,
+    name = text_column(df, "name")
+    resident_no = text_column(df, "residentNo")
+    leave_date = text_column(df, "leaveDate")
+
+    # 필수 필드 누락 → skip
+    mask = (name != "") & (resident_no != "")
+
+    # 퇴사일이 없거나 대상 월이 아니면 skip
+    mask &= (leave_date != "") & leave_date.str.startswith(year_month)
+
+    selected = mask.to_numpy()
+    join_date = text_column(df, "joinDate")[selected]
+    leave_date = leave_date[selected]
+    if registry is not None:
+        known = registry.lookup_join_dates(config.businessId, resident_no[selected])
+        join_date = join_date.where(join_date != "", known)
+    eligible = _vec_retirement_eligible(join_date, leave_date)
+
+    records = [
+        LossRecord(
+            name=n,
+            resident_no=r,
+            leave_date=ld,
             loss_type="1",
-            last_wage=wage,
-            retirement_eligible=eligible,
-        ))
+            last_wage=int(w),
+            retirement_eligible=bool(e),
+        )
+        for n, r, ld, w, e in zip(
+            name[selected],
+            resident_no[selected],
+            leave_date,
+            wage_column(df)[selected],
+            eligible,
+        )
+    ]
 
     return LossReport(
         business_id=config.businessId,
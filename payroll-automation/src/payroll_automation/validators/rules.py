@@ -0,0 +1,371 @@
+"""
+급여 데이터 검증 규칙 레지스트리
+규칙마다 필요한 컬럼과 선행 규칙을 선언하고, 컬럼 단위 마스크 + 메시지(템플릿)를 반환.
+정규화된 컬럼/날짜 검증 결과는 ValidationContext에 캐시되어 규칙 간 공유.
+
+기본 규칙은 항상 실행되고, 추가 규칙은 config.validationRules로 사업장별 활성화.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import pandas as pd
+
+from ..config.schema import BusinessPayrollConfig
+from ..constants import get_default_monthly_wage
+
+
+# ──────────────────────────────────────────
+# 벡터화된 검증 헬퍼
+# 입력은 _normalize()로 한 번만 정규화한 문자열 Series
+# ──────────────────────────────────────────
+
+def _normalize(series: pd.Series) -> pd.Series:
+    """NaN → 빈 문자열, 문자열 변환, 앞뒤 공백 제거"""
+    return series.fillna("").astype(str).str.strip()
+
+
+def _vec_validate_resident_no(s: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """
+    주민번호 벡터 검증 (정규화된 문자열 입력).
+    Returns (has_error, message) - message는 에러 행만 채워짐
+    """
+    empty = s == ""
+    digits = s.str.replace(r"[^0-9]", "", regex=True)
+    digit_len = digits.str.len()
+
+    wrong_len = ~empty & (digit_len != 13)
+
+    # 월/일 범위 (13자리인 것만 체크)
+    valid_len = ~empty & (digit_len == 13)
+    mm = pd.Series(0, index=s.index)
+    dd = pd.Series(0, index=s.index)
+    if valid_len.any():
+        mm[valid_len] = digits[valid_len].str[2:4].astype(int).to_numpy()
+        dd[valid_len] = digits[valid_len].str[4:6].astype(int).to_numpy()
+    bad_month = valid_len & ((mm < 1) | (mm > 12))
+    bad_day = valid_len & ((dd < 1) | (dd > 31))
+
+    has_error = empty | wrong_len | bad_month | bad_day
+
+    # 메시지 생성 (에러가 있는 행만, 뒤 조건이 우선)
+    msg = pd.Series("", index=s.index, dtype=object)
+    if has_error.any():
+        msg[empty] = "주민번호 누락"
+        msg[wrong_len] = "주민번호 자릿수 오류 (" + digit_len[wrong_len].astype(str) + "자리)"
+        msg[bad_month] = "주민번호 월 범위 오류 (" + mm[bad_month].astype(str) + "월)"
+        msg[bad_day] = "주민번호 일 범위 오류 (" + dd[bad_day].astype(str) + "일)"
+
+    return has_error, msg
+
+
+@dataclass
+class _DateCheck:
+    """날짜 컬럼 검증 결과 (규칙 간 공유)"""
+    is_empty: pd.Series
+    has_error: pd.Series
+    message: pd.Series
+
+
+def _vec_validate_date(s: pd.Series, field_name: str) -> _DateCheck:
+    """날짜 벡터 검증 (정규화된 문자열 입력). 형식 검사와 연/월/일 추출은 후보 행에만 수행"""
+    is_empty = s == ""
+    # 길이 10이 아니면 정규식 없이 형식 오류
+    candidate = s.str.len() == 10
+    matches_fmt = pd.Series(False, index=s.index)
+    if candidate.any():
+        matches_fmt[candidate] = s[candidate].str.match(r"^\d{4}-\d{2}-\d{2}$").astype(bool).to_numpy()
+
+    # 형식 불일치 (비어있지 않은데 형식이 틀린 경우)
+    bad_fmt = ~is_empty & ~matches_fmt
+
+    # 범위 체크 (형식 맞는 것만)
+    valid_fmt = matches_fmt
+    year = pd.Series(0, index=s.index)
+    month = pd.Series(0, index=s.index)
+    day = pd.Series(0, index=s.index)
+    if valid_fmt.any():
+        sub = s[valid_fmt]
+        year[valid_fmt] = pd.to_numeric(sub.str[:4], errors="coerce").fillna(0).astype(int).to_numpy()
+        month[valid_fmt] = pd.to_numeric(sub.str[5:7], errors="coerce").fillna(0).astype(int).to_numpy()
+        day[valid_fmt] = pd.to_numeric(sub.str[8:10], errors="coerce").fillna(0).astype(int).to_numpy()
+
+    bad_year = valid_fmt & ((year < 1950) | (year > 2100))
+    bad_month = valid_fmt & ((month < 1) | (month > 12))
+    bad_day = valid_fmt & ((day < 1) | (day > 31))
+
+    has_error = bad_fmt | bad_year | bad_month | bad_day
+
+    msg = pd.Series("", index=s.index, dtype=object)
+    if has_error.any():
+        msg[bad_fmt] = field_name + " 형식 오류 (" + s[bad_fmt] + ")"
+        msg[bad_year] = field_name + " 연도 범위 오류 (" + year[bad_year].astype(str) + ")"
+        msg[bad_month] = field_name + " 월 범위 오류 (" + month[bad_month].astype(str) + ")"
+        msg[bad_day] = field_name + " 일 범위 오류 (" + day[bad_day].astype(str) + ")"
+
+    return _DateCheck(is_empty=is_empty, has_error=has_error, message=msg)
+
+
+_DATE_LABELS = {"joinDate": "입사일", "leaveDate": "퇴사일"}
+
+
+# ──────────────────────────────────────────
+# 규칙 정의
+# ──────────────────────────────────────────
+
+class ValidationContext:
+    """
+    규칙 실행 컨텍스트.
+    정규화된 문자열/숫자 컬럼과 날짜 검증 결과를 처음 요청될 때 한 번만 계산해 공유.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        config: BusinessPayrollConfig | None = None,
+        year_month: str | None = None,
+    ):
+        self.df = df
+        self.config = config
+        self.year_month = year_month
+        self._text: dict[str, pd.Series] = {}
+        self._number: dict[str, pd.Series] = {}
+        self._dates: dict[str, _DateCheck] = {}
+
+    def has(self, *fields: str) -> bool:
+        return all(f in self.df.columns for f in fields)
+
+    def text(self, field: str) -> pd.Series:
+        """정규화된 문자열 컬럼"""
+        if field not in self._text:
+            self._text[field] = _normalize(self.df[field])
+        return self._text[field]
+
+    def number(self, field: str) -> pd.Series:
+        """숫자 컬럼 (비숫자 → NaN)"""
+        if field not in self._number:
+            self._number[field] = pd.to_numeric(self.df[field], errors="coerce")
+        return self._number[field]
+
+    def date_check(self, field: str) -> _DateCheck:
+        """날짜 컬럼 검증 결과"""
+        if field not in self._dates:
+            self._dates[field] = _vec_validate_date(
+                self.text(field), _DATE_LABELS.get(field, field),
+            )
+        return self._dates[field]
+
+
+@dataclass
+class RuleResult:
+    """
+    규칙 1개(또는 필드 1개)의 검증 결과.
+
+    message: 공통 문자열 / 전체 행 메시지 Series / params가 있으면 str.format 템플릿
+             (템플릿은 mask에 해당하는 행에만 적용)
+    """
+    mask: pd.Series
+    message: str | pd.Series
+    params: dict[str, pd.Series] | None = None
+    field: str | None = None        # 규칙 기본 필드 대신 사용할 필드
+
+
+CheckFn = Callable[[ValidationContext], "RuleResult | list[RuleResult]"]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """검증 규칙"""
+    id: str
+    field: str                          # 이슈에 기록할 필드
+    level: str                          # "error" | "warning"
+    check: CheckFn
+    requires: tuple[str, ...] = ()      # 필요한 컬럼 (하나라도 없으면 건너뜀)
+    after: tuple[str, ...] = ()         # 먼저 실행되어야 하는 규칙 ID
+    default: bool = True                # config 설정 없이 항상 실행
+
+
+RULES: dict[str, Rule] = {}
+
+
+def register_rule(
+    id: str,
+    field: str,
+    level: str = "error",
+    requires: tuple[str, ...] = (),
+    after: tuple[str, ...] = (),
+    default: bool = True,
+) -> Callable[[CheckFn], CheckFn]:
+    """검증 규칙 등록 데코레이터 (등록 순서 = 같은 단계에서의 실행/출력 순서)"""
+    if level not in ("error", "warning"):
+        raise ValueError(f"지원하지 않는 level: {level}")
+
+    def decorator(check: CheckFn) -> CheckFn:
+        RULES[id] = Rule(id, field, level, check, requires, after, default)
+        return check
+
+    return decorator
+
+
+def resolve_rules(extra: list[str] | None = None) -> list[Rule]:
+    """
+    실행할 규칙 목록 (기본 규칙 + extra), 선행 규칙(after) 순서 정렬.
+    선행 규칙이 활성화되지 않았으면 그 의존성은 무시.
+    """
+    enabled = [r for r in RULES.values() if r.default]
+    for rule_id in extra or []:
+        if rule_id not in RULES:
+            raise KeyError(f"등록되지 않은 검증 규칙: {rule_id}")
+        if all(r.id != rule_id for r in enabled):
+            enabled.append(RULES[rule_id])
+
+    enabled_ids = {r.id for r in enabled}
+    ordered: list[Rule] = []
+    done: set[str] = set()
+    visiting: set[str] = set()
+
+    def visit(rule: Rule) -> None:
+        if rule.id in done:
+            return
+        if rule.id in visiting:
+            raise ValueError(f"검증 규칙 순환 의존: {rule.id}")
+        visiting.add(rule.id)
+        for dep in rule.after:
+            if dep in enabled_ids:
+                visit(RULES[dep])
+        visiting.discard(rule.id)
+        done.add(rule.id)
+        ordered.append(rule)
+
+    for rule in enabled:
+        visit(rule)
+    return ordered
+
+
+# ──────────────────────────────────────────
+# 기본 규칙
+# ──────────────────────────────────────────
+
+@register_rule("name_missing", "name", requires=("name",))
+def _name_missing(ctx: ValidationContext) -> RuleResult:
+    return RuleResult(ctx.text("name") == "", "이름 누락")
+
+
+@register_rule("resident_no", "residentNo", requires=("residentNo",))
+def _resident_no(ctx: ValidationContext) -> RuleResult:
+    has_error, message = _vec_validate_resident_no(ctx.text("residentNo"))
+    return RuleResult(has_error, message)
+
+
+@register_rule("join_date_missing", "joinDate", level="warning", requires=("joinDate",))
+def _join_date_missing(ctx: ValidationContext) -> RuleResult:
+    return RuleResult(ctx.date_check("joinDate").is_empty, "입사일 누락")
+
+
+@register_rule("join_date", "joinDate", requires=("joinDate",), after=("join_date_missing",))
+def _join_date(ctx: ValidationContext) -> RuleResult:
+    check = ctx.date_check("joinDate")
+    return RuleResult(check.has_error, check.message)
+
+
+@register_rule("leave_date", "leaveDate", requires=("leaveDate",), after=("join_date",))
+def _leave_date(ctx: ValidationContext) -> RuleResult:
+    check = ctx.date_check("leaveDate")
+    return RuleResult(check.has_error, check.message)
+
+
+@register_rule(
+    "date_order", "leaveDate",
+    requires=("joinDate", "leaveDate"), after=("join_date", "leave_date"),
+)
+def _date_order(ctx: ValidationContext) -> RuleResult:
+    """입사일 > 퇴사일 (둘 다 유효한 경우만)"""
+    join, leave = ctx.date_check("joinDate"), ctx.date_check("leaveDate")
+    jd, ld = ctx.text("joinDate"), ctx.text("leaveDate")
+    both_valid = ~join.is_empty & ~leave.is_empty & ~join.has_error & ~leave.has_error
+    return RuleResult(
+        both_valid & (jd > ld),
+        "퇴사일({leave})이 입사일({join})보다 빠름",
+        params={"leave": ld, "join": jd},
+    )
+
+
+@register_rule("wage_negative", "wage", requires=("wage",), after=("date_order",))
+def _wage_negative(ctx: ValidationContext) -> RuleResult:
+    wage = ctx.number("wage").fillna(0)
+    return RuleResult(wage < 0, "급여 음수값 ({wage})", params={"wage": wage})
+
+
+# ──────────────────────────────────────────
+# 추가 규칙 (config.validationRules로 활성화)
+# ──────────────────────────────────────────
+
+def _month_range(year_month: str) -> tuple[str, str]:
+    """YYYY-MM → (월 첫날, 다음 달 첫날) 문자열 (날짜 문자열 비교용)"""
+    year, month = map(int, year_month.split("-"))
+    next_first = f"{year + 1}-01-01" if month == 12 else f"{year}-{month + 1:02d}-01"
+    return f"{year_month}-01", next_first
+
+
+@register_rule(
+    "minimum_wage", "wage", level="warning",
+    requires=("wage",), after=("wage_negative",), default=False,
+)
+def _minimum_wage(ctx: ValidationContext) -> RuleResult:
+    """
+    월 보수가 연도별 기본 월평균보수(최저시급 × 209시간) 미만.
+    대상 월 중도 입사/퇴사자와 급여 0(누락)은 제외.
+    """
+    year = int(ctx.year_month[:4]) if ctx.year_month else None
+    minimum = get_default_monthly_wage(year)
+    wage = ctx.number("wage").fillna(0)
+    mask = (wage > 0) & (wage < minimum)
+
+    if ctx.year_month:
+        first, next_first = _month_range(ctx.year_month)
+        for f in ("joinDate", "leaveDate"):
+            if ctx.has(f):
+                d = ctx.text(f)
+                mask &= ~((d >= first) & (d < next_first))
+
+    return RuleResult(
+        mask,
+        "월 보수 최저 기준 미달 ({wage:,.0f}원 < {minimum:,}원)",
+        params={"wage": wage, "minimum": pd.Series(minimum, index=wage.index)},
+    )
+
+
+@register_rule("tax_exempt_limit", "wage", level="warning", after=("wage_negative",), default=False)
+def _tax_exempt_limit(ctx: ValidationContext) -> list[RuleResult]:
+    """비과세 항목(config.wageClassification.taxExemptItems) 월 한도 초과"""
+    if ctx.config is None:
+        return []
+    results = []
+    for item in ctx.config.wageClassification.taxExemptItems:
+        if not ctx.has(item.field):
+            continue
+        amount = ctx.number(item.field).fillna(0)
+        results.append(RuleResult(
+            amount > item.monthlyLimit,
+            f"{item.label} 비과세 한도 초과 ({{amount:,.0f}}원 > {item.monthlyLimit:,}원)",
+            params={"amount": amount},
+            field=item.field,
+        ))
+    return results
+
+
+@register_rule(
+    "duplicate_resident_no", "residentNo",
+    requires=("residentNo",), after=("resident_no",), default=False,
+)
+def _duplicate_resident_no(ctx: ValidationContext) -> RuleResult:
+    """같은 원장에 같은 주민번호가 2번 이상 (형식 오류 행 제외, 해당 행 모두 표시)"""
+    digits = ctx.text("residentNo").str.replace(r"[^0-9]", "", regex=True)
+    valid = digits.where(digits.str.len() == 13)
+    counts = valid.map(valid.value_counts()).fillna(0).astype(int)
+    return RuleResult(
+        counts > 1,
+        "주민번호 중복 ({count}건)",
+        params={"count": counts},
+    )
@@ -4,12 +4,15 @@
 """
 from __future__ import annotations
 
-import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import cached_property
 
 import numpy as np
 import pandas as pd
 
+from ..config.schema import BusinessPayrollConfig
+from .rules import Rule, RuleResult, ValidationContext, resolve_rules
+
 
 @dataclass
 class ValidationIssue:
@@ -20,189 +23,243 @@ class ValidationIssue:
     message: str
 
 
-@dataclass
+LEVELS = ("error", "warning")
+_LEVEL_CODE = {name: code for code, name in enumerate(LEVELS)}
+
+
+@dataclass(init=False)
 class ValidationResult:
-    """검증 결과"""
+    """
+    검증 결과 (컬럼형 저장).
+
+    이슈는 행/필드 코드/레벨 코드/메시지 ID 배열로 보관하고,
+    필드명과 메시지 문자열은 중복 없이 한 번만 저장.
+    ValidationIssue 목록은 issues 접근 시 처음 한 번만 생성.
+
+    이전 API 호환: ValidationResult(total_rows, valid_rows, issues=[...])로도 생성 가능
+    (from_issues와 같음). 단 생성 후 issues 목록을 수정해도 집계에는 반영되지 않음.
+    """
     total_rows: int
     valid_rows: int
-    issues: list[ValidationIssue] = field(default_factory=list)
-
-    @property
+    rows: np.ndarray
+    field_codes: np.ndarray
+    level_codes: np.ndarray
+    message_ids: np.ndarray
+    field_names: list[str]
+    messages: list[str]
+
+    def __init__(
+        self,
+        total_rows: int,
+        valid_rows: int,
+        issues: list[ValidationIssue] | None = None,
+        *,
+        rows: np.ndarray | None = None,
+        field_codes: np.ndarray | None = None,
+        level_codes: np.ndarray | None = None,
+        message_ids: np.ndarray | None = None,
+        field_names: list[str] | None = None,
+        messages: list[str] | None = None,
+    ) -> None:
+        if issues:
+            built = ValidationResult.from_issues(total_rows, valid_rows, issues)
+            rows, field_codes, level_codes = built.rows, built.field_codes, built.level_codes
+            message_ids, field_names, messages = built.message_ids, built.field_names, built.messages
+        self.total_rows = total_rows
+        self.valid_rows = valid_rows
+        self.rows = np.empty(0, dtype=np.int64) if rows is None else rows
+        self.field_codes = np.empty(0, dtype=np.int16) if field_codes is None else field_codes
+        self.level_codes = np.empty(0, dtype=np.int8) if level_codes is None else level_codes
+        self.message_ids = np.empty(0, dtype=np.int32) if message_ids is None else message_ids
+        self.field_names = field_names or []
+        self.messages = messages or []
+
+    @classmethod
+    def from_issues(
+        cls,
+        total_rows: int,
+        valid_rows: int,
+        issues: list[ValidationIssue],
+    ) -> ValidationResult:
+        """ValidationIssue 목록으로 생성"""
+        buf = _IssueBuffer()
+        for issue in issues:
+            buf.add(np.array([issue.row]), issue.field, issue.level, issue.message)
+        return buf.build(total_rows, valid_rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @cached_property
+    def issues(self) -> list[ValidationIssue]:
+        fields = self.field_names
+        messages = self.messages
+        return [
+            ValidationIssue(row=r, field=fields[f], level=LEVELS[lv], message=messages[m])
+            for r, f, lv, m in zip(
+                self.rows.tolist(),
+                self.field_codes.tolist(),
+                self.level_codes.tolist(),
+                self.message_ids.tolist(),
+            )
+        ]
+
+    @cached_property
     def error_count(self) -> int:
-        return sum(1 for i in self.issues if i.level == "error")
+        return int(np.count_nonzero(self.level_codes == _LEVEL_CODE["error"]))
 
-    @property
+    @cached_property
     def warning_count(self) -> int:
-        return sum(1 for i in self.issues if i.level == "warning")
+        return int(np.count_nonzero(self.level_codes == _LEVEL_CODE["warning"]))
 
     @property
     def is_valid(self) -> bool:
         return self.error_count == 0
 
-
-# ──────────────────────────────────────────
-# 벡터화된 검증 헬퍼
-# ──────────────────────────────────────────
-
-_RE_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-_RE_DIGITS = re.compile(r"[^0-9]")
-
-
-def _vec_validate_resident_no(series: pd.Series) -> pd.DataFrame:
-    """
-    주민번호 벡터 검증.
-    Returns DataFrame with columns: [has_error: bool, message: str]
-    """
-    s = series.fillna("").astype(str).str.strip()
-    digits = s.str.replace(r"[^0-9]", "", regex=True)
-    digit_len = digits.str.len()
-
-    # 조건별 에러
-    empty = s == ""
-    wrong_len = ~empty & (digit_len != 13)
-
-    # 월/일 범위 (13자리인 것만 체크)
-    valid_len = ~empty & (digit_len == 13)
-    mm = pd.to_numeric(digits.str[2:4], errors="coerce").fillna(0).astype(int)
-    dd = pd.to_numeric(digits.str[4:6], errors="coerce").fillna(0).astype(int)
-    bad_month = valid_len & ((mm < 1) | (mm > 12))
-    bad_day = valid_len & ((dd < 1) | (dd > 31))
-
-    has_error = empty | wrong_len | bad_month | bad_day
-
-    # 메시지 생성 (에러가 있는 행만)
-    msg = pd.Series("", index=series.index)
-    msg[empty] = "주민번호 누락"
-    msg[wrong_len] = "주민번호 자릿수 오류 (" + digit_len[wrong_len].astype(str) + "자리)"
-    msg[bad_month] = "주민번호 월 범위 오류 (" + mm[bad_month].astype(str) + "월)"
-    msg[bad_day] = "주민번호 일 범위 오류 (" + dd[bad_day].astype(str) + "일)"
-
-    return pd.DataFrame({"has_error": has_error, "message": msg})
-
-
-def _vec_validate_date(series: pd.Series, field_name: str) -> pd.DataFrame:
-    """
-    날짜 벡터 검증.
-    Returns DataFrame: [has_error: bool, message: str, is_empty: bool]
-    """
-    s = series.fillna("").astype(str).str.strip()
-    is_empty = s == ""
-    matches_fmt = s.str.match(r"^\d{4}-\d{2}-\d{2}$")
-
-    # 형식 불일치 (비어있지 않은데 형식이 틀린 경우)
-    bad_fmt = ~is_empty & ~matches_fmt
-
-    # 범위 체크 (형식 맞는 것만)
-    valid_fmt = ~is_empty & matches_fmt
-    year = pd.to_numeric(s.str[:4], errors="coerce").fillna(0).astype(int)
-    month = pd.to_numeric(s.str[5:7], errors="coerce").fillna(0).astype(int)
-    day = pd.to_numeric(s.str[8:10], errors="coerce").fillna(0).astype(int)
-
-    bad_year = valid_fmt & ((year < 1950) | (year > 2100))
-    bad_month = valid_fmt & ((month < 1) | (month > 12))
-    bad_day = valid_fmt & ((day < 1) | (day > 31))
-
-    has_error = bad_fmt | bad_year | bad_month | bad_day
-
-    msg = pd.Series("", index=series.index)
-    msg[bad_fmt] = field_name + " 형식 오류 (" + s[bad_fmt] + ")"
-    msg[bad_year] = field_name + " 연도 범위 오류 (" + year[bad_year].astype(str) + ")"
-    msg[bad_month] = field_name + " 월 범위 오류 (" + month[bad_month].astype(str) + ")"
-    msg[bad_day] = field_name + " 일 범위 오류 (" + day[bad_day].astype(str) + ")"
-
-    return pd.DataFrame({"has_error": has_error, "message": msg, "is_empty": is_empty})
+    def to_frame(self) -> pd.DataFrame:
+        """이슈 표 (row, field, level, message) - 객체 생성 없이 배열에서 바로 구성"""
+        return pd.DataFrame({
+            "row": self.rows,
+            "field": pd.Categorical.from_codes(self.field_codes, categories=self.field_names)
+            if self.field_names else pd.Categorical([]),
+            "level": pd.Categorical.from_codes(self.level_codes, categories=list(LEVELS)),
+            "message": np.asarray(self.messages, dtype=object)[self.message_ids]
+            if self.messages else np.empty(0, dtype=object),
+        })
+
+
+class _IssueBuffer:
+    """검증 규칙별 이슈를 배열 조각으로 모아 ValidationResult로 변환"""
+
+    def __init__(self) -> None:
+        self._rows: list[np.ndarray] = []
+        self._fields: list[np.ndarray] = []
+        self._levels: list[np.ndarray] = []
+        self._message_ids: list[np.ndarray] = []
+        self._field_ids: dict[str, int] = {}
+        self._message_table: dict[str, int] = {}
+
+    def _intern(self, table: dict[str, int], value: str) -> int:
+        code = table.get(value)
+        if code is None:
+            code = table[value] = len(table)
+        return code
+
+    def add(
+        self,
+        rows: np.ndarray,
+        field: str,
+        level: str,
+        messages: str | np.ndarray | list[str],
+    ) -> None:
+        """
+        이슈 조각 추가 (rows 순서 유지).
+        messages: 공통 문자열 또는 rows와 같은 길이의 메시지 배열
+        """
+        n = len(rows)
+        if n == 0:
+            return
+        if isinstance(messages, str):
+            ids = np.full(n, self._intern(self._message_table, messages), dtype=np.int32)
+        else:
+            codes, uniques = pd.factorize(np.asarray(messages, dtype=object))
+            lookup = np.array(
+                [self._intern(self._message_table, str(u)) for u in uniques],
+                dtype=np.int32,
+            )
+            ids = lookup[codes]
+
+        self._rows.append(np.asarray(rows))
+        self._fields.append(np.full(n, self._intern(self._field_ids, field), dtype=np.int16))
+        self._levels.append(np.full(n, _LEVEL_CODE[level], dtype=np.int8))
+        self._message_ids.append(ids)
+
+    def build(self, total_rows: int, valid_rows: int) -> ValidationResult:
+        if not self._rows:
+            return ValidationResult(total_rows=total_rows, valid_rows=valid_rows)
+        return ValidationResult(
+            total_rows=total_rows,
+            valid_rows=valid_rows,
+            rows=np.concatenate(self._rows),
+            field_codes=np.concatenate(self._fields),
+            level_codes=np.concatenate(self._levels),
+            message_ids=np.concatenate(self._message_ids),
+            field_names=list(self._field_ids),
+            messages=list(self._message_table),
+        )
+
+
+def _add_issues(
+    buf: _IssueBuffer,
+    index: np.ndarray,
+    rule: Rule,
+    result: RuleResult,
+) -> np.ndarray:
+    """규칙 결과의 마스크 행을 이슈로 추가. Returns bool 마스크 (numpy)"""
+    selected = result.mask.to_numpy(dtype=bool)
+    if not selected.any():
+        return selected
+
+    if isinstance(result.message, pd.Series):
+        messages = result.message.to_numpy()[selected]
+    elif result.params:
+        # 템플릿은 해당 행에만 적용
+        keys = list(result.params)
+        columns = [result.params[k].to_numpy()[selected].tolist() for k in keys]
+        messages = [
+            result.message.format(**dict(zip(keys, values)))
+            for values in zip(*columns)
+        ]
+    else:
+        messages = result.message
+
+    buf.add(index[selected], result.field or rule.field, rule.level, messages)
+    return selected
 
 
 # ──────────────────────────────────────────
 # 메인 검증 함수
 # ──────────────────────────────────────────
 
-def validate_wage_data(df: pd.DataFrame) -> ValidationResult:
+def validate_wage_data(
+    df: pd.DataFrame,
+    config: BusinessPayrollConfig | None = None,
+    year_month: str | None = None,
+    rules: list[str] | None = None,
+) -> ValidationResult:
     """
-    표준화된 DataFrame의 데이터 정합성 검증 (벡터화).
+    표준화된 DataFrame의 데이터 정합성 검증 (벡터화, 단일 패스).
+
+    기본 규칙 + config.validationRules + rules를 선행 규칙 순서로 실행.
+    정규화된 컬럼과 날짜 검증 결과는 ValidationContext에서 규칙 간 공유.
 
     Parameters
     ----------
     df : 표준 필드명 DataFrame (map_to_standard 출력)
+    config : 사업장 config (추가 규칙 활성화, 비과세 한도 등)
+    year_month : 대상 월 (YYYY-MM, 최저 기준 연도/중도 입퇴사 판정)
+    rules : 추가로 실행할 규칙 ID
     """
     if len(df) == 0:
         return ValidationResult(total_rows=0, valid_rows=0)
 
-    issues: list[ValidationIssue] = []
+    extra = list(config.validationRules) if config is not None else []
+    extra += rules or []
+
+    ctx = ValidationContext(df, config, year_month)
+    index = df.index.to_numpy()
+    buf = _IssueBuffer()
     # 행별 에러 존재 여부 추적
-    has_error_per_row = pd.Series(False, index=df.index)
-
-    # ── 1. 이름 누락 ──
-    if "name" in df.columns:
-        name_empty = df["name"].fillna("").astype(str).str.strip() == ""
-        for idx in df.index[name_empty]:
-            issues.append(ValidationIssue(row=idx, field="name", level="error", message="이름 누락"))
-        has_error_per_row |= name_empty
-
-    # ── 2. 주민번호 검증 ──
-    if "residentNo" in df.columns:
-        rno = _vec_validate_resident_no(df["residentNo"])
-        for idx in df.index[rno["has_error"]]:
-            issues.append(ValidationIssue(
-                row=idx, field="residentNo", level="error", message=rno.at[idx, "message"]
-            ))
-        has_error_per_row |= rno["has_error"]
-
-    # ── 3. 입사일 검증 ──
-    if "joinDate" in df.columns:
-        jd = _vec_validate_date(df["joinDate"], "입사일")
-        # 누락 → warning
-        for idx in df.index[jd["is_empty"]]:
-            issues.append(ValidationIssue(
-                row=idx, field="joinDate", level="warning", message="입사일 누락"
-            ))
-        # 형식/범위 에러
-        for idx in df.index[jd["has_error"]]:
-            issues.append(ValidationIssue(
-                row=idx, field="joinDate", level="error", message=jd.at[idx, "message"]
-            ))
-        has_error_per_row |= jd["has_error"]
-
-    # ── 4. 퇴사일 검증 ──
-    if "leaveDate" in df.columns:
-        ld = _vec_validate_date(df["leaveDate"], "퇴사일")
-        for idx in df.index[ld["has_error"]]:
-            issues.append(ValidationIssue(
-                row=idx, field="leaveDate", level="error", message=ld.at[idx, "message"]
-            ))
-        has_error_per_row |= ld["has_error"]
-
-        # 입사일 > 퇴사일 (둘 다 유효한 경우만)
-        if "joinDate" in df.columns:
-            jd_s = df["joinDate"].fillna("").astype(str).str.strip()
-            ld_s = df["leaveDate"].fillna("").astype(str).str.strip()
-            both_valid = (jd_s != "") & (ld_s != "") & ~ld["has_error"]
-            if "joinDate" in df.columns:
-                jd_check = _vec_validate_date(df["joinDate"], "입사일")
-                both_valid &= ~jd_check["has_error"]
-            reversed_dates = both_valid & (jd_s > ld_s)
-            for idx in df.index[reversed_dates]:
-                issues.append(ValidationIssue(
-                    row=idx, field="leaveDate", level="error",
-                    message=f"퇴사일({ld_s[idx]})이 입사일({jd_s[idx]})보다 빠름"
-                ))
-            has_error_per_row |= reversed_dates
-
-    # ── 5. 급여 음수 체크 ──
-    if "wage" in df.columns:
-        wage_series = pd.to_numeric(df["wage"], errors="coerce").fillna(0)
-        negative_wage = wage_series < 0
-        for idx in df.index[negative_wage]:
-            issues.append(ValidationIssue(
-                row=idx, field="wage", level="error",
-                message=f"급여 음수값 ({wage_series[idx]})"
-            ))
-        has_error_per_row |= negative_wage
+    has_error_per_row = np.zeros(len(df), dtype=bool)
 
-    valid_rows = int((~has_error_per_row).sum())
+    for rule in resolve_rules(extra):
+        if not ctx.has(*rule.requires):
+            continue
+        outcome = rule.check(ctx)
+        for result in outcome if isinstance(outcome, list) else [outcome]:
+            selected = _add_issues(buf, index, rule, result)
+            if rule.level == "error":
+                has_error_per_row |= selected
 
-    return ValidationResult(
-        total_rows=len(df),
-        valid_rows=valid_rows,
-        issues=issues,
-    )
+    valid_rows = int((~has_error_per_row).sum())
+    return buf.build(total_rows=len(df), valid_rows=valid_rows)
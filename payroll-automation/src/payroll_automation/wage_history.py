@@ -0,0 +1,265 @@
+"""
+급여 이력 저장소 (긴 형식, 연도별 파티션)
+(사업장, 주민번호, 월, 임금총액)을 연도별 정렬 배열로 보관하고
+퇴직일 직전 3개월 급여를 (사업장, 주민번호, 월) 정렬 키 searchsorted로 조회.
+월 임포트마다 record로 해당 월 급여를 반영.
+
+디렉토리 구조 ({data_dir}/wage_history):
+    meta.json           사업장 ID 목록, 연도별 행 수, 포맷 버전
+    {YYYY}/slot.npy     int64  (사업장코드 * 10^13 + 주민번호) * 12 + (월 - 1)  (정렬됨 = 인덱스)
+    {YYYY}/wage.npy     int64  임금총액
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from .calculators.retirement import MonthlyWageData
+from .config.loader import get_data_dir
+from .excel.cache import ensure_private_dir, write_private_file
+from .registry import _RESIDENT_SPAN, _resident_keys
+
+
+HISTORY_FORMAT_VERSION = 1
+
+# 임금총액 필드 우선순위 (앞 필드가 비어 있거나 0이면 다음 필드)
+# 매퍼는 빈 금액 칸을 0으로 파싱하므로 0도 빈 값으로 봄
+WAGE_FIELDS = ("totalWage", "wage")
+
+# slot = 근로자 키 * 12 + 월 → int64 범위에서 사업장 코드 상한
+_MAX_BUSINESSES = np.iinfo(np.int64).max // (_RESIDENT_SPAN * 12)
+
+
+def _format_months(month_idx: np.ndarray) -> np.ndarray:
+    """연속 월 번호 (year * 12 + month - 1) → YYYY-MM 문자열"""
+    years, months = np.divmod(month_idx, 12)
+    return pd.Series(years).astype(str).str.cat(
+        pd.Series(months + 1).astype(str).str.zfill(2), sep="-"
+    ).to_numpy(dtype=object)
+
+
+class WageHistoryStore:
+    """
+    연도별 파티션 급여 이력.
+
+    - 조회: window_wages / monthly_wages (퇴직일 전 3개월, 연도 파티션별 searchsorted)
+    - 갱신: record (매핑된 월 원장 반영, 같은 사업장/월은 교체) → save (변경된 연도만 기록)
+    """
+
+    def __init__(self, directory: str | Path | None = None, mmap: bool = True):
+        self.directory = Path(directory) if directory else get_data_dir() / "wage_history"
+        self.mmap = mmap
+        self.businesses: list[str] = []
+        self._codes: dict[str, int] = {}
+        self._counts: dict[int, int] = {}                       # 연도 → 행 수 (meta)
+        self._years: dict[int, tuple[np.ndarray, np.ndarray]] = {}  # 로드된 파티션 (slot, wage)
+        self._dirty: set[int] = set()
+
+    # ── 로드/저장 ──
+
+    @classmethod
+    def open(cls, directory: str | Path | None = None, mmap: bool = True) -> "WageHistoryStore":
+        """메타데이터 로드 (없으면 빈 저장소). 연도 파티션은 조회 시점에 로드"""
+        store = cls(directory, mmap)
+        meta_path = store.directory / "meta.json"
+        if not meta_path.exists():
+            return store
+
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != HISTORY_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 급여 이력 버전: {meta.get('version')}")
+
+        store.businesses = list(meta["businesses"])
+        store._codes = {b: i for i, b in enumerate(store.businesses)}
+        store._counts = {int(y): n for y, n in meta["years"].items()}
+        return store
+
+    def _partition(self, year: int) -> tuple[np.ndarray, np.ndarray]:
+        """연도 파티션 (없으면 빈 배열). mmap=True면 읽기 전용 메모리 매핑"""
+        if year not in self._years:
+            if year in self._counts:
+                path = self.directory / str(year)
+                mode = "r" if self.mmap else None
+                self._years[year] = (
+                    np.load(path / "slot.npy", mmap_mode=mode),
+                    np.load(path / "wage.npy", mmap_mode=mode),
+                )
+            else:
+                self._years[year] = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+        return self._years[year]
+
+    def save(self) -> None:
+        """
+        변경된 연도 파티션과 meta.json 저장 (임시 파일 후 교체).
+        주민번호가 들어 있으므로 디렉토리 0700 / 파일 0600 (write_private_file)
+        """
+        ensure_private_dir(self.directory)
+        for year in sorted(self._dirty):
+            path = self.directory / str(year)
+            for name, arr in zip(("slot", "wage"), self._years[year]):
+                write_private_file(path / f"{name}.npy", lambda f, arr=arr: np.save(f, np.asarray(arr)))
+        self._dirty.clear()
+
+        meta = {
+            "version": HISTORY_FORMAT_VERSION,
+            "businesses": self.businesses,
+            "years": {str(y): n for y, n in sorted(self._counts.items())},
+        }
+        write_private_file(
+            self.directory / "meta.json",
+            lambda f: json.dump(meta, f, ensure_ascii=False, indent=2),
+            mode="w",
+        )
+
+    def __len__(self) -> int:
+        return sum(self._counts.values())
+
+    @property
+    def years(self) -> list[int]:
+        return sorted(self._counts)
+
+    # ── 조회 ──
+
+    def _worker_keys(self, business_id: str, resident_nos: pd.Series) -> np.ndarray:
+        """(사업장, 주민번호) → 근로자 키 (사업장 미등록/주민번호 형식 오류 → -1)"""
+        resident = _resident_keys(resident_nos)
+        code = self._codes.get(business_id)
+        if code is None:
+            return np.full(len(resident), -1, dtype=np.int64)
+        return np.where(resident >= 0, code * _RESIDENT_SPAN + resident, -1)
+
+    def _lookup(self, worker_keys: np.ndarray, month_idx: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """(근로자 키, 월 번호) → (찾음 여부, 급여). 연도 파티션별로 묶어 조회"""
+        found = np.zeros(len(worker_keys), dtype=bool)
+        wages = np.zeros(len(worker_keys), dtype=np.int64)
+        valid = worker_keys >= 0
+        year = month_idx // 12
+        slots = worker_keys * 12 + month_idx % 12
+
+        for y in np.unique(year[valid]).tolist():
+            if y not in self._counts and y not in self._years:
+                continue
+            index, amounts = self._partition(y)
+            if len(index) == 0:
+                continue
+            sel = np.flatnonzero(valid & (year == y))
+            at = np.minimum(np.searchsorted(index, slots[sel]), len(index) - 1)
+            hit = index[at] == slots[sel]
+            found[sel[hit]] = True
+            wages[sel[hit]] = amounts[at[hit]]
+        return found, wages
+
+    def window_wages(
+        self,
+        business_id: str,
+        resident_nos: Sequence[str] | pd.Series,
+        leave_dates: Sequence[str] | pd.Series,
+    ) -> pd.DataFrame:
+        """
+        퇴직일 전 3개월 산정 기간에 걸치는 월(퇴사 월 포함 최대 4개월)의 급여.
+
+        Returns
+        -------
+        긴 형식 급여 테이블 [worker_id(주민번호), year_month, total_wage]
+        - calculate_retirement_batch의 wages 인자로 그대로 사용
+        - 이력이 없는 월/퇴사일 형식 오류 근로자는 행 없음
+        """
+        resident = pd.Series(resident_nos, dtype=object).fillna("").astype(str).str.strip()
+        leave = pd.to_datetime(pd.Series(leave_dates, dtype=object), format="%Y-%m-%d", errors="coerce")
+        if len(resident) != len(leave):
+            raise ValueError("resident_nos와 leave_dates의 길이가 다릅니다")
+
+        ok = leave.notna().to_numpy()
+        keys = self._worker_keys(business_id, resident)[ok]
+        leave_month = leave[ok].dt.year.to_numpy() * 12 + leave[ok].dt.month.to_numpy() - 1
+
+        # 근로자 × (퇴사 월 - 3 ~ 퇴사 월)
+        offsets = np.arange(-3, 1)
+        month_idx = (leave_month[:, None] + offsets).ravel()
+        worker_pos = np.repeat(np.flatnonzero(ok), len(offsets))
+        found, wages = self._lookup(np.repeat(keys, len(offsets)), month_idx)
+
+        return pd.DataFrame({
+            "worker_id": resident.to_numpy()[worker_pos[found]],
+            "year_month": _format_months(month_idx[found]),
+            "total_wage": wages[found],
+        })
+
+    def monthly_wages(self, business_id: str, resident_no: str, leave_date: str) -> list[MonthlyWageData]:
+        """calculate_retirement용 퇴직일 전 3개월 급여 (window_wages 1명 버전)"""
+        table = self.window_wages(business_id, [resident_no], [leave_date])
+        return [
+            MonthlyWageData(year_month=ym, total_wage=int(w))
+            for ym, w in zip(table["year_month"], table["total_wage"])
+        ]
+
+    def to_frame(self, business_id: str | None = None) -> pd.DataFrame:
+        """저장된 이력 전체 (사업장 지정 시 해당 사업장만)"""
+        frames = []
+        code = self._codes.get(business_id, -1) if business_id is not None else None
+        for year in self.years:
+            index, amounts = self._partition(year)
+            keys, month = np.divmod(np.asarray(index), 12)
+            codes = keys // _RESIDENT_SPAN
+            sel = np.ones(len(keys), dtype=bool) if code is None else codes == code
+            frames.append(pd.DataFrame({
+                "businessId": np.array(self.businesses, dtype=object)[codes[sel]],
+                "residentNo": pd.Series(keys[sel] % _RESIDENT_SPAN).astype(str).str.zfill(13).to_numpy(),
+                "yearMonth": _format_months(year * 12 + month[sel]),
+                "totalWage": np.asarray(amounts)[sel],
+            }))
+        if not frames:
+            return pd.DataFrame(columns=["businessId", "residentNo", "yearMonth", "totalWage"])
+        return pd.concat(frames, ignore_index=True)
+
+    # ── 갱신 ──
+
+    def record(self, business_id: str, mapped_df: pd.DataFrame, year_month: str) -> int:
+        """
+        매핑된 월 원장의 임금총액 반영 (같은 사업장/월의 기존 이력은 교체).
+        임금총액 = totalWage (비어 있거나 0이면 wage). 같은 근로자가 여러 행이면 마지막 행.
+        Returns 기록한 근로자 수
+        """
+        year, month = map(int, year_month.split("-"))
+        if not 1 <= month <= 12:
+            raise ValueError(f"year_month 형식 오류 (YYYY-MM): {year_month}")
+
+        if business_id not in self._codes:
+            if len(self.businesses) >= _MAX_BUSINESSES:
+                raise ValueError(f"급여 이력 사업장 수 상한 초과: {_MAX_BUSINESSES}")
+            self._codes[business_id] = len(self.businesses)
+            self.businesses.append(business_id)
+        code = self._codes[business_id]
+
+        keys = np.empty(0, dtype=np.int64)
+        wages = np.empty(0, dtype=np.int64)
+        if "residentNo" in mapped_df.columns and len(mapped_df):
+            wage = pd.Series(np.nan, index=mapped_df.index)
+            for field in reversed(WAGE_FIELDS):
+                if field in mapped_df.columns:
+                    value = pd.to_numeric(mapped_df[field], errors="coerce")
+                    # 0/빈 값이면 다음 필드 값 (다음 필드도 없으면 이 필드의 0 유지)
+                    wage = value.where(value.notna() & (value != 0), wage.fillna(value))
+            keys = self._worker_keys(business_id, mapped_df["residentNo"])
+            ok = (keys >= 0) & wage.notna().to_numpy()
+            rows = pd.DataFrame({"key": keys[ok], "wage": wage.to_numpy()[ok]})
+            rows = rows[~rows["key"].duplicated(keep="last")]
+            keys = rows["key"].to_numpy(dtype=np.int64)
+            wages = rows["wage"].to_numpy().astype(np.int64)
+
+        index, amounts = self._partition(year)
+        index, amounts = np.asarray(index), np.asarray(amounts)
+        stale = (index // 12 // _RESIDENT_SPAN == code) & (index % 12 == month - 1)
+        merged_index = np.concatenate([index[~stale], keys * 12 + (month - 1)])
+        merged_amounts = np.concatenate([amounts[~stale], wages])
+        order = np.argsort(merged_index, kind="stable")
+
+        self._years[year] = (merged_index[order], merged_amounts[order])
+        self._counts[year] = len(merged_index)
+        self._dirty.add(year)
+        return len(keys)
@@ -0,0 +1,16 @@
+"""파싱 캐시 - 주민번호가 든 캐시 파일은 소유자만 읽을 수 있어야 함"""
+import stat
+
+import pandas as pd
+import pytest
+
+from payroll_automation.excel.cache import LedgerCache
+
+
+@pytest.mark.skipif(not LedgerCache().available, reason="pyarrow 필요")
+def test_cache_dir_and_files_are_owner_only(tmp_path):
+    cache = LedgerCache(tmp_path / "ledgers")
+    cache.put("k", pd.DataFrame({"name": ["김신규"], "residentNo": ["9001011234567"]}))
+
+    assert stat.S_IMODE(cache.directory.stat().st_mode) == 0o700
+    assert stat.S_IMODE(cache._path("k").stat().st_mode) == 0o600
@@ -0,0 +1,38 @@
+"""레이아웃 감지용 XML 리더 - 1904 날짜 체계 / 메모리 캐시 상한"""
+from datetime import datetime
+
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.utils.datetime import CALENDAR_MAC_1904
+
+from payroll_automation.excel import detector
+from payroll_automation.excel.detector import _XlsxHead
+
+
+@pytest.mark.parametrize("date1904", [False, True])
+def test_dates_follow_workbook_epoch(tmp_path, date1904):
+    path = tmp_path / "book.xlsx"
+    wb = Workbook()
+    if date1904:
+        wb.epoch = CALENDAR_MAC_1904
+    ws = wb.active
+    ws.append(["성명", "입사일"])
+    ws.append(["김신규", datetime(2026, 1, 5)])
+    wb.save(path)
+
+    with _XlsxHead(path) as book:
+        rows = book.rows(book.sheetnames[0], 10)
+
+    expected = load_workbook(path).active["B2"].value
+    assert expected == datetime(2026, 1, 5)
+    assert rows[1] == ("김신규", expected)
+
+
+def test_memory_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(detector, "_MEMORY_CACHE_SIZE", 2)
+    monkeypatch.setattr(detector, "_memory_cache", detector.OrderedDict())
+
+    for key in ("a", "b", "c"):
+        detector._remember(key, None)
+
+    assert list(detector._memory_cache) == ["b", "c"]
@@ -0,0 +1,48 @@
+"""증분 임포트 - 전월 스냅샷에 이미 있던 입사일/퇴사일도 신고 대상에 포함"""
+import stat
+
+import pandas as pd
+import pytest
+
+from payroll_automation.config.schema import BusinessPayrollConfig, ExcelStructure
+from payroll_automation.incremental import SnapshotStore, run_incremental_import
+
+
+CONFIG = BusinessPayrollConfig(businessId="biz-test", businessName="테스트", excel=ExcelStructure())
+
+pytestmark = pytest.mark.skipif(not SnapshotStore().available, reason="pyarrow 필요")
+
+
+def _ledger(rows):
+    return pd.DataFrame(rows, columns=["name", "residentNo", "joinDate", "leaveDate", "wage"])
+
+
+def test_unchanged_leave_date_reaches_loss_report(tmp_path):
+    store = SnapshotStore(tmp_path)
+    # 2월 퇴사 예정자가 1월 원장에 이미 퇴사일과 함께 입력됨
+    ledger = _ledger([
+        ["박퇴사", "8001011234567", "2024-01-02", "2026-02-15", 2800000],
+        ["최재직", "8505052345678", "2025-03-01", "", 3000000],
+    ])
+    run_incremental_import(ledger, CONFIG, "2026-01", store=store)
+
+    result = run_incremental_import(ledger, CONFIG, "2026-02", store=store)
+
+    assert result.diff is not None and result.diff.unchanged_count == 2
+    assert [r.resident_no for r in result.loss.records] == ["8001011234567"]
+    assert result.acquisition.records == []
+
+
+def test_snapshot_round_trip(tmp_path):
+    store = SnapshotStore(tmp_path)
+    ledger = _ledger([["김신규", "9001011234567", "2026-01-05", "", 2500000]])
+
+    path = store.save(CONFIG.businessId, "2026-01", ledger)
+
+    assert path.suffix == ".arrow"
+    # 주민번호가 든 원장 전체 → 소유자 전용
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+    assert stat.S_IMODE(store.directory.stat().st_mode) == 0o700
+    pd.testing.assert_frame_equal(store.load(CONFIG.businessId, "2026-01"), ledger)
+    assert store.load(CONFIG.businessId, "2025-12") is None
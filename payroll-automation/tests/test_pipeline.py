@@ -0,0 +1,42 @@
+"""사업장 파일 탐색 - 같은 사업장/월 파일이 여러 개면 최신 1개만 작업으로"""
+import os
+
+from payroll_automation.config.schema import BusinessPayrollConfig, ExcelStructure
+from payroll_automation.pipeline import discover_jobs, find_business_files
+
+
+CONFIG = BusinessPayrollConfig(
+    businessId="biz-test", businessName="테스트", excel=ExcelStructure(filePattern="테스트점_*.xlsx"),
+)
+
+
+def _touch(path, mtime):
+    path.write_bytes(b"")
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_picks_newest_file_for_the_month(tmp_path):
+    _touch(tmp_path / "테스트점_202601.xlsx", 1_000)
+    newest = _touch(tmp_path / "테스트점_202601_수정.xlsx", 2_000)
+    _touch(tmp_path / "테스트점_202512.xlsx", 3_000)
+
+    assert find_business_files(CONFIG, tmp_path, "2026-01") == [newest]
+
+    jobs, skipped = discover_jobs([CONFIG], tmp_path, "2026-01")
+    assert [j.filepath for j in jobs] == [str(newest)] and skipped == []
+
+
+def test_single_file_of_another_month_is_not_used(tmp_path):
+    _touch(tmp_path / "테스트점_202512.xlsx", 1_000)
+
+    assert find_business_files(CONFIG, tmp_path, "2026-01") == []
+
+    jobs, skipped = discover_jobs([CONFIG], tmp_path, "2026-01")
+    assert jobs == [] and skipped[0].failure == "대상 파일 없음"
+
+
+def test_single_file_without_month_is_used(tmp_path):
+    only = _touch(tmp_path / "테스트점_급여.xlsx", 1_000)
+
+    assert find_business_files(CONFIG, tmp_path, "2026-01") == [only]
@@ -0,0 +1,61 @@
+"""근로자 레지스트리 - 같은 월 재임포트 시 취득신고 대상 유지"""
+import stat
+
+import pandas as pd
+
+from payroll_automation.config.schema import BusinessPayrollConfig, ExcelStructure
+from payroll_automation.registry import WorkerRegistry
+from payroll_automation.reports.acquisition import generate_acquisition_report
+
+
+CONFIG = BusinessPayrollConfig(businessId="biz-test", businessName="테스트", excel=ExcelStructure())
+
+
+def _ledger(rows):
+    return pd.DataFrame(rows, columns=["name", "residentNo", "joinDate", "leaveDate", "wage"])
+
+
+def _import(directory, ledger, year_month):
+    """cli.cmd_import --registry 순서: 레지스트리 열기 → 신고서 → 갱신/저장"""
+    registry = WorkerRegistry.open(directory)
+    report = generate_acquisition_report(ledger, CONFIG, year_month, registry=registry)
+    registry.update(CONFIG.businessId, ledger, year_month)
+    registry.save()
+    return sorted(r.resident_no for r in report.records)
+
+
+def test_reimport_same_month_keeps_acquisitions(tmp_path):
+    jan = _ledger([
+        ["김신규", "9001011234567", "2026-01-05", "", 2500000],
+        ["이기존", "8505052345678", "2025-03-01", "", 3000000],
+    ])
+
+    first = _import(tmp_path, jan, "2026-01")
+    second = _import(tmp_path, jan, "2026-01")
+
+    assert first == ["9001011234567"]
+    assert second == first
+
+
+def test_next_month_excludes_workers_registered_earlier(tmp_path):
+    jan = _ledger([["김신규", "9001011234567", "2026-01-05", "", 2500000]])
+    # 2월 원장에 1월 입사자 + 2월 입사자 (입사일이 잘못 2월로 적힌 기존 근로자 포함)
+    feb = _ledger([
+        ["김신규", "9001011234567", "2026-02-01", "", 2500000],
+        ["박이월", "9202021234567", "2026-02-10", "", 2400000],
+    ])
+
+    _import(tmp_path, jan, "2026-01")
+    assert _import(tmp_path, feb, "2026-02") == ["9202021234567"]
+    # 2월 재임포트도 같은 결과
+    assert _import(tmp_path, feb, "2026-02") == ["9202021234567"]
+
+
+def test_saved_files_are_owner_only(tmp_path):
+    reg = WorkerRegistry(tmp_path / "registry")
+    reg.update(CONFIG.businessId, _ledger([["김신규", "9001011234567", "2026-01-05", "", 1]]), "2026-01")
+    reg.save()
+
+    assert stat.S_IMODE(reg.directory.stat().st_mode) == 0o700
+    modes = {p.name: stat.S_IMODE(p.stat().st_mode) for p in reg.directory.iterdir()}
+    assert "key.npy" in modes and set(modes.values()) == {0o600}
@@ -0,0 +1,28 @@
+"""월별 시트 선택 - 키워드만 맞고 월을 알 수 없는 시트 제외"""
+import logging
+
+from payroll_automation.config.schema import BusinessPayrollConfig, ExcelStructure
+from payroll_automation.excel.sheets import select_sheets
+
+
+CONFIG = BusinessPayrollConfig(businessId="biz-test", businessName="테스트", excel=ExcelStructure())
+
+
+def test_skips_keyword_sheets_without_month(caplog):
+    names = ["2026년 1월 임금대장", "2026년 2월 임금대장", "임금대장(파트)", "요약"]
+
+    with caplog.at_level(logging.WARNING):
+        selected = select_sheets(names, CONFIG)
+
+    assert selected == ["2026년 1월 임금대장", "2026년 2월 임금대장"]
+    assert "임금대장(파트)" in caplog.text
+
+
+def test_month_without_year_is_kept():
+    assert select_sheets(["1월 급여대장", "2월 급여대장", "급여대장 양식"], CONFIG) == [
+        "1월 급여대장", "2월 급여대장",
+    ]
+
+
+def test_single_month_workbook_uses_first_match():
+    assert select_sheets(["임금대장", "임금대장(파트)"], CONFIG) == ["임금대장"]
@@ -0,0 +1,45 @@
+"""급여 이력 - 임금총액 필드 보완 + 소유자 전용 저장"""
+import stat
+
+import pandas as pd
+
+from payroll_automation.wage_history import WageHistoryStore
+
+
+def _wages(store, resident_no):
+    frame = store.to_frame("biz-test")
+    return frame.loc[frame["residentNo"] == resident_no, "totalWage"].tolist()
+
+
+def test_zero_total_wage_falls_back_to_wage(tmp_path):
+    # 매퍼는 빈 totalWage 칸을 0으로 파싱
+    ledger = pd.DataFrame({
+        "residentNo": ["9001011234567", "8505052345678", "7707071234567"],
+        "totalWage": [0, 3_200_000, 0],
+        "wage": [2_500_000, 3_000_000, 0],
+    })
+    store = WageHistoryStore(tmp_path)
+
+    assert store.record("biz-test", ledger, "2026-01") == 3
+    assert _wages(store, "9001011234567") == [2_500_000]
+    assert _wages(store, "8505052345678") == [3_200_000]
+    assert _wages(store, "7707071234567") == [0]
+
+
+def test_wage_only_ledger(tmp_path):
+    ledger = pd.DataFrame({"residentNo": ["9001011234567"], "wage": [2_500_000]})
+    store = WageHistoryStore(tmp_path)
+    store.record("biz-test", ledger, "2026-01")
+
+    assert _wages(store, "9001011234567") == [2_500_000]
+
+
+def test_saved_files_are_owner_only(tmp_path):
+    store = WageHistoryStore(tmp_path / "wage_history")
+    store.record("biz-test", pd.DataFrame({"residentNo": ["9001011234567"], "wage": [1]}), "2026-01")
+    store.save()
+
+    paths = [store.directory, store.directory / "2026"]
+    assert [stat.S_IMODE(p.stat().st_mode) for p in paths] == [0o700, 0o700]
+    files = [p for p in store.directory.rglob("*") if p.is_file()]
+    assert len(files) == 3 and {stat.S_IMODE(p.stat().st_mode) for p in files} == {0o600}
@@ -0,0 +1,23 @@
+"""검증 결과 - 이전 API(ValidationResult(issues=[...])) 호환"""
+from payroll_automation.validators.wage_validator import ValidationIssue, ValidationResult
+
+
+ISSUES = [
+    ValidationIssue(row=0, field="residentNo", level="error", message="주민번호 자릿수 오류"),
+    ValidationIssue(row=2, field="wage", level="warning", message="급여 0원"),
+]
+
+
+def test_issues_keyword_matches_from_issues():
+    legacy = ValidationResult(total_rows=3, valid_rows=2, issues=ISSUES)
+    built = ValidationResult.from_issues(3, 2, ISSUES)
+
+    assert legacy.issues == built.issues == ISSUES
+    assert (legacy.error_count, legacy.warning_count, legacy.is_valid) == (1, 1, False)
+    assert ValidationResult(3, 2, ISSUES).issues == ISSUES
+
+
+def test_empty_result():
+    result = ValidationResult(total_rows=5, valid_rows=5)
+
+    assert result.issues == [] and result.is_valid and len(result) == 0
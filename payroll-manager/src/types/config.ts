@@ -68,6 +68,9 @@ export interface BusinessPayrollConfig {
     workHours?: number;         // 기본 주소정근로시간
     nationality?: string;       // 기본 국적코드
   };
+
+  // 추가 검증 규칙 ID (payroll-automation 검증기, 예: "minimum_wage")
+  validationRules?: string[];
 }
 
 // ─── 기본값 (새 config 생성 시) ───